@@ -0,0 +1,187 @@
+"""
+Menjalankan operasi kalkulator matriks tanpa GUI (untuk CI / server).
+
+Contoh:
+    python batch_runner.py user_tests.json -o hasil.jsonl --workers 4
+    python batch_runner.py data/ --operation "Determinan A" --no-steps
+
+File job (.json) berisi satu job, daftar job, atau {"matrices": ..., "jobs": [...]}.
+Setiap job: {"operation": <nama di op_combo>, "A": ..., "B": ...}, dengan A/B
+berupa teks (seperti kotak input), list bersarang, atau nama matriks.
+Untuk "Ekspresi Matriks", A berisi teks ekspresi atas matriks bernama.
+File matriks lain (.txt/.csv/.coo) dijalankan dengan --operation memakai
+matriks A dan B di dalamnya. Hasil ditulis sebagai JSONL, satu baris per job.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+from file_utils import import_matrix
+from operations import OPERATIONS, TEXT_OPERATIONS, run_operation, parse_input
+
+
+# ====================================================
+# MEMBACA JOB
+# ====================================================
+def _resolve(value, matrices):
+    """Ubah nilai A/B di job menjadi array (nama matriks, teks, atau list)."""
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    if isinstance(value, str):
+        if value.strip() in matrices:
+            return matrices[value.strip()]
+        return parse_input(value)
+    return np.array(value, dtype=float)
+
+def _jobs_from_json(path):
+    """
+    Job dari satu file .json. Matriks bernama milik file ikut di job
+    (biasanya kecil); matriks bersama dari --matrices tidak, karena sudah
+    ada di worker lewat initializer.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    if isinstance(payload, dict) and "jobs" in payload:
+        local = {name: np.array(mat, dtype=float)
+                 for name, mat in payload.get("matrices", {}).items()}
+        jobs = payload["jobs"]
+    else:
+        local = {}
+        jobs = payload if isinstance(payload, list) else [payload]
+    for i, job in enumerate(jobs):
+        yield {"id": f"{os.path.basename(path)}#{i}", "operation": job.get("operation"),
+               "A": job.get("A"), "B": job.get("B"), "matrices": local}
+
+def _load_matrix_file(path):
+    """Matriks A dan B dari file matriks (dibaca di worker, bukan di proses utama)."""
+    mats = import_matrix(path)
+    names = list(mats)
+    a = mats.get("A", mats[names[0]] if names else None)
+    b = mats.get("B", mats[names[1]] if len(names) > 1 else None)
+    return a, b
+
+def iter_files(paths):
+    """Menghasilkan path file input; isi direktori dibuka satu tingkat."""
+    for path in paths:
+        if os.path.isdir(path):
+            children = [os.path.join(path, n) for n in sorted(os.listdir(path))]
+            yield from (c for c in children if os.path.isfile(c))
+        else:
+            yield path
+
+def iter_jobs(paths, operation=None):
+    """
+    Menghasilkan job dari file / direktori secara berurutan. File matriks
+    menjadi satu job berisi path-nya saja; tanpa --operation, file selain
+    .json dicatat sebagai job gagal.
+    """
+    for path in iter_files(paths):
+        if path.lower().endswith(".json") and operation is None:
+            yield from _jobs_from_json(path)
+        elif operation is not None:
+            yield {"id": os.path.basename(path), "operation": operation, "path": path}
+        else:
+            yield {"id": os.path.basename(path), "operation": None,
+                   "error": "Bukan file job .json; gunakan --operation untuk file matriks."}
+
+
+# ====================================================
+# EKSEKUSI (di proses worker)
+# ====================================================
+# Matriks bernama (--matrices) & opsi dikirim sekali per worker lewat
+# initializer, sehingga tiap tugas cukup membawa job-nya sendiri.
+_worker_state = {"matrices": {}, "with_steps": True}
+
+def _init_worker(matrices, with_steps):
+    _worker_state.update(matrices=matrices, with_steps=with_steps)
+
+def run_job(job, with_steps=None):
+    """Jalankan satu job; error dicatat di hasil, tidak menghentikan batch."""
+    t0 = time.perf_counter()
+    record = {"id": job["id"], "operation": job["operation"]}
+    if with_steps is None:
+        with_steps = _worker_state["with_steps"]
+    matrices = _worker_state["matrices"]
+    if job.get("matrices"):
+        matrices = {**matrices, **job["matrices"]}
+    try:
+        if "error" in job:
+            raise ValueError(job["error"])
+        if job["operation"] not in OPERATIONS:
+            raise ValueError(f"Operasi tidak dikenal: {job['operation']}")
+        if "path" in job:
+            A, B = _load_matrix_file(job["path"])
+        elif job["operation"] in TEXT_OPERATIONS:
+            A, B = job["A"], None
+        else:
+            A = _resolve(job["A"], matrices)
+            B = _resolve(job["B"], matrices)
+        record["output"] = list(run_operation(job["operation"], A, B, with_steps=with_steps,
+                                              matrices=matrices))
+        record["ok"] = True
+    except Exception as e:
+        record["ok"] = False
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["elapsed"] = time.perf_counter() - t0
+    return record
+
+def run_batch(jobs, out, workers=None, chunksize=1, with_steps=True, matrices=None):
+    """
+    Sebar job (satu tugas per job) ke multiprocessing.Pool dan tulis tiap hasil
+    ke stream `out` sebagai JSONL begitu job itu selesai (urutan mengikuti
+    selesainya worker; pakai field "id" untuk mencocokkan). workers=0
+    menjalankan semuanya di proses ini. Mengembalikan (jumlah job, jumlah gagal).
+    """
+    initargs = (matrices or {}, with_steps)
+    if workers == 0:
+        _init_worker(*initargs)
+        return _write_results(map(run_job, jobs), out)
+    with Pool(workers, initializer=_init_worker, initargs=initargs) as pool:
+        return _write_results(pool.imap_unordered(run_job, jobs, chunksize), out)
+
+def _write_results(results, out):
+    total = failed = 0
+    for record in results:
+        total += 1
+        failed += not record["ok"]
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+        out.flush()
+    return total, failed
+
+
+# ====================================================
+# CLI
+# ====================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch runner kalkulator matriks (tanpa GUI).")
+    parser.add_argument("paths", nargs="+", help="file job .json, file matriks, atau direktori")
+    parser.add_argument("-o", "--output", default="-", help="file JSONL hasil (default: stdout)")
+    parser.add_argument("--operation", choices=OPERATIONS,
+                        help="operasi untuk file matriks (wajib jika input bukan file job)")
+    parser.add_argument("--matrices", help="file matriks bernama yang bisa dirujuk job")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="jumlah proses (default: jumlah CPU, 0 = tanpa pool)")
+    parser.add_argument("--chunksize", type=int, default=1, help="job per kiriman ke worker")
+    parser.add_argument("--no-steps", action="store_true", help="jangan catat langkah OBE")
+    args = parser.parse_args(argv)
+
+    matrices = import_matrix(args.matrices) if args.matrices else {}
+    jobs = iter_jobs(args.paths, args.operation)
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        total, failed = run_batch(jobs, out, args.workers, args.chunksize,
+                                  not args.no_steps, matrices)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"{total} job selesai, {failed} gagal.", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
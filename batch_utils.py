@@ -0,0 +1,74 @@
+import numpy as np
+from file_utils import import_matrix
+
+# =======================================
+# Operasi matriks bertumpuk (k, n, n)
+# =======================================
+def _as_stack(As):
+    S = np.array(As, dtype=float)
+    if S.ndim == 2:
+        S = S[None]
+    if S.ndim != 3:
+        raise ValueError("Input batch harus berbentuk (k, n, m).")
+    return S
+
+def batch_det(As):
+    """Determinan setiap matriks dalam tumpukan (k, n, n)."""
+    return np.linalg.det(_as_stack(As))
+
+def batch_inverse(As):
+    """
+    Invers setiap matriks dalam tumpukan.
+    Mengembalikan (hasil, singular) — anggota singular berisi NaN dan
+    ditandai pada mask, tanpa menggagalkan seluruh batch. Aturan singular sama
+    dengan matrix_utils.inverse (lihat near_singular): LinAlgError, hasil tidak
+    berhingga, atau cond₁ = ‖A‖₁·‖A⁻¹‖₁ melebihi 1/(n·eps) — tidak bergantung
+    pada skala matriks seperti cek |det|.
+    """
+    S = _as_stack(As)
+    singular = np.zeros(S.shape[0], dtype=bool)
+    out = np.full(S.shape, np.nan)
+    try:
+        out[:] = np.linalg.inv(S)
+    except np.linalg.LinAlgError:
+        # ada anggota yang singular tepat: ulangi per item
+        for i in range(S.shape[0]):
+            try:
+                out[i] = np.linalg.inv(S[i])
+            except np.linalg.LinAlgError:
+                singular[i] = True
+    n = max(S.shape[-1], 1)
+    with np.errstate(over="ignore", invalid="ignore"):
+        cond = np.abs(S).sum(axis=-2).max(axis=-1, initial=0.0) * \
+               np.abs(out).sum(axis=-2).max(axis=-1, initial=0.0)
+    singular |= ~np.isfinite(out).all(axis=(-2, -1)) | (cond * n * np.finfo(float).eps >= 1.0)
+    out[singular] = np.nan
+    return out, singular
+
+def batch_transpose(As):
+    """Transpose setiap matriks dalam tumpukan."""
+    return np.swapaxes(_as_stack(As), -1, -2)
+
+def batch_rank(As):
+    """Rank setiap matriks dalam tumpukan."""
+    return np.linalg.matrix_rank(_as_stack(As))
+
+# =======================================
+# Memuat tumpukan dari file
+# =======================================
+def stack_matrices(matrices, names=None):
+    """Menumpuk matriks bernama (dict) yang ukurannya sama menjadi (k, n, m)."""
+    names = list(matrices) if names is None else list(names)
+    if not names:
+        raise ValueError("Tidak ada matriks untuk ditumpuk.")
+    shapes = {name: np.shape(matrices[name]) for name in names}
+    if len(set(shapes.values())) > 1:
+        raise ValueError(f"Ukuran matriks tidak sama: {shapes}")
+    S = np.empty((len(names),) + shapes[names[0]])
+    for i, name in enumerate(names):
+        S[i] = matrices[name]
+    return names, S
+
+def load_stack(filename, names=None):
+    """Membaca file matriks (txt/json/csv) langsung menjadi (names, tumpukan)."""
+    return stack_matrices(import_matrix(filename), names)
@@ -0,0 +1,72 @@
+"""
+Benchmark mode eksak: Bareiss (bilangan bulat) vs Gauss-Jordan biasa
+yang dijalankan di atas objek fractions.Fraction.
+
+    python benchmarks/bench_exact.py --sizes 5 10 20 40 --repeat 3
+"""
+import argparse
+import os
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from matrix_utils import rref_with_steps  # noqa: E402
+
+
+def rref_fraction(A):
+    """Algoritma float rref_with_steps, tetapi setiap elemen berupa Fraction."""
+    M = np.array([[Fraction(int(x)) for x in row] for row in A], dtype=object)
+    n_rows, n_cols = M.shape
+    pivot_row = 0
+    for pivot_col in range(n_cols):
+        nz = [r for r in range(pivot_row, n_rows) if M[r, pivot_col] != 0]
+        if not nz:
+            continue
+        r = nz[0]
+        if r != pivot_row:
+            M[[pivot_row, r]] = M[[r, pivot_row]]
+        M[pivot_row] = M[pivot_row] / M[pivot_row, pivot_col]
+        for r in range(n_rows):
+            if r != pivot_row and M[r, pivot_col] != 0:
+                M[r] = M[r] - M[r, pivot_col] * M[pivot_row]
+        pivot_row += 1
+        if pivot_row == n_rows:
+            break
+    return M
+
+
+def _best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 10, 20, 40])
+    parser.add_argument("--low", type=int, default=-9)
+    parser.add_argument("--high", type=int, default=9)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'n':>5} {'bareiss (s)':>12} {'fraction (s)':>13} {'speedup':>8}")
+    for n in args.sizes:
+        A = rng.integers(args.low, args.high + 1, (n, n + 1))
+        t_exact, (R, _, _) = _best_of(
+            lambda: rref_with_steps(A, exact=True, with_steps=False), args.repeat)
+        t_frac, R_frac = _best_of(lambda: rref_fraction(A), args.repeat)
+        if not (R == R_frac).all():
+            raise SystemExit(f"Hasil berbeda untuk n={n}")
+        print(f"{n:>5} {t_exact:>12.4f} {t_frac:>13.4f} {t_frac / t_exact:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
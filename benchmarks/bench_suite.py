@@ -0,0 +1,211 @@
+"""
+Benchmark matrix_utils / file_utils dengan baseline regresi (tanpa Qt).
+
+    python benchmarks/bench_suite.py --profile quick --save baseline.json
+    python benchmarks/bench_suite.py --profile quick --compare baseline.json --threshold 0.25
+    python benchmarks/bench_suite.py --profile full --filter solve_obe
+
+Setiap kasus diukur waktu terbaik dari --repeat kali (perf_counter) dan memori
+puncak (tracemalloc, satu run terpisah agar tidak memperlambat pengukuran waktu).
+Dengan --compare, kasus yang lebih lambat / lebih boros memori dari baseline
+melebihi --threshold (relatif) dianggap regresi dan exit code = 1.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from matrix_utils import (  # noqa: E402
+    rref_with_steps, solve_obe, solve_homogeneous, inverse, factor_cache, inverse_updater,
+)
+from operations import analyze_matrix  # noqa: E402
+from file_utils import (  # noqa: E402
+    export_matrix_txt, export_matrix_csv, export_matrix_npz,
+    import_matrix_txt, import_matrix_csv, import_matrix_npz,
+)
+
+# Ukuran per profil. Mode langkah menyimpan O(n²) baris berukuran n,
+# jadi ukurannya dibatasi STEPS_MAX_N.
+PROFILES = {
+    "quick": {"sizes": [10, 50, 200], "densities": [1.0, 0.1], "deficits": [0, 2]},
+    "full": {"sizes": [10, 50, 200, 500, 1000, 2000], "densities": [1.0, 0.1, 0.01],
+             "deficits": [0, 2, 10]},
+}
+STEPS_MAX_N = 200
+FILE_MAX_N = 1000
+# Selisih waktu di bawah ini dianggap noise (tidak dihitung regresi)
+MIN_TIME_DELTA = 0.002
+
+
+# ====================================================
+# DATA UJI
+# ====================================================
+def make_matrix(n, density=1.0, deficit=0, seed=0):
+    """
+    Matriks n×n acak: density = fraksi elemen tak nol (diagonal selalu terisi),
+    deficit = jumlah baris terakhir yang diganti kombinasi linear baris lain.
+    """
+    rng = np.random.default_rng(seed)
+    A = rng.standard_normal((n, n))
+    if density < 1.0:
+        A *= rng.random((n, n)) < density
+        A[np.diag_indices(n)] = rng.standard_normal(n) + 4.0
+    deficit = min(deficit, n - 1)
+    if deficit:
+        coef = rng.standard_normal((deficit, n - deficit))
+        A[n - deficit:] = coef @ A[:n - deficit]
+    b = rng.standard_normal(n)
+    return A, b
+
+
+# ====================================================
+# KASUS
+# ====================================================
+def _clear_caches():
+    # Cache faktorisasi dan invers yang diingat membuat pengulangan berikutnya
+    # hanya lookup / koreksi rank-0
+    factor_cache.clear()
+    inverse_updater.clear()
+
+def _inverse_uncached(A):
+    _clear_caches()
+    return inverse(A)
+
+def _solve_uncached(A, b, steps):
+    _clear_caches()
+    return solve_obe(A, b, with_steps=steps)
+
+def _analyze_uncached(A):
+    _clear_caches()
+    return analyze_matrix(A)
+
+def iter_cases(profile):
+    """Menghasilkan (id, params, fungsi tanpa argumen)."""
+    cfg = PROFILES[profile]
+    for n in cfg["sizes"]:
+        for density in cfg["densities"]:
+            for deficit in cfg["deficits"]:
+                A, b = make_matrix(n, density, deficit)
+                tag = f"n={n},d={density},def={deficit}"
+                params = {"n": n, "density": density, "deficit": deficit}
+                for steps in (False, True):
+                    if steps and n > STEPS_MAX_N:
+                        continue
+                    p = dict(params, steps=steps)
+                    s = f"{tag},steps={int(steps)}"
+                    yield (f"rref_with_steps[{s}]", p,
+                           lambda A=A, b=b, steps=steps: rref_with_steps(A, b, with_steps=steps))
+                    yield (f"solve_obe[{s}]", p,
+                           lambda A=A, b=b, steps=steps: _solve_uncached(A, b, steps))
+                    yield (f"solve_homogeneous[{s}]", p,
+                           lambda A=A, steps=steps: solve_homogeneous(A, with_steps=steps))
+                if deficit == 0:
+                    yield f"inverse[{tag}]", params, lambda A=A: _inverse_uncached(A)
+                yield f"analyze_matrix[{tag}]", params, lambda A=A: _analyze_uncached(A)
+
+    # File dihapus setelah semua kasus import selesai diukur
+    with tempfile.TemporaryDirectory(prefix="bench_") as tmp:
+        for n in cfg["sizes"]:
+            if n > FILE_MAX_N:
+                continue
+            A, _ = make_matrix(n)
+            for ext, export, load in ((".txt", export_matrix_txt, import_matrix_txt),
+                                      (".csv", export_matrix_csv, import_matrix_csv),
+                                      (".npz", export_matrix_npz, import_matrix_npz)):
+                path = os.path.join(tmp, f"A{n}{ext}")
+                export(path, {"A": A})
+                yield f"import{ext}[n={n}]", {"n": n}, lambda path=path, load=load: load(path)
+
+
+# ====================================================
+# PENGUKURAN
+# ====================================================
+def measure(fn, repeat):
+    """(waktu terbaik dalam detik, memori puncak dalam byte)."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+def run_suite(profile, repeat=3, name_filter=None, log=None):
+    results = {}
+    for case_id, params, fn in iter_cases(profile):
+        if name_filter and name_filter not in case_id:
+            continue
+        t, peak = measure(fn, repeat)
+        results[case_id] = {"time": t, "peak_bytes": peak, "params": params}
+        if log is not None:
+            print(f"{case_id:<60} {t:>10.4f} s {peak / 2**20:>10.2f} MiB", file=log)
+    return results
+
+def compare(results, baseline, threshold):
+    """Daftar pesan regresi (kosong jika tidak ada)."""
+    problems = []
+    for case_id, cur in results.items():
+        base = baseline.get(case_id)
+        if base is None:
+            continue
+        if (cur["time"] > base["time"] * (1 + threshold)
+                and cur["time"] - base["time"] > MIN_TIME_DELTA):
+            problems.append(f"{case_id}: waktu {base['time']:.4f} → {cur['time']:.4f} s")
+        if cur["peak_bytes"] > base["peak_bytes"] * (1 + threshold) + 4096:
+            problems.append(f"{case_id}: memori {base['peak_bytes']} → {cur['peak_bytes']} byte")
+    return problems
+
+
+# ====================================================
+# CLI
+# ====================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--filter", help="hanya kasus yang id-nya memuat teks ini")
+    parser.add_argument("--save", help="simpan hasil sebagai baseline JSON")
+    parser.add_argument("--compare", help="baseline JSON untuk deteksi regresi")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="batas kenaikan relatif sebelum dianggap regresi (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.profile, args.repeat, args.filter, log=sys.stdout)
+
+    if args.save:
+        payload = {
+            "meta": {"profile": args.profile, "python": platform.python_version(),
+                     "numpy": np.__version__, "machine": platform.platform(),
+                     "time": time.strftime("%Y-%m-%d %H:%M:%S")},
+            "results": results,
+        }
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+        print(f"Baseline disimpan di {args.save}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        problems = compare(results, baseline, args.threshold)
+        for msg in problems:
+            print("REGRESI", msg)
+        if problems:
+            return 1
+        print("Tidak ada regresi.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
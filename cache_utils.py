@@ -0,0 +1,250 @@
+import hashlib
+import os
+import pickle
+import zlib
+from collections import OrderedDict
+import numpy as np
+
+# =======================================
+# Hash isi array
+# =======================================
+def content_hash(A):
+    """Hash isi array (dtype, shape, dan byte datanya)."""
+    A = np.ascontiguousarray(A)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{A.dtype.str}{A.shape}".encode())
+    h.update(A.data if A.size else b"")
+    return h.hexdigest()
+
+def fingerprint(A):
+    """
+    Sidik cepat array (dtype, shape, jumlah elemen, crc32 sampel), jauh lebih
+    murah dari content_hash. Bisa bentrok, jadi pemakai wajib mencocokkan
+    isi array yang tersimpan sebelum memakai hasilnya.
+    """
+    A = np.asarray(A)
+    step = max(1, A.size // 4096)
+    sample = np.ascontiguousarray(A.reshape(-1)[::step])
+    return (A.dtype.str, A.shape, float(A.sum()) if A.size else 0.0, zlib.crc32(sample.data))
+
+def input_hash(x):
+    """
+    Hash input operasi: array, objek dengan content_hash() (SparseMatrix),
+    teks, atau None ("-").
+    """
+    if x is None:
+        return "-"
+    if isinstance(x, str):
+        return hashlib.blake2b(x.encode("utf-8"), digest_size=16).hexdigest()
+    if hasattr(x, "content_hash"):
+        return x.content_hash()
+    return content_hash(np.asarray(x))
+
+def _nbytes(value):
+    """Perkiraan ukuran (byte) nilai yang disimpan di cache."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (tuple, list)):
+        return sum(_nbytes(v) for v in value)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)    # mis. OperationOutput / StepTrace
+    return 64
+
+def _freeze(value):
+    """Tandai array hasil cache sebagai read-only supaya tidak terubah pemanggil."""
+    if isinstance(value, np.ndarray):
+        value.setflags(write=False)
+    elif isinstance(value, (tuple, list)):
+        for v in value:
+            _freeze(v)
+    return value
+
+# =======================================
+# Cache LRU dibatasi jumlah byte
+# =======================================
+class LRUCache:
+    """Cache LRU dengan batas total byte serta penghitung hit/miss."""
+    def __init__(self, max_bytes=256 * 2**20):
+        self.max_bytes = max_bytes
+        self._data = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        if key in self._data:
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key][0]
+        self.misses += 1
+        return default
+
+    def put(self, key, value, nbytes=None):
+        nbytes = _nbytes(value) if nbytes is None else nbytes
+        if key in self._data:
+            self._bytes -= self._data.pop(key)[1]
+        if nbytes > self.max_bytes:
+            return  # terlalu besar untuk disimpan
+        self._data[key] = (value, nbytes)
+        self._bytes += nbytes
+        while self._bytes > self.max_bytes:
+            _, (_, old) = self._data.popitem(last=False)
+            self._bytes -= old
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        self._data.clear()
+        self._bytes = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses,
+                "entries": len(self._data), "bytes": self._bytes}
+
+# =======================================
+# Cache faktorisasi (LU / QR / SVD)
+# =======================================
+class FactorCache(LRUCache):
+    """
+    Menyimpan hasil faktorisasi per isi matriks, sehingga det, inverse,
+    rank, dan solve pada matriks yang sama cukup memfaktorkan sekali.
+    Key memakai fingerprint (murah); salinan matriks disimpan bersama hasilnya
+    dan dicocokkan utuh, sehingga jalur pertama hanya menambah O(n²).
+    """
+    _MISSING = object()
+
+    def factor(self, A, kind, compute):
+        A = np.asarray(A, dtype=float)
+        key = (fingerprint(A), kind)
+        entry = self.get(key, self._MISSING)
+        if entry is not self._MISSING and np.array_equal(entry[0], A):
+            return entry[1]
+        A = np.array(A)     # salinan milik cache; compute boleh menyimpannya
+        value = _freeze(compute(A))
+        self.put(key, (_freeze(A), value))
+        return value
+
+# =======================================
+# Cache hasil operasi (memori + disk)
+# =======================================
+class ResultCache(LRUCache):
+    """
+    Cache hasil operasi dengan key (operasi, hash A, hash B, opsi), sehingga
+    menjalankan ulang operasi pada input yang sama langsung mengembalikan
+    hasil dan langkahnya.
+    Tingkat pertama: LRU di memori (dibatasi max_bytes). Jika directory
+    diisi, hasil juga dipickle ke disk (dibatasi max_disk_bytes, file tertua
+    dibuang lebih dulu) sehingga tetap ada setelah aplikasi ditutup.
+    """
+    _MISSING = object()
+
+    def __init__(self, max_bytes=128 * 2**20, directory=None, max_disk_bytes=512 * 2**20):
+        super().__init__(max_bytes)
+        self.max_disk_bytes = max_disk_bytes
+        self.disk_hits = 0
+        self.directory = None
+        if directory is not None:
+            self.set_directory(directory)
+
+    def set_directory(self, directory):
+        """Aktifkan tingkat disk (None = hanya memori)."""
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+
+    @staticmethod
+    def make_key(op, A=None, B=None, **options):
+        return (op, input_hash(A), input_hash(B), tuple(sorted(options.items())))
+
+    def _path(self, key):
+        # Hash A dan B ada di nama file supaya invalidate() tidak perlu membuka file
+        digest = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.directory, f"{key[1]}_{key[2]}_{digest}.pkl")
+
+    # ---------- baca / tulis ----------
+    def get(self, key, default=None):
+        value = super().get(key, self._MISSING)
+        if value is not self._MISSING:
+            return value
+        if self.directory is None:
+            return default
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                stored_key, value = pickle.load(f)
+        except FileNotFoundError:
+            return default
+        except Exception:
+            # File rusak / dari versi lama: buang saja
+            self._remove(path)
+            return default
+        if stored_key != key:
+            return default
+        os.utime(path)      # tandai baru dipakai (urutan buang di disk)
+        self.misses -= 1
+        self.hits += 1
+        self.disk_hits += 1
+        super().put(key, value)
+        return value
+
+    def put(self, key, value, nbytes=None):
+        nbytes = _nbytes(value) if nbytes is None else nbytes
+        super().put(key, value, nbytes)
+        # Hasil yang terlalu besar untuk memori juga tidak disimpan ke disk
+        if self.directory is None or nbytes > min(self.max_bytes, self.max_disk_bytes):
+            return
+        path = self._path(key)
+        tmp = path + ".tmp"
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump((key, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            self._remove(tmp)       # hasil tetap ada di memori
+            return
+        self._trim_disk()
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _disk_files(self):
+        if self.directory is None:
+            return []
+        return [e for e in os.scandir(self.directory)
+                if e.is_file() and e.name.endswith(".pkl")]
+
+    def _trim_disk(self):
+        files = sorted(self._disk_files(), key=lambda e: e.stat().st_mtime)
+        total = sum(e.stat().st_size for e in files)
+        while files and total > self.max_disk_bytes:
+            e = files.pop(0)
+            total -= e.stat().st_size
+            self._remove(e.path)
+
+    # ---------- invalidasi ----------
+    def invalidate(self, h):
+        """Buang semua hasil (memori dan disk) yang inputnya ber-hash h."""
+        if not h:
+            return
+        for k in [k for k in self._data if h in (k[1], k[2])]:
+            self._bytes -= self._data.pop(k)[1]
+        for e in self._disk_files():
+            if h in e.name.split("_")[:2]:
+                self._remove(e.path)
+
+    def clear(self):
+        super().clear()
+        for e in self._disk_files():
+            self._remove(e.path)
+
+    def stats(self):
+        return dict(super().stats(), disk_hits=self.disk_hits,
+                    disk_files=len(self._disk_files()))
@@ -0,0 +1,104 @@
+from fractions import Fraction
+from math import lcm
+import numpy as np
+
+# Batas aman int64: hasil p·a - q·b harus tetap < 2**63
+_INT64_SAFE = 2**31 - 1
+
+# =======================================
+# Konversi ke baris bilangan bulat
+# =======================================
+def to_fraction(x):
+    """Ubah angka (int, float, Fraction, str) menjadi Fraction tanpa noise biner."""
+    if isinstance(x, (Fraction, int, np.integer)):
+        return Fraction(int(x)) if not isinstance(x, Fraction) else x
+    if isinstance(x, str):
+        return Fraction(x)
+    return Fraction(repr(float(x)))
+
+def to_integer_rows(A):
+    """
+    Skala setiap baris dengan KPK penyebutnya sehingga semua elemen bulat.
+    Mengembalikan (M, scales): M int64 jika muat, selain itu dtype object
+    (int Python), dan scales = faktor pengali tiap baris.
+    """
+    F = np.array(A, dtype=object)
+    if F.ndim == 1:
+        F = F.reshape(-1, 1)
+    F = np.vectorize(to_fraction, otypes=[object])(F) if F.size else F
+    rows, scales = [], []
+    for row in F:
+        s = lcm(*(x.denominator for x in row)) if row.size else 1
+        rows.append([int(x * s) for x in row])
+        scales.append(s)
+    M = np.array(rows, dtype=object).reshape(F.shape)
+    if M.size == 0 or max(abs(int(x)) for x in M.flat) <= _INT64_SAFE:
+        M = M.astype(np.int64)
+    return M, scales
+
+def _promote_if_needed(M):
+    """Naikkan int64 → int Python sebelum perkalian bisa overflow."""
+    if M.dtype != object and M.size and int(np.abs(M).max()) > _INT64_SAFE:
+        return M.astype(object)
+    return M
+
+# =======================================
+# Eliminasi Gauss-Jordan bebas pecahan (Bareiss)
+# =======================================
+def bareiss_rref(M, n_vars, steps=None, progress=None):
+    """
+    Gauss-Jordan bebas pecahan pada matriks bulat M (in-place bila memungkinkan).
+    Setiap update: B_i = (p·B_i - a_ic·B_p) / p_prev, pembagian selalu eksak.
+    steps (opsional) menerima record("swap"/"ffelim", ...);
+    progress(k, n, steps) (opsional) dipanggil sebelum setiap kolom pivot.
+    Mengembalikan (M, pivots, sign) dengan sign = tanda permutasi baris.
+    """
+    n_rows = M.shape[0]
+    pivots = []
+    prev = 1
+    sign = 1
+    pivot_row = 0
+    recording = steps is not None and steps.recording
+
+    for pivot_col in range(n_vars):
+        if pivot_row == n_rows:
+            break
+        if progress is not None:
+            progress(pivot_col, n_vars, steps)
+        nz = np.flatnonzero(M[pivot_row:, pivot_col] != 0)
+        if nz.size == 0:
+            continue
+        r = pivot_row + int(nz[0])
+        if r != pivot_row:
+            M[[pivot_row, r]] = M[[r, pivot_row]]
+            sign = -sign
+            if recording:
+                steps.record("swap", (pivot_row, r))
+
+        M = _promote_if_needed(M)
+        p = M[pivot_row, pivot_col]
+        others = np.array([i for i in range(n_rows) if i != pivot_row], dtype=np.int64)
+        if others.size:
+            a = M[others, pivot_col]
+            M[others] = (p * M[others] - np.outer(a, M[pivot_row])) // prev
+            if recording:
+                for i, ai in zip(others, a):
+                    if ai != 0 or p != prev:
+                        steps.record("ffelim", (int(i), pivot_row), (int(p), int(ai), int(prev)), M[i])
+        prev = p
+        pivots.append(pivot_col)
+        pivot_row += 1
+
+    return M, pivots, sign
+
+def normalize_pivots(M, pivots, steps=None):
+    """Bagi setiap baris pivot dengan pivotnya → RREF dengan Fraction tereduksi."""
+    R = M.astype(object)
+    for i, c in enumerate(pivots):
+        p = R[i, c]
+        R[i] = [Fraction(int(x), int(p)) for x in R[i]]
+        if steps is not None:
+            steps.record("scale", (i,), Fraction(int(p)), R[i])
+    for i in range(len(pivots), R.shape[0]):
+        R[i] = [Fraction(int(x)) for x in R[i]]
+    return R
@@ -0,0 +1,326 @@
+"""
+Evaluator ekspresi matriks di atas matriks bernama (workspace).
+
+    X = inv(A) @ B
+    Y = X + Aᵗ @ B
+
+Ekspresi diparse menjadi DAG: sub-ekspresi yang sama hanya menjadi satu node
+(CSE), inv(X) @ Y ditulis ulang menjadi solve(X, Y), dan hanya node yang
+dibutuhkan output yang diminta yang dihitung.
+"""
+import re
+
+import numpy as np
+
+from matrix_utils import inverse, det, solve_square
+
+# =======================================
+# Tokenizer
+# =======================================
+_TOKEN = re.compile(r"""
+    (?P<num>\d+\.\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?|\d+(?:[eE][-+]?\d+)?)
+  | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<op>⁻¹|ᵗ|[-+@*×(),;='\n])
+  | (?P<space>[ \t\r]+)
+""", re.VERBOSE)
+
+def tokenize(text):
+    tokens, pos = [], 0
+    while pos < len(text):
+        m = _TOKEN.match(text, pos)
+        if m is None:
+            raise ValueError(f"Ekspresi tidak valid di posisi {pos + 1}: '{text[pos]}'")
+        pos = m.end()
+        kind = m.lastgroup
+        if kind == "space":
+            continue
+        value = m.group()
+        if kind == "op" and value == "\n":
+            value = ";"
+        tokens.append((kind, value))
+    return tokens
+
+# =======================================
+# DAG
+# =======================================
+# Fungsi yang dikenali: nama → (op node, jumlah argumen)
+FUNCTIONS = {
+    "inv": ("inv", 1), "T": ("T", 1), "transpose": ("T", 1),
+    "det": ("det", 1), "solve": ("solve", 2),
+}
+_SCALAR_OPS = {"const", "det"}
+
+
+class ExpressionGraph:
+    """
+    DAG ekspresi dengan hash-consing: node (op, argumen, nilai) yang sama
+    selalu mendapat id yang sama, sehingga sub-ekspresi bersama dihitung sekali.
+    """
+    def __init__(self):
+        self.nodes = []         # (op, args, value)
+        self._ids = {}
+        self.outputs = {}       # nama output → id node
+        self.rewrites = 0
+
+    # ---------- konstruksi ----------
+    def _node(self, op, args=(), value=None):
+        key = (op, tuple(args), value)
+        if key not in self._ids:
+            self._ids[key] = len(self.nodes)
+            self.nodes.append(key)
+        return self._ids[key]
+
+    def is_scalar(self, i):
+        op, args, _ = self.nodes[i]
+        if op in _SCALAR_OPS:
+            return True
+        if op in ("add", "sub", "scale"):
+            return all(self.is_scalar(a) for a in args)
+        if op == "neg":
+            return self.is_scalar(args[0])
+        return False
+
+    def make(self, op, *args, value=None):
+        """Buat node dengan penyederhanaan / penulisan ulang lokal."""
+        nodes = self.nodes
+        if op in ("T", "inv", "neg") and nodes[args[0]][0] == op:
+            # (Xᵗ)ᵗ = X, inv(inv(X)) = X, -(-X) = X
+            self.rewrites += 1
+            return nodes[args[0]][1][0]
+        if op == "matmul":
+            a, b = args
+            if self.is_scalar(a) or self.is_scalar(b):
+                return self.make("scale", *args)
+            if nodes[a][0] == "inv":
+                # inv(X) @ Y → solve(X, Y): satu substitusi, tanpa membentuk invers
+                self.rewrites += 1
+                return self._node("solve", (nodes[a][1][0], b))
+        if op in ("add", "scale"):
+            args = tuple(sorted(args))      # komutatif: A+B dan B+A satu node
+        return self._node(op, args, value)
+
+    # ---------- evaluasi ----------
+    def evaluate(self, matrices, outputs=None):
+        """
+        Hitung output yang diminta (default: semua). Hanya node yang dibutuhkan
+        yang dihitung; matriks workspace dibaca saat pertama kali dipakai.
+        """
+        names = list(self.outputs) if outputs is None else list(outputs)
+        memo = {}
+        result = {}
+        for name in names:
+            if name not in self.outputs:
+                raise ValueError(f"Output '{name}' tidak didefinisikan.")
+            result[name] = self._eval(self.outputs[name], matrices, memo)
+        return result
+
+    def _eval(self, i, matrices, memo):
+        if i in memo:
+            return memo[i]
+        op, args, value = self.nodes[i]
+        vals = [self._eval(a, matrices, memo) for a in args]
+        try:
+            memo[i] = self._apply(op, vals, value, matrices)
+        except ValueError as e:
+            raise ValueError(f"{self.describe_node(i)}: {e}") from None
+        return memo[i]
+
+    @staticmethod
+    def _apply(op, vals, value, matrices):
+        if op == "const":
+            return value
+        if op == "var":
+            if value not in matrices:
+                raise ValueError(f"Matriks '{value}' tidak ditemukan.")
+            return np.asarray(matrices[value], dtype=float)
+        if op in ("add", "sub"):
+            a, b = vals
+            if np.ndim(a) and np.ndim(b) and np.shape(a) != np.shape(b):
+                raise ValueError(f"Ukuran tidak sama: {np.shape(a)} dan {np.shape(b)}.")
+            return a + b if op == "add" else a - b
+        if op == "neg":
+            return -vals[0]
+        if op == "scale":
+            return vals[0] * vals[1]
+        if op == "matmul":
+            a, b = vals
+            if a.shape[-1] != b.shape[0]:
+                raise ValueError(f"Dimensi tidak cocok untuk perkalian: {a.shape} @ {b.shape}.")
+            return a @ b
+        if op == "T":
+            return np.asarray(vals[0]).T
+        if op == "inv":
+            return inverse(vals[0])
+        if op == "det":
+            return det(vals[0])
+        if op == "solve":
+            a, b = vals
+            if np.ndim(a) != 2 or a.shape[0] != a.shape[1]:
+                raise ValueError("solve() hanya untuk matriks persegi.")
+            if np.ndim(b) == 0 or np.shape(b)[0] != a.shape[0]:
+                raise ValueError(f"Dimensi tidak cocok untuk solve: {a.shape} dan {np.shape(b)}.")
+            x = solve_square(a, b)
+            if x is None:
+                raise ValueError("Matriks singular — sistem tidak punya solusi unik.")
+            return x
+        raise ValueError(f"Operasi tidak dikenal: {op}")
+
+    # ---------- tampilan rencana ----------
+    def _label(self, i):
+        op, _, value = self.nodes[i]
+        if op == "var":
+            return value
+        if op == "const":
+            return repr(value)
+        return f"t{i}"
+
+    def describe_node(self, i):
+        op, args, _ = self.nodes[i]
+        a = [self._label(x) for x in args]
+        symbols = {"add": "+", "sub": "-", "matmul": "@", "scale": "*"}
+        if op in symbols:
+            return f"{a[0]} {symbols[op]} {a[1]}"
+        if op == "neg":
+            return f"-{a[0]}"
+        if op == "T":
+            return f"{a[0]}ᵗ"
+        if op in ("var", "const"):
+            return self._label(i)
+        return f"{op}({', '.join(a)})"
+
+    def plan(self, outputs=None):
+        """Langkah yang akan dihitung (urut topologis) untuk output yang diminta."""
+        names = list(self.outputs) if outputs is None else list(outputs)
+        seen, order = set(), []
+
+        def visit(i):
+            if i in seen:
+                return
+            seen.add(i)
+            for a in self.nodes[i][1]:
+                visit(a)
+            if self.nodes[i][0] not in ("var", "const"):
+                order.append(i)
+
+        for name in names:
+            visit(self.outputs[name])
+        lines = [f"t{i} = {self.describe_node(i)}" for i in order]
+        lines += [f"{name} = {self._label(self.outputs[name])}" for name in names]
+        return lines
+
+# =======================================
+# Parser (recursive descent)
+# =======================================
+class _Parser:
+    """
+    program   := statement (';' statement)*
+    statement := [NAME '='] expr
+    expr      := term (('+' | '-') term)*
+    term      := unary (('@' | '*' | '×') unary)*
+    unary     := '-' unary | postfix
+    postfix   := atom ('ᵗ' | "'" | '⁻¹')*
+    atom      := NUMBER | NAME | NAME '(' expr (',' expr)* ')' | '(' expr ')'
+    """
+    def __init__(self, tokens, graph):
+        self.tokens = tokens
+        self.pos = 0
+        self.g = graph
+        self.names = {}
+
+    def peek(self, offset=0):
+        i = self.pos + offset
+        return self.tokens[i] if i < len(self.tokens) else (None, None)
+
+    def take(self, value=None):
+        tok = self.peek()
+        if tok[0] is None or (value is not None and tok[1] != value):
+            want = f"'{value}'" if value else "token"
+            got = f"'{tok[1]}'" if tok[0] else "akhir ekspresi"
+            raise ValueError(f"Ekspresi tidak valid: {want} diharapkan, ditemukan {got}.")
+        self.pos += 1
+        return tok
+
+    def program(self):
+        count = 0
+        while self.peek()[0] is not None:
+            if self.peek()[1] == ";":
+                self.take()
+                continue
+            count += 1
+            if self.peek()[0] == "name" and self.peek(1)[1] == "=":
+                name = self.take()[1]
+                self.take("=")
+            else:
+                name = f"hasil{count}"
+            node = self.expr()
+            self.names[name] = node
+            self.g.outputs[name] = node
+            if self.peek()[0] is not None:
+                self.take(";")
+        if not self.g.outputs:
+            raise ValueError("Ekspresi kosong.")
+
+    def expr(self):
+        node = self.term()
+        while self.peek()[1] in ("+", "-"):
+            op = "add" if self.take()[1] == "+" else "sub"
+            node = self.g.make(op, node, self.term())
+        return node
+
+    def term(self):
+        node = self.unary()
+        while self.peek()[1] in ("@", "*", "×"):
+            self.take()
+            node = self.g.make("matmul", node, self.unary())
+        return node
+
+    def unary(self):
+        if self.peek()[1] == "-":
+            self.take()
+            return self.g.make("neg", self.unary())
+        return self.postfix()
+
+    def postfix(self):
+        node = self.atom()
+        while self.peek()[1] in ("ᵗ", "'", "⁻¹"):
+            node = self.g.make("inv" if self.take()[1] == "⁻¹" else "T", node)
+        return node
+
+    def atom(self):
+        kind, value = self.take()
+        if kind == "num":
+            return self.g.make("const", value=float(value))
+        if value == "(":
+            node = self.expr()
+            self.take(")")
+            return node
+        if kind != "name":
+            raise ValueError(f"Ekspresi tidak valid: '{value}' tidak terduga.")
+        if self.peek()[1] == "(":
+            if value not in FUNCTIONS:
+                raise ValueError(f"Fungsi tidak dikenal: {value}")
+            op, n_args = FUNCTIONS[value]
+            self.take("(")
+            args = [self.expr()]
+            while self.peek()[1] == ",":
+                self.take()
+                args.append(self.expr())
+            self.take(")")
+            if len(args) != n_args:
+                raise ValueError(f"{value}() butuh {n_args} argumen.")
+            return self.g.make(op, *args)
+        if value in self.names:
+            return self.names[value]
+        return self.g.make("var", value=value)
+
+
+def parse_expression(text):
+    """Parse teks ekspresi (satu atau beberapa pernyataan) menjadi ExpressionGraph."""
+    graph = ExpressionGraph()
+    _Parser(tokenize(text), graph).program()
+    return graph
+
+def evaluate_expression(text, matrices, outputs=None):
+    """Parse lalu hitung; mengembalikan (graph, {nama output: nilai})."""
+    graph = parse_expression(text)
+    return graph, graph.evaluate(matrices, outputs)
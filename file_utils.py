@@ -2,38 +2,144 @@ import numpy as np
 import json
 import csv
 import os
+import zipfile
+from sparse_utils import SparseMatrix
+from format_utils import format_matrix, EXPORT_PRECISION
+
+def _dense(mat):
+    """SparseMatrix dipadatkan dulu untuk format padat (txt, json, csv, npz, npy)."""
+    if isinstance(mat, SparseMatrix):
+        return mat.to_dense()
+    return np.asarray(mat)
 
 def export_matrix_txt(filename, matrices):
     with open(filename, "w") as f:
         for name, mat in matrices.items():
             f.write(f"[{name}]\n")
-            np.savetxt(f, mat, fmt="%.6f")
+            mat = _dense(mat)
+            if mat.ndim == 1:
+                mat = mat.reshape(-1, 1)
+            f.write(format_matrix(mat, precision=EXPORT_PRECISION, detect_int=False) + "\n")
             f.write("\n")
 
+# Streaming parser untuk format blok "[name]" (txt & csv)
+class _RowBuffer:
+    """Array (rows, cols) yang dialokasikan di muka dan diperbesar saat penuh."""
+    def __init__(self, ncols, capacity=1024):
+        self.ncols = ncols
+        self.n = 0
+        self.data = np.empty((capacity, ncols))
+
+    def extend(self, rows):
+        need = self.n + rows.shape[0]
+        if need > self.data.shape[0]:
+            # ndarray.resize memakai realloc: tanpa salinan tambahan bila memungkinkan
+            self.data.resize((max(need, int(self.data.shape[0] * 1.5)), self.ncols), refcheck=False)
+        self.data[self.n:need] = rows
+        self.n = need
+
+    def result(self):
+        self.data.resize((self.n, self.ncols), refcheck=False)
+        return self.data
+
+def _parse_rows(lines, sep=None, name="", start=0):
+    """
+    Konversi banyak baris angka sekaligus (parser C numpy) menjadi array 2D.
+    Setiap baris harus punya jumlah kolom yang sama dengan baris pertama;
+    `start` = nomor baris pertama di dalam blok (untuk pesan error).
+    """
+    text = " ".join(lines)
+    if sep is not None:
+        text = text.replace(sep, " ")
+        counts = [sum(1 for t in ln.split(sep) if t.strip()) for ln in lines]
+    else:
+        counts = [len(ln.split()) for ln in lines]
+    ncols = counts[0]
+    for i, c in enumerate(counts):
+        if c != ncols:
+            raise ValueError(f"Baris {start + i + 1} matriks '{name}' berisi {c} kolom, "
+                             f"seharusnya {ncols}: {lines[i]!r}")
+    try:
+        flat = np.fromstring(text, dtype=float, sep=" ")
+    except ValueError:
+        flat = None
+    if flat is None or flat.size != ncols * len(lines):
+        raise ValueError(f"Baris matriks '{name}' tidak valid atau tidak sama panjang.")
+    return flat.reshape(len(lines), ncols)
+
+def parse_matrix_text(text, name="clipboard"):
+    """
+    Parse teks tabel (TSV dari spreadsheet, CSV, atau spasi) sekaligus
+    menjadi array 2D. Pemisah ditebak dari baris pertama.
+    """
+    lines = [ln for ln in text.splitlines() if ln.strip()]
+    if not lines:
+        raise ValueError("Teks matriks kosong.")
+    first = lines[0]
+    sep = "\t" if "\t" in first else ("," if "," in first else None)
+    return _parse_rows(lines, sep, name)
+
+def _iter_blocks(filename, sep=None, chunk_bytes=1 << 22):
+    """
+    Membaca file blok "[name]" baris demi baris dan menghasilkan (name, array).
+    Baris angka diparse per potongan ±chunk_bytes ke buffer yang sudah dialokasikan,
+    sehingga memori puncak kira-kira sebesar matriks terbesar.
+    """
+    name, buf, pending, pending_bytes = None, None, [], 0
+
+    def flush():
+        nonlocal buf, pending, pending_bytes
+        pending_bytes = 0
+        if pending:
+            rows = _parse_rows(pending, sep, name, buf.n if buf is not None else 0)
+            if buf is None:
+                buf = _RowBuffer(rows.shape[1], max(rows.shape[0], 1024))
+            elif rows.shape[1] != buf.ncols:
+                raise ValueError(f"Baris {buf.n + 1} matriks '{name}' berisi {rows.shape[1]} kolom, "
+                                 f"seharusnya {buf.ncols}: {pending[0]!r}")
+            buf.extend(rows)
+            pending = []
+
+    def finish():
+        flush()
+        return buf.result() if buf is not None else np.array([])
+
+    with open(filename, "r", newline="") as f:
+        for line in f:
+            text = line.strip()
+            if sep is not None and not text.strip(sep + " "):
+                text = ""
+            if not text:
+                if name is not None:
+                    yield name, finish()
+                    name, buf = None, None
+                continue
+            header = text.strip('"') if sep is not None else text
+            if header.startswith("[") and header.endswith("]"):
+                if name is not None:
+                    yield name, finish()
+                name, buf, pending, pending_bytes = header[1:-1], None, [], 0
+                continue
+            if name is None:
+                continue  # baris di luar blok bernama diabaikan
+            pending.append(text)
+            pending_bytes += len(text)
+            if pending_bytes >= chunk_bytes:
+                flush()
+        if name is not None:
+            yield name, finish()
+
+def iter_matrix_txt(filename, chunk_bytes=1 << 22):
+    """Generator (name, matriks) dari file txt, satu per satu."""
+    return _iter_blocks(filename, None, chunk_bytes)
+
 def import_matrix_txt(filename):
-    matrices = {}
-    with open(filename, "r") as f:
-        content = f.read()
-    blocks = content.split("\n\n")
-    for block in blocks:
-        block = block.strip()
-        if not block:
-            continue
-        lines = block.splitlines()
-        header = lines[0].strip()
-        if header.startswith("[") and header.endswith("]"):
-            name = header[1:-1]
-            data = []
-            for row in lines[1:]:
-                if row.strip():
-                    data.append([float(x) for x in row.split()])
-            matrices[name] = np.array(data)
-    return matrices
+    return dict(iter_matrix_txt(filename))
 
 def export_matrix_json(filename, matrices):
     payload = {}
     for name, mat in matrices.items():
-        payload[name] = np.array(mat).tolist()
+        payload[name] = _dense(mat).tolist()
     with open(filename, "w") as f:
         json.dump(payload, f, indent=2)
 
@@ -51,33 +157,153 @@ def export_matrix_csv(filename, matrices):
         writer = csv.writer(f)
         for name, mat in matrices.items():
             writer.writerow([f"[{name}]"])
-            for row in mat:
+            for row in _dense(mat):
                 writer.writerow(row)
             writer.writerow([])
 
+def iter_matrix_csv(filename, chunk_bytes=1 << 22):
+    """Generator (name, matriks) dari file csv, satu per satu."""
+    return _iter_blocks(filename, ",", chunk_bytes)
+
 def import_matrix_csv(filename):
+    return dict(iter_matrix_csv(filename))
+
+# Sparse (triplet) format: "[name] rows cols" lalu satu baris "i j nilai" per elemen tak nol
+def export_matrix_sparse(filename, matrices):
+    with open(filename, "w") as f:
+        for name, mat in matrices.items():
+            if not isinstance(mat, SparseMatrix):
+                mat = SparseMatrix.from_dense(mat)
+            rows, cols, vals = mat.to_coo()
+            f.write(f"[{name}] {mat.shape[0]} {mat.shape[1]}\n")
+            np.savetxt(f, np.column_stack([rows, cols, vals]), fmt=["%d", "%d", "%.17g"])
+            f.write("\n")
+
+def import_matrix_sparse(filename):
     matrices = {}
-    with open(filename, "r", newline='') as f:
-        reader = csv.reader(f)
-        current = None
-        rows = []
-        for row in reader:
-            if not row:
-                if current:
-                    matrices[current] = np.array(rows, dtype=float)
-                    current = None
-                    rows = []
-                continue
-            if len(row) == 1 and row[0].startswith("[") and row[0].endswith("]"):
-                current = row[0][1:-1]
-                rows = []
-            else:
-                # numeric row
-                rows.append([float(x) for x in row])
-        if current:
-            matrices[current] = np.array(rows, dtype=float)
+    with open(filename, "r") as f:
+        content = f.read()
+    for block in content.split("\n\n"):
+        lines = block.strip().splitlines()
+        if not lines:
+            continue
+        header = lines[0].split()
+        if not (header[0].startswith("[") and header[0].endswith("]")):
+            continue
+        name, shape = header[0][1:-1], (int(header[1]), int(header[2]))
+        triplets = np.array(" ".join(lines[1:]).split(), dtype=float).reshape(-1, 3)
+        matrices[name] = SparseMatrix.from_coo(triplets[:, 0].astype(np.int64),
+                                               triplets[:, 1].astype(np.int64),
+                                               triplets[:, 2], shape)
+    return matrices
+
+# Format biner: .npz tanpa kompresi, atau direktori berisi satu .npy per matriks.
+# mmap_mode ("r", "r+", "c") membuka data langsung dari disk tanpa membaca semuanya.
+def export_matrix_npz(filename, matrices):
+    np.savez(filename, **{name: _dense(mat) for name, mat in matrices.items()})
+
+def _npz_member_memmap(filename, info, mmap_mode):
+    """Memmap satu anggota .npz yang tersimpan tanpa kompresi (ZIP_STORED)."""
+    with open(filename, "rb") as f:
+        f.seek(info.header_offset)
+        local = f.read(30)
+        name_len = int.from_bytes(local[26:28], "little")
+        extra_len = int.from_bytes(local[28:30], "little")
+        f.seek(info.header_offset + 30 + name_len + extra_len)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    if dtype.hasobject:
+        return None
+    return np.memmap(filename, dtype=dtype, mode=mmap_mode, offset=offset,
+                     shape=shape, order="F" if fortran else "C")
+
+def import_matrix_npz(filename, mmap_mode=None):
+    matrices = {}
+    with np.load(filename, allow_pickle=False) as z:
+        members = {os.path.splitext(info.filename)[0]: info for info in z.zip.infolist()}
+        for name in z.files:
+            arr = None
+            info = members.get(name)
+            if mmap_mode is not None and info is not None and info.compress_type == zipfile.ZIP_STORED:
+                arr = _npz_member_memmap(filename, info, mmap_mode)
+            matrices[name] = z[name] if arr is None else arr
+    return matrices
+
+def export_matrix_npy_dir(dirname, matrices):
+    os.makedirs(dirname, exist_ok=True)
+    for name, mat in matrices.items():
+        np.save(os.path.join(dirname, f"{name}.npy"), _dense(mat))
+
+def import_matrix_npy_dir(dirname, mmap_mode=None):
+    matrices = {}
+    for fn in sorted(os.listdir(dirname)):
+        if fn.endswith(".npy"):
+            matrices[fn[:-4]] = np.load(os.path.join(dirname, fn), mmap_mode=mmap_mode)
     return matrices
 
+def export_matrix_npy(filename, matrices):
+    """Satu matriks per file .npy (nama matriks diambil dari nama file saat import)."""
+    if len(matrices) != 1:
+        raise ValueError("Format .npy hanya memuat satu matriks; pilih .npz atau folder tanpa ekstensi.")
+    np.save(filename, _dense(next(iter(matrices.values()))))
+
+def import_matrix_npy(filename, mmap_mode=None):
+    name = os.path.splitext(os.path.basename(filename))[0]
+    return {name: np.load(filename, mmap_mode=mmap_mode)}
+
+_IMPORTERS = {
+    ".txt": import_matrix_txt,
+    ".json": import_matrix_json,
+    ".csv": import_matrix_csv,
+    ".coo": import_matrix_sparse,
+    ".npz": import_matrix_npz,
+    ".npy": import_matrix_npy,
+}
+
+_EXPORTERS = {
+    ".txt": export_matrix_txt,
+    ".json": export_matrix_json,
+    ".csv": export_matrix_csv,
+    ".coo": export_matrix_sparse,
+    ".npz": export_matrix_npz,
+    ".npy": export_matrix_npy,
+}
+
+# Format yang mendukung mmap_mode
+_BINARY = {".npz", ".npy"}
+
+# Filter untuk QFileDialog (Import/Export di GUI)
+FILE_FILTER = ("Semua format matriks (*.txt *.csv *.json *.coo *.npz *.npy);;"
+               "Teks (*.txt);;CSV (*.csv);;JSON (*.json);;Sparse (*.coo);;"
+               "Biner NumPy (*.npz *.npy)")
+
+def import_matrix(filename, mmap_mode=None):
+    """
+    Pilih importer berdasarkan ekstensi file (direktori = kumpulan .npy).
+    mmap_mode hanya berlaku untuk format biner.
+    """
+    if os.path.isdir(filename):
+        return import_matrix_npy_dir(filename, mmap_mode)
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in _IMPORTERS:
+        raise ValueError(f"Format file tidak dikenal: {ext or filename}")
+    if ext in _BINARY:
+        return _IMPORTERS[ext](filename, mmap_mode)
+    return _IMPORTERS[ext](filename)
+
+def export_matrix(filename, matrices):
+    """Pilih exporter berdasarkan ekstensi file (tanpa ekstensi = direktori .npy)."""
+    ext = os.path.splitext(filename)[1].lower()
+    if ext == "":
+        return export_matrix_npy_dir(filename, matrices)
+    if ext not in _EXPORTERS:
+        raise ValueError(f"Format file tidak dikenal: {ext}")
+    return _EXPORTERS[ext](filename, matrices)
+
 # Simple history persistence
 def save_history(history_list, filename="history.json"):
     with open(filename, "w") as f:
@@ -88,3 +314,67 @@ def load_history(filename="history.json"):
         return []
     with open(filename, "r") as f:
         return json.load(f)
+
+# =======================================
+# History JSONL (append-only, satu entri per baris)
+# =======================================
+def append_history_jsonl(entry, filename="history.jsonl"):
+    """Tambahkan satu entri di akhir file; mengembalikan offset byte barisnya."""
+    line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+    with open(filename, "ab") as f:
+        offset = f.seek(0, os.SEEK_END)
+        f.write(line)
+    return offset
+
+def index_history_jsonl(filename="history.jsonl"):
+    """Offset byte setiap baris entri (baris kosong / terpotong dilewati)."""
+    if not os.path.exists(filename):
+        return []
+    offsets = []
+    with open(filename, "rb") as f:
+        offset = 0
+        for line in f:
+            if line.strip() and line.endswith(b"\n"):
+                offsets.append(offset)
+            offset += len(line)
+    return offsets
+
+def repair_history_jsonl(filename="history.jsonl", block=4096):
+    """
+    Potong baris terakhir yang terpotong (tanpa newline, mis. karena crash saat
+    menulis) agar append berikutnya mulai di baris baru. Mengembalikan jumlah
+    byte yang dibuang.
+    """
+    if not os.path.exists(filename):
+        return 0
+    with open(filename, "r+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        end = size
+        while end > 0:
+            start = max(0, end - block)
+            f.seek(start)
+            pos = f.read(end - start).rfind(b"\n")
+            if pos >= 0:
+                end = start + pos + 1
+                break
+            end = start
+        if end < size:
+            f.truncate(end)
+    return size - end
+
+def read_history_jsonl(filename, offsets):
+    """Baca entri pada offset yang diberikan (urutan dipertahankan)."""
+    entries = []
+    with open(filename, "rb") as f:
+        for offset in offsets:
+            f.seek(offset)
+            entries.append(json.loads(f.readline()))
+    return entries
+
+def write_history_jsonl(entries, filename="history.jsonl"):
+    """Tulis ulang file JSONL secara atomik (untuk kompaksi / migrasi)."""
+    tmp = filename + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    os.replace(tmp, filename)
@@ -0,0 +1,94 @@
+import math
+from fractions import Fraction
+import numpy as np
+
+# =======================================
+# Pengaturan format (satu tempat)
+# =======================================
+PRECISION = 4            # digit desimal untuk tampilan
+EXPORT_PRECISION = 6     # digit desimal untuk export teks (.txt)
+INT_TOL = 1e-9           # |x - round(x)| di bawah ini dicetak sebagai bilangan bulat
+ELIDE_THRESHOLD = 1000   # jumlah elemen sebelum matriks diringkas (seperti numpy)
+EDGE_ITEMS = 3           # baris/kolom tepi yang tetap dicetak saat diringkas
+
+# =======================================
+# Format angka
+# =======================================
+def format_scalar(x, precision=PRECISION):
+    """Format satu angka: bulat tanpa desimal, selain itu `precision` digit."""
+    if isinstance(x, Fraction):
+        return str(x)
+    if math.isfinite(x) and abs(x - round(x)) < INT_TOL:
+        return str(int(round(x)))
+    return f"{x:.{precision}f}"
+
+def _row_formats(A, precision, detect_int):
+    """
+    Kode format dan nilai per elemen untuk array float 2D.
+    Elemen bulat (mask vektor) memakai "%.0f" dari nilai yang sudah dibulatkan
+    (+0.0 membuang -0), sisanya "%.{precision}f".
+    """
+    code = f"%.{precision}f"
+    if not detect_int:
+        return np.full(A.shape, code), A
+    with np.errstate(invalid="ignore"):
+        R = np.round(A)
+        is_int = np.abs(A - R) < INT_TOL
+    return np.where(is_int, "%.0f", code), np.where(is_int, R + 0.0, A)
+
+def _format_lines(A, sep, precision, detect_int, elide_col=None):
+    """Baris-baris teks untuk array 2D; elide_col = posisi kolom "…" (opsional)."""
+    if A.dtype == object:
+        rows = [[format_scalar(x, precision) for x in row] for row in A]
+        if elide_col is not None:
+            for row in rows:
+                row.insert(elide_col, "…")
+        return [sep.join(row) for row in rows]
+    A = A.astype(float, copy=False)
+    codes, values = _row_formats(A, precision, detect_int)
+    if elide_col is not None:
+        codes = np.insert(codes, elide_col, "…", axis=1)
+    # Satu operasi % per baris: perulangan per elemen terjadi di C
+    return [sep.join(c) % tuple(v) for c, v in zip(codes.tolist(), values.tolist())]
+
+# =======================================
+# Format matriks / baris
+# =======================================
+def _edge_index(n, edge):
+    """Indeks `edge` baris/kolom pertama dan terakhir."""
+    return np.r_[0:edge, n - edge:n]
+
+def format_matrix(M, sep=" ", precision=PRECISION, threshold=None,
+                  edgeitems=EDGE_ITEMS, detect_int=True):
+    """
+    String matriks, satu baris teks per baris matriks.
+    threshold=None mencetak semua elemen; jika diisi dan M.size melebihinya,
+    hanya `edgeitems` baris/kolom tepi yang diformat dan sisanya diganti
+    "…" (kolom) / "⋮" (baris).
+    """
+    A = np.asarray(M)
+    if A.ndim == 1:
+        A = A.reshape(1, -1)
+    r, c = A.shape
+    elide_r = elide_c = False
+    if threshold is not None and A.size > threshold:
+        elide_r, elide_c = r > 2 * edgeitems, c > 2 * edgeitems
+        if elide_r:
+            A = A[_edge_index(r, edgeitems)]
+        if elide_c:
+            A = A[:, _edge_index(c, edgeitems)]
+    lines = _format_lines(A, sep, precision, detect_int, edgeitems if elide_c else None)
+    if elide_r:
+        lines[edgeitems:edgeitems] = ["⋮"]
+    return "\n".join(lines)
+
+def format_row(r, sep=" | ", precision=PRECISION):
+    """Satu baris / vektor dalam satu baris teks."""
+    A = np.asarray(r)
+    return _format_lines(A.reshape(1, -1), sep, precision, True)[0] if A.size else ""
+
+def is_elided(M, threshold=ELIDE_THRESHOLD, edgeitems=EDGE_ITEMS):
+    """True jika format_matrix(M, threshold=...) akan meringkas M."""
+    shape = np.shape(M)
+    r, c = (1, shape[0]) if len(shape) == 1 else shape
+    return r * c > threshold and (r > 2 * edgeitems or c > 2 * edgeitems)
@@ -1,21 +1,118 @@
+import os
 import time
-from file_utils import save_history, load_history
+from file_utils import (
+    load_history, append_history_jsonl, index_history_jsonl,
+    read_history_jsonl, write_history_jsonl, repair_history_jsonl,
+)
 
 class History:
-    def __init__(self, filename="history.json"):
+    """
+    History append-only di file JSONL (satu entri per baris).
+    add() hanya menambah satu baris (O(1)); entri dibaca lewat index offset.
+    max_entries (opsional) membatasi jumlah entri: entri lama ditandai mati dan
+    file dipadatkan ulang setelah cukup banyak baris mati (kompaksi berkala).
+    Jika file JSONL belum ada, history.json lama dimigrasikan sekali.
+    """
+    def __init__(self, filename="history.jsonl", max_entries=None,
+                 legacy_filename="history.json", compact_min=200):
         self.filename = filename
-        self._list = load_history(self.filename)
+        self.max_entries = max_entries
+        self.compact_min = compact_min
+        self._listeners = []
+        if not os.path.exists(filename) and legacy_filename and os.path.exists(legacy_filename):
+            write_history_jsonl(load_history(legacy_filename), filename)
+        repair_history_jsonl(filename)      # baris terpotong dari crash sebelumnya
+        self._offsets = index_history_jsonl(filename)
+        self._dead = 0
+        self._apply_retention()
 
+    # ---------- notifikasi ----------
+    def subscribe(self, callback):
+        """
+        callback(event, index): "add" (index = index entri baru), "remove"
+        (index = jumlah entri tertua yang dibuang retensi) atau "reset".
+        """
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, event, index=None):
+        for cb in list(self._listeners):
+            cb(event, index)
+
+    # ---------- retensi & kompaksi ----------
+    def _apply_retention(self):
+        """
+        Buang entri tertua di atas max_entries (hanya ditandai mati) lalu
+        padatkan file bila baris mati sudah cukup banyak.
+        Mengembalikan (jumlah entri dibuang, True jika file dipadatkan).
+        Kompaksi mengubah offset semua entri sehingga pendengar perlu "reset";
+        pembuangan biasa cukup "remove".
+        """
+        drop = 0
+        if self.max_entries is not None and len(self._offsets) > self.max_entries:
+            drop = len(self._offsets) - self.max_entries
+            del self._offsets[:drop]
+            self._dead += drop
+        compacted = self._dead >= max(self.compact_min, len(self._offsets))
+        if compacted:
+            self.compact()
+        return drop, compacted
+
+    def compact(self):
+        """Tulis ulang file hanya dengan entri hidup."""
+        entries = read_history_jsonl(self.filename, self._offsets) if self._offsets else []
+        write_history_jsonl(entries, self.filename)
+        self._offsets = index_history_jsonl(self.filename)
+        self._dead = 0
+
+    # ---------- akses ----------
     def add(self, entry):
         # entry: dict with keys "time", "operation", "result"
         entry = dict(entry)
         entry.setdefault("time", time.strftime("%Y-%m-%d %H:%M:%S"))
-        self._list.append(entry)
-        save_history(self._list, self.filename)
+        self._offsets.append(append_history_jsonl(entry, self.filename))
+        self._notify("add", len(self._offsets) - 1)
+        drop, compacted = self._apply_retention()
+        if compacted:
+            self._notify("reset")
+        elif drop:
+            self._notify("remove", drop)
+
+    def get(self, i):
+        """Entri ke-i (0 = tertua) dibaca langsung dari disk."""
+        return read_history_jsonl(self.filename, [self._offsets[i]])[0]
+
+    def entry_id(self, i):
+        """
+        Id entri ke-i (offset byte di file): tetap sama walau entri lama
+        dibuang ("remove"); hanya berubah saat kompaksi (yang memicu "reset").
+        """
+        return self._offsets[i]
+
+    def slice(self, start, stop):
+        return read_history_jsonl(self.filename, self._offsets[start:stop])
+
+    def __len__(self):
+        return len(self._offsets)
 
     def all(self):
-        return list(self._list)
+        return self.slice(0, len(self._offsets))
 
     def clear(self):
-        self._list = []
-        save_history(self._list, self.filename)
+        write_history_jsonl([], self.filename)
+        self._offsets = []
+        self._dead = 0
+        self._notify("reset")
+
+
+_shared = None
+
+def get_history():
+    """Instance History bersama untuk semua window."""
+    global _shared
+    if _shared is None:
+        _shared = History()
+    return _shared
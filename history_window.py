@@ -1,25 +1,130 @@
 # Calculator-Matrix/history_window.py
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QListWidget, QPushButton,
-    QMessageBox, QHBoxLayout
+    QWidget, QVBoxLayout, QLabel, QListView, QPushButton,
+    QMessageBox, QHBoxLayout, QTextEdit, QSplitter
 )
-from history import History
-import json
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+from history import get_history
+from cache_utils import LRUCache
+from metrics_utils import summarize
+
+
+class HistoryModel(QAbstractListModel):
+    """
+    Model daftar history (terbaru di atas) yang membaca entri dari disk
+    hanya untuk baris yang ditampilkan. Baris ditambah bertahap lewat
+    canFetchMore/fetchMore saat daftar di-scroll.
+    """
+    BATCH = 200
+
+    def __init__(self, history, parent=None):
+        super().__init__(parent)
+        self.history = history
+        self._loaded = min(self.BATCH, len(history))
+        # Ringkasan baris yang sudah pernah dibaca (key = id entri, bukan index:
+        # index bergeser saat retensi membuang entri lama)
+        self._summaries = LRUCache(max_bytes=2 * 2**20)
+
+    # ---------- pemetaan baris ----------
+    def history_index(self, row):
+        """Baris 0 = entri terbaru."""
+        return len(self.history) - 1 - row
+
+    @staticmethod
+    def summary(it):
+        t = it.get("time", "")
+        op = it.get("operation", "")
+        status = it.get("status", "")
+        return f"{t} | {op} | status={status}"
+
+    # ---------- API model ----------
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return min(self._loaded, len(self.history))
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        i = self.history_index(index.row())
+        key = self.history.entry_id(i)
+        text = self._summaries.get(key)
+        if text is None:
+            text = self.summary(self.history.get(i))
+            self._summaries.put(key, text, nbytes=len(text))
+        return text
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self.history)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        start = self._loaded
+        end = min(start + self.BATCH, len(self.history))
+        if end <= start:
+            return
+        self.beginInsertRows(QModelIndex(), start, end - 1)
+        self._loaded = end
+        self.endInsertRows()
+
+    # ---------- sinkron dengan History ----------
+    def on_history_changed(self, event, index):
+        """
+        Entri baru muncul sebagai baris 0; entri tertua yang dibuang retensi
+        hilang dari bawah (hanya jika barisnya sudah dimuat); reset memuat
+        ulang dari awal.
+        """
+        if event == "add":
+            self.beginInsertRows(QModelIndex(), 0, 0)
+            self._loaded += 1
+            self.endInsertRows()
+        elif event == "remove":
+            total = len(self.history) + index        # jumlah baris sebelum dibuang
+            loaded = min(self._loaded, total)
+            first = total - index
+            if first < loaded:
+                self.beginRemoveRows(QModelIndex(), first, loaded - 1)
+                self._loaded = first
+                self.endRemoveRows()
+        else:
+            self.reset()
+
+    def reset(self):
+        self.beginResetModel()
+        self._loaded = min(self.BATCH, len(self.history))
+        self._summaries.clear()
+        self.endResetModel()
+
 
 class HistoryWindow(QWidget):
     def __init__(self, stacked=None, parent=None):
         super().__init__(parent)
         self.stacked = stacked
-        self.history = History()
+        self.history = get_history()
+        self.model = HistoryModel(self.history, self)
         self._build_ui()
+        # Ikut diperbarui saat window lain menyimpan ke history
+        self.history.subscribe(self._on_history_changed)
 
     def _build_ui(self):
         layout = QVBoxLayout()
         layout.addWidget(QLabel("<h2>History</h2>"))
 
-        # Daftar history
-        self.listw = QListWidget()
-        layout.addWidget(self.listw)
+        # Daftar history (model) + detail hasil entri terpilih
+        self.listw = QListView()
+        self.listw.setModel(self.model)
+        self.listw.setUniformItemSizes(True)
+        self.listw.selectionModel().currentChanged.connect(self.show_detail)
+        self.detail = QTextEdit()
+        self.detail.setReadOnly(True)
+        self.detail.setPlaceholderText("Pilih entri untuk melihat hasilnya.")
+        splitter = QSplitter(Qt.Orientation.Vertical)
+        splitter.addWidget(self.listw)
+        splitter.addWidget(self.detail)
+        layout.addWidget(splitter)
+        self.empty_label = QLabel("(no history)")
+        layout.addWidget(self.empty_label)
 
         # Tombol refresh dan clear
         btn_layout = QHBoxLayout()
@@ -42,18 +147,28 @@ class HistoryWindow(QWidget):
         self.load_history()
 
     def load_history(self):
-        """Menampilkan seluruh history"""
-        self.listw.clear()
-        items = self.history.all()
-        if not items:
-            self.listw.addItem("(no history)")
+        """Muat ulang daftar; hanya baris yang terlihat yang dibaca dari disk"""
+        self.model.reset()
+        self.detail.clear()
+        self.empty_label.setVisible(len(self.history) == 0)
+
+    def show_detail(self, current, previous=None):
+        """Tampilkan hasil tersimpan dari entri terpilih (dibaca saat dipilih)"""
+        if not current.isValid():
+            self.detail.clear()
             return
-        for it in items[::-1]:
-            t = it.get("time", "")
-            op = it.get("operation", "")
-            status = it.get("status", "")
-            summary = f"{t} | {op} | status={status}"
-            self.listw.addItem(summary)
+        it = self.history.get(self.model.history_index(current.row()))
+        result = it.get("result", [])
+        if isinstance(result, list):
+            result = "\n".join(str(r) for r in result)
+        text = f"{self.model.summary(it)}\n\n{result}"
+        if it.get("metrics"):
+            text += f"\n\nWaktu: {summarize(it['metrics'])}"
+        self.detail.setPlainText(text)
+
+    def _on_history_changed(self, event, index):
+        self.model.on_history_changed(event, index)
+        self.empty_label.setVisible(len(self.history) == 0)
 
     def clear_history(self):
         """Hapus seluruh isi history"""
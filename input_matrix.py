@@ -1,10 +1,12 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QLineEdit, QHBoxLayout,
-    QPushButton, QGridLayout, QMessageBox
+    QPushButton, QMessageBox, QFileDialog
 )
 from PyQt6.QtGui import QFont
 from PyQt6.QtCore import Qt
-import numpy as np
+
+from file_utils import import_matrix, export_matrix, FILE_FILTER
+from matrix_table import MatrixTableModel, MatrixTableView
 
 class WindowInputGrid(QWidget):
     def __init__(self, stacked_widget):
@@ -35,35 +37,49 @@ class WindowInputGrid(QWidget):
         self.btn_grid.clicked.connect(self.create_grid)
         self.layout.addWidget(self.btn_grid)
 
-        self.grid_layout = QGridLayout()
-        self.layout.addLayout(self.grid_layout)
+        # Grid berbasis model: hanya sel terlihat yang dirender, paste (Ctrl+V) TSV/CSV
+        self.model = MatrixTableModel(3, 3)
+        self.table = MatrixTableView(self.model)
+        self.layout.addWidget(self.table)
+        for sig in (self.model.rowsInserted, self.model.rowsRemoved,
+                    self.model.columnsInserted, self.model.columnsRemoved, self.model.modelReset):
+            sig.connect(self._sync_size)
 
         self.btn_save = QPushButton("Simpan Matriks")
         self.btn_save.clicked.connect(self.save_matrix)
         self.layout.addWidget(self.btn_save)
 
+        file_layout = QHBoxLayout()
+        self.btn_import = QPushButton("Import Matriks...")
+        self.btn_import.clicked.connect(self.import_matrices)
+        self.btn_export = QPushButton("Export Matriks...")
+        self.btn_export.clicked.connect(self.export_matrices)
+        file_layout.addWidget(self.btn_import)
+        file_layout.addWidget(self.btn_export)
+        self.layout.addLayout(file_layout)
+
         self.btn_back = QPushButton("Kembali ke Menu")
         self.btn_back.clicked.connect(lambda: self.stacked.setCurrentIndex(0))
         self.layout.addWidget(self.btn_back)
 
-        self.inputs = []
-
     def create_grid(self):
-        for i in reversed(range(self.grid_layout.count())):
-            self.grid_layout.itemAt(i).widget().setParent(None)
-        self.inputs.clear()
-
-        rows = int(self.rows_edit.text())
-        cols = int(self.cols_edit.text())
-
-        for i in range(rows):
-            row_inputs = []
-            for j in range(cols):
-                le = QLineEdit("0")
-                le.setFixedWidth(50)
-                self.grid_layout.addWidget(le, i, j)
-                row_inputs.append(le)
-            self.inputs.append(row_inputs)
+        """Ubah ukuran grid; isi yang sudah ada dipertahankan, sel baru = 0."""
+        try:
+            rows = int(self.rows_edit.text())
+            cols = int(self.cols_edit.text())
+        except ValueError:
+            QMessageBox.warning(self, "Error", "Ukuran matriks tidak valid.")
+            return
+        if rows < 1 or cols < 1:
+            QMessageBox.warning(self, "Error", "Ukuran matriks tidak valid.")
+            return
+        self.model.resize(rows, cols)
+
+    def _sync_size(self, *args):
+        """Samakan isian Baris/Kolom dengan ukuran tabel (mis. setelah paste)."""
+        rows, cols = self.model.array().shape
+        self.rows_edit.setText(str(rows))
+        self.cols_edit.setText(str(cols))
 
     def save_matrix(self):
         name = self.name_edit.text().strip()
@@ -71,17 +87,59 @@ class WindowInputGrid(QWidget):
             QMessageBox.warning(self, "Error", "Nama matriks tidak valid.")
             return
 
-        mat = np.array([[float(cell.text()) for cell in row] for row in self.inputs])
+        mat = self.model.array().copy()
         if not hasattr(self.stacked, "matrices"):
             self.stacked.matrices = {}
-        self.stacked.matrices[name] = mat
+        try:
+            # Workspace menulis langsung ke disk (.npy + index.json)
+            self.stacked.matrices[name] = mat
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Gagal menyimpan matriks: {e}")
+            return
 
         QMessageBox.information(self, "Sukses", f"Matriks '{name}' berhasil disimpan.")
 
         # Auto-refresh dropdown di WindowProses
+        self._refresh_process_pages()
+
+        self.stacked.setCurrentIndex(0)
+
+    def _refresh_process_pages(self):
         for i in range(self.stacked.count()):
             w = self.stacked.widget(i)
             if hasattr(w, "refresh_matrix_list"):
                 w.refresh_matrix_list()
 
-        self.stacked.setCurrentIndex(0)
+    def import_matrices(self):
+        """Import matriks bernama; format dipilih dari ekstensi (.npz/.npy di-memory-map)."""
+        fn, _ = QFileDialog.getOpenFileName(self, "Import Matriks", filter=FILE_FILTER)
+        if not fn:
+            return
+        if not hasattr(self.stacked, "matrices"):
+            self.stacked.matrices = {}
+        try:
+            matrices = import_matrix(fn, mmap_mode="r")
+            # dict biasa menyimpan memmap-nya sebagai referensi; Workspace menyalin
+            # file .npy apa adanya, jadi isi matriks tidak dibaca ke memori
+            self.stacked.matrices.update(matrices)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Gagal import: {e}")
+            return
+        self._refresh_process_pages()
+        QMessageBox.information(self, "Sukses", f"{len(matrices)} matriks diimport: {', '.join(matrices)}")
+
+    def export_matrices(self):
+        """Export semua matriks tersimpan; format dipilih dari ekstensi file."""
+        matrices = getattr(self.stacked, "matrices", None)
+        if not matrices:
+            QMessageBox.information(self, "Kosong", "Belum ada matriks tersimpan.")
+            return
+        fn, _ = QFileDialog.getSaveFileName(self, "Export Matriks", filter=FILE_FILTER)
+        if not fn:
+            return
+        try:
+            export_matrix(fn, matrices)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Gagal export: {e}")
+            return
+        QMessageBox.information(self, "Exported", f"Matriks disimpan di {fn}")
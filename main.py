@@ -6,12 +6,20 @@ from process_window import WindowProses
 from history_window import HistoryWindow
 from quiz_utils import QuizWindow
 from style import APP_STYLE
+from workspace import Workspace
+from operations import result_cache
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyleSheet(APP_STYLE)
 
     stacked = QStackedWidget()
+    # Matriks bernama disimpan di disk dan dimuat malas saat dipakai
+    stacked.matrices = Workspace(os.path.join(os.path.dirname(__file__), "workspace"))
+    # Hasil operasi juga disimpan di disk; hasil lama dibuang saat matriks
+    # tersimpan ditimpa (mis. lewat Simpan di WindowInputGrid) atau dihapus
+    result_cache.set_directory(os.path.join(os.path.dirname(__file__), "cache"))
+    stacked.matrices.subscribe(lambda name, old_hash, new_hash: result_cache.invalidate(old_hash))
 
     menu_page = MenuUtama(stacked)
     input_page = WindowInputGrid(stacked)
@@ -0,0 +1,122 @@
+from PyQt6.QtWidgets import QTableView, QHeaderView, QApplication, QMessageBox
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QKeySequence
+import numpy as np
+
+from file_utils import parse_matrix_text
+
+
+class MatrixTableModel(QAbstractTableModel):
+    """
+    Model tabel di atas array NumPy (float).
+    Hanya sel yang terlihat yang diminta view; edit langsung ditulis ke array.
+    """
+    def __init__(self, rows=3, cols=3, parent=None):
+        super().__init__(parent)
+        self._data = np.zeros((rows, cols))
+
+    def array(self):
+        return self._data
+
+    # ---------- API model ----------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._data.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._data.shape[1]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return format(float(self._data[index.row(), index.column()]), ".10g")
+        if role == Qt.ItemDataRole.EditRole:
+            # Presisi penuh: membuka editor lalu menutupnya tidak membulatkan nilai
+            return repr(float(self._data[index.row(), index.column()]))
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        try:
+            self._data[index.row(), index.column()] = float(str(value).strip())
+        except ValueError:
+            return False
+        self.dataChanged.emit(index, index, [role])
+        return True
+
+    def flags(self, index):
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(section + 1)
+        return None
+
+    # ---------- ubah ukuran / isi ----------
+    def resize(self, rows, cols):
+        """Ubah ukuran tanpa membangun ulang: isi lama dipertahankan, sel baru = 0."""
+        R, C = self._data.shape
+        if rows < R:
+            self.beginRemoveRows(QModelIndex(), rows, R - 1)
+            self._data = self._data[:rows].copy()
+            self.endRemoveRows()
+        elif rows > R:
+            self.beginInsertRows(QModelIndex(), R, rows - 1)
+            self._data = np.vstack([self._data, np.zeros((rows - R, C))])
+            self.endInsertRows()
+        if cols < C:
+            self.beginRemoveColumns(QModelIndex(), cols, C - 1)
+            self._data = self._data[:, :cols].copy()
+            self.endRemoveColumns()
+        elif cols > C:
+            self.beginInsertColumns(QModelIndex(), C, cols - 1)
+            self._data = np.hstack([self._data, np.zeros((rows, cols - C))])
+            self.endInsertColumns()
+
+    def set_array(self, M):
+        M = np.array(M, dtype=float)
+        self.beginResetModel()
+        self._data = M.reshape(-1, 1) if M.ndim == 1 else M
+        self.endResetModel()
+
+    def paste(self, row, col, block):
+        """Tempel blok array mulai (row, col); tabel diperbesar bila perlu."""
+        r, c = block.shape
+        R, C = self._data.shape
+        self.resize(max(R, row + r), max(C, col + c))
+        self._data[row:row + r, col:col + c] = block
+        self.dataChanged.emit(self.index(row, col), self.index(row + r - 1, col + c - 1))
+
+
+class MatrixTableView(QTableView):
+    """QTableView untuk input matriks dengan paste massal dari clipboard (TSV/CSV)."""
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.setModel(model)
+        # Ukuran sel seragam: view tidak perlu mengukur isi setiap kolom/baris
+        for header in (self.horizontalHeader(), self.verticalHeader()):
+            header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.horizontalHeader().setDefaultSectionSize(64)
+        self.verticalHeader().setDefaultSectionSize(24)
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.StandardKey.Paste):
+            self.paste_clipboard()
+            return
+        super().keyPressEvent(event)
+
+    def paste_clipboard(self):
+        text = QApplication.clipboard().text()
+        if not text.strip():
+            return
+        try:
+            block = parse_matrix_text(text)
+        except ValueError as e:
+            QMessageBox.warning(self, "Error", f"Gagal paste: {e}")
+            return
+        cur = self.currentIndex()
+        row, col = (cur.row(), cur.column()) if cur.isValid() else (0, 0)
+        self.model().paste(row, col, block)
@@ -1,231 +1,1236 @@
-import re
-import numpy as np
-
-# =======================================
-# Utility format & cetak matriks
-# =======================================
-def fmt(x):
-    """Format angka agar tampil rapi dan mudah dibaca."""
-    if abs(x - round(x)) < 1e-9:
-        return str(int(round(x)))
-    return f"{x:.4f}"
-
-def cetak_matriks(M):
-    """Mengembalikan string representasi matriks."""
-    return "\n".join(" ".join(fmt(x) for x in row) for row in M)
-
-def _row_to_str(r):
-    return " | ".join(fmt(x) for x in r)
-
-# =======================================
-# RREF (Gauss-Jordan) dinamis dengan langkah
-# =======================================
-def rref_with_steps(A_in, B_in=None, eps=1e-12):
-    """
-    Mengubah matriks A (atau [A|B]) menjadi bentuk eselon baris tereduksi (RREF).
-    Dinamis untuk ukuran berapapun, disertai langkah-langkah operasi baris elementer.
-    """
-    A = np.array(A_in, dtype=float)
-    if B_in is not None:
-        B = np.array(B_in, dtype=float).reshape(-1, 1)
-        M = np.hstack([A, B])
-    else:
-        M = A.copy()
-
-    n_rows, n_cols = M.shape
-    steps = []
-    pivot_row = 0
-
-    for pivot_col in range(n_cols - (1 if B_in is not None else 0)):
-        # Cari baris pivot (nilai absolut terbesar)
-        max_row = np.argmax(np.abs(M[pivot_row:, pivot_col])) + pivot_row
-        if abs(M[max_row, pivot_col]) < eps:
-            continue  # tidak ada pivot di kolom ini
-
-        # Tukar baris jika perlu
-        if pivot_row != max_row:
-            M[[pivot_row, max_row]] = M[[max_row, pivot_row]]
-            steps.append(f"Tukar baris {pivot_row+1} ↔ baris {max_row+1}\n{cetak_matriks(M)}")
-
-        # Normalisasi baris pivot
-        pivot_val = M[pivot_row, pivot_col]
-        M[pivot_row] /= pivot_val
-        steps.append(f"Normalisasi baris {pivot_row+1} (÷ {fmt(pivot_val)})\n{cetak_matriks(M)}")
-
-        # Hilangkan elemen lain di kolom pivot
-        for r in range(n_rows):
-            if r != pivot_row and abs(M[r, pivot_col]) > eps:
-                factor = M[r, pivot_col]
-                M[r] -= factor * M[pivot_row]
-                steps.append(f"Baris {r+1} - ({fmt(factor)} × baris {pivot_row+1})\n{cetak_matriks(M)}")
-
-        pivot_row += 1
-        if pivot_row == n_rows:
-            break
-
-    M[np.abs(M) < eps] = 0.0
-    steps.append("\n=== HASIL RREF ===\n" + cetak_matriks(M))
-    return M, steps
-
-# =======================================
-# OBE solver umum (A·x = B)
-# =======================================
-def solve_obe(A, B):
-    """
-    Menyelesaikan sistem linear A·x = B dengan eliminasi Gauss-Jordan.
-    Dinamis untuk ukuran apapun.
-    """
-    A = np.array(A, dtype=float)
-    B = np.array(B, dtype=float).reshape(-1, 1)
-    M, steps = rref_with_steps(A, B)
-
-    n_rows, n_cols = M.shape
-    n_vars = n_cols - 1
-    eps = 1e-9
-
-    # Deteksi sistem tidak konsisten
-    for i in range(n_rows):
-        if np.all(np.abs(M[i, :n_vars]) < eps) and abs(M[i, -1]) > eps:
-            steps.append(f"Baris {i+1} menunjukkan sistem tak konsisten.")
-            return None, steps, "tidak_konsisten"
-
-    # Temukan kolom pivot
-    pivots = []
-    for i in range(n_rows):
-        for j in range(n_vars):
-            if abs(M[i, j] - 1) < eps and np.all(np.abs(np.delete(M[:, j], i)) < eps):
-                pivots.append(j)
-                break
-    free_vars = [j for j in range(n_vars) if j not in pivots]
-
-    # Solusi unik
-    if len(pivots) == n_vars:
-        x = np.zeros(n_vars)
-        for i in range(len(pivots)):
-            x[pivots[i]] = M[i, -1]
-        steps.append("\n=== Solusi unik ===")
-        for i, val in enumerate(x, start=1):
-            steps.append(f"x{i} = {fmt(val)}")
-        return x, steps, "unik"
-
-    # Solusi tak hingga
-    particular = np.zeros(n_vars)
-    for i in range(n_rows):
-        row = M[i, :n_vars]
-        if 1 in row:
-            pivot_col = np.where(row == 1)[0][0]
-            particular[pivot_col] = M[i, -1]
-
-    basis = []
-    for f in free_vars:
-        vec = np.zeros(n_vars)
-        vec[f] = 1
-        for i in range(n_rows):
-            row = M[i, :n_vars]
-            if 1 in row:
-                pivot_col = np.where(row == 1)[0][0]
-                vec[pivot_col] = -M[i, f]
-        basis.append(vec)
-
-    steps.append("\n=== Solusi tak hingga ===")
-    steps.append(f"Variabel bebas: {[f'x{v+1}' for v in free_vars]}")
-    steps.append(f"x_partikular = [{', '.join(fmt(x) for x in particular)}]")
-    for i, b in enumerate(basis, 1):
-        steps.append(f"t{i} * [{', '.join(fmt(x) for x in b)}]")
-
-    return (particular, free_vars, basis), steps, "tak_hingga"
-
-# =======================================
-# Sistem homogen A·x = 0
-# =======================================
-def solve_homogeneous(A):
-    """
-    Menyelesaikan sistem homogen A·x = 0.
-    Menghasilkan variabel bebas & basis ruang null.
-    """
-    A = np.array(A, dtype=float)
-    R, steps = rref_with_steps(A)
-    n_rows, n_cols = R.shape
-    eps = 1e-9
-
-    pivots = []
-    for i in range(n_rows):
-        for j in range(n_cols):
-            if abs(R[i, j] - 1) < eps and np.all(np.abs(np.delete(R[:, j], i)) < eps):
-                pivots.append(j)
-                break
-
-    free_vars = [j for j in range(n_cols) if j not in pivots]
-    basis = []
-
-    for f in free_vars:
-        v = np.zeros(n_cols)
-        v[f] = 1
-        for i in range(n_rows):
-            row = R[i, :n_cols]
-            if 1 in row:
-                pivot_col = np.where(row == 1)[0][0]
-                v[pivot_col] = -R[i, f]
-        basis.append(v)
-
-    steps.append("\n=== Ruang Null ===")
-    if basis:
-        for i, b in enumerate(basis, 1):
-            steps.append(f"Basis {i}: [{', '.join(fmt(x) for x in b)}]")
-    else:
-        steps.append("Hanya solusi trivial (semua nol).")
-
-    return free_vars, basis, steps
-
-# =======================================
-# Operasi matriks umum
-# =======================================
-def det(A):
-    """Determinannya dinamis."""
-    return float(np.linalg.det(np.array(A, dtype=float)))
-
-def inverse(A):
-    """Invers matriks dinamis."""
-    A = np.array(A, dtype=float)
-    if abs(np.linalg.det(A)) < 1e-12:
-        raise ValueError("Matriks singular — tidak memiliki invers.")
-    return np.linalg.inv(A)
-
-def transpose(A):
-    """Transpose dinamis."""
-    return np.array(A, dtype=float).T
-
-def rank(A):
-    """Menghitung rank matriks secara dinamis."""
-    return np.linalg.matrix_rank(np.array(A, dtype=float))
-
-# =======================================
-# Operasi vektor dinamis
-# =======================================
-def vec_add(u, v):
-    return np.array(u, dtype=float) + np.array(v, dtype=float)
-
-def vec_sub(u, v):
-    return np.array(u, dtype=float) - np.array(v, dtype=float)
-
-def dot(u, v):
-    return float(np.dot(u, v))
-
-def cross(u, v):
-    return np.cross(u, v)
-
-def norm(u):
-    return float(np.linalg.norm(np.array(u, dtype=float)))
-
-def projection(u, v):
-    v = np.array(v, dtype=float)
-    if np.allclose(v, 0):
-        raise ValueError("Tidak dapat memproyeksikan ke vektor nol.")
-    return (np.dot(u, v) / np.dot(v, v)) * v
-
-def angle_between(u, v):
-    u = np.array(u, dtype=float)
-    v = np.array(v, dtype=float)
-    cos = np.dot(u, v) / (np.linalg.norm(u) * np.linalg.norm(v))
-    cos = max(min(cos, 1.0), -1.0)
-    return np.arccos(cos)
+import re
+from collections import namedtuple
+from fractions import Fraction
+from math import prod
+import numpy as np
+try:
+    from scipy.linalg import lu_factor as _lapack_lu, lu_solve as _lapack_lu_solve
+except ImportError:     # tanpa scipy: LU ditulis dengan numpy (_getrf / _getrs)
+    _lapack_lu = _lapack_lu_solve = None
+from cache_utils import FactorCache, LRUCache, fingerprint, _freeze
+from sparse_utils import SparseMatrix, sparse_eliminate, sparse_back_substitute
+from exact_utils import to_integer_rows, bareiss_rref, normalize_pivots
+from format_utils import format_scalar, format_matrix, format_row
+
+# =======================================
+# Utility format & cetak matriks
+# =======================================
+def fmt(x):
+    """Format angka agar tampil rapi dan mudah dibaca."""
+    return format_scalar(x)
+
+def cetak_matriks(M, threshold=None):
+    """Mengembalikan string representasi matriks (lihat format_utils.format_matrix)."""
+    return format_matrix(M, threshold=threshold)
+
+def _row_to_str(r):
+    return format_row(r)
+
+# =======================================
+# Jejak langkah OBE (dirender saat dibutuhkan)
+# =======================================
+# kind : "swap" | "scale" | "elim" | "clean" | "ffelim" | "done"
+# rows : indeks baris yang terlibat
+# factor : pembagi / faktor eliminasi (eps untuk "clean",
+#          (p, a, p_prev) untuk "ffelim" pada mode eksak)
+# data : isi baru baris yang berubah (None jika bisa diputar ulang)
+StepRecord = namedtuple("StepRecord", ["kind", "rows", "factor", "data"])
+
+class StepTrace:
+    """
+    Daftar langkah OBE yang ringkas.
+    Hanya menyimpan jenis operasi, indeks baris, faktor, dan baris yang berubah;
+    teks matriks lengkap dibangun ulang ketika langkah ditampilkan / diexport.
+    Bisa dipakai seperti list of str (append, extend, iterasi, indeks).
+    Jika M0 None, langkah OBE tidak dicatat (hanya teks biasa yang disimpan).
+    M0 ber-dtype object (mode eksak) disimpan apa adanya, selain itu float.
+    """
+    # Replay memakai titik simpan (salinan M) agar akses acak tidak mulai dari awal.
+    # Jarak antar titik simpan melebar untuk trace panjang: paling banyak
+    # sekitar MAX_CHECKPOINTS salinan matriks.
+    CHECKPOINT_EVERY = 64
+    MAX_CHECKPOINTS = 64
+
+    def __init__(self, M0=None):
+        if M0 is not None:
+            M0 = np.asarray(M0)
+            M0 = np.array(M0, dtype=object if M0.dtype == object else float)
+        self._initial = M0
+        self._items = []
+        self._checkpoints = {}
+
+    @property
+    def recording(self):
+        return self._initial is not None
+
+    def record(self, kind, rows, factor=None, data=None):
+        if not self.recording:
+            return
+        if data is not None:
+            data = np.array(data, dtype=self._initial.dtype)
+        self._items.append(StepRecord(kind, tuple(rows), factor, data))
+
+    def append(self, text):
+        self._items.append(text)
+
+    def extend(self, texts):
+        for t in texts:
+            self.append(t)
+
+    def records(self):
+        """Daftar mentah langkah (StepRecord atau str)."""
+        return list(self._items)
+
+    @property
+    def nbytes(self):
+        """Perkiraan memori trace (titik simpan tidak dihitung; bisa dibangun ulang)."""
+        n = self._initial.nbytes if self.recording else 0
+        for item in self._items:
+            if isinstance(item, str):
+                n += len(item)
+            else:
+                n += 64 + (item.data.nbytes if item.data is not None else 0)
+        return n
+
+    def __getstate__(self):
+        # Titik simpan hanya mempercepat replay, tidak ikut dipickle
+        return dict(self.__dict__, _checkpoints={})
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        M = self._initial.copy() if self.recording else None
+        for item in self._items:
+            yield self._render(item, M)
+
+    def _replay(self, start, stop):
+        """
+        Hasilkan (item, M) untuk langkah start..stop-1, dengan M = matriks
+        setelah langkah itu diterapkan (M dipakai ulang, jangan disimpan).
+        """
+        if not self.recording:
+            for item in self._items[start:stop]:
+                yield item, None
+            return
+        every = max(self.CHECKPOINT_EVERY, len(self._items) // self.MAX_CHECKPOINTS)
+        base = max((c for c in self._checkpoints if c <= start), default=0)
+        M = (self._checkpoints[base] if base else self._initial).copy()
+        for i in range(base, stop):
+            if i and i % every == 0 and i not in self._checkpoints:
+                self._checkpoints[i] = M.copy()
+            item = self._items[i]
+            self._apply(item, M)
+            if i >= start:
+                yield item, M
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            wanted = range(len(self._items))[idx]
+            if not wanted:
+                return []
+            rendered = {}
+            for i, (item, M) in enumerate(self._replay(min(wanted), max(wanted) + 1), min(wanted)):
+                if i in wanted:
+                    rendered[i] = self._text(item, M)
+            return [rendered[i] for i in wanted]
+        n = len(self._items)
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError("indeks langkah di luar jangkauan")
+        return self[idx:idx + 1][0]
+
+    def snapshots(self, start, stop, copy=True):
+        """
+        Langkah start..stop-1 sebagai (judul, matriks): matriks = salinan keadaan
+        setelah langkah (None untuk teks biasa). Tanpa memformat matriks, sehingga
+        tampilan bisa memilih pratinjau ringkas.
+        """
+        out = []
+        for item, M in self._replay(start, min(stop, len(self._items))):
+            header = self._apply_header(item)
+            if header is None:
+                out.append((item, None))
+            else:
+                out.append((header, M.copy() if copy else M))
+        return out
+
+    @staticmethod
+    def _apply(item, M):
+        """Terapkan satu langkah ke M (in-place)."""
+        if isinstance(item, str):
+            return
+        kind, rows, factor, data = item
+        if kind == "swap":
+            i, j = rows
+            M[[i, j]] = M[[j, i]]
+        elif kind in ("scale", "elim", "ffelim"):
+            M[rows[0]] = data
+        elif kind == "clean":
+            M[np.abs(M) < factor] = 0.0
+        elif kind != "done":
+            raise ValueError(f"Jenis langkah tidak dikenal: {kind}")
+
+    @staticmethod
+    def _apply_header(item):
+        """Judul langkah (tanpa matriks); None untuk teks biasa."""
+        if isinstance(item, str):
+            return None
+        kind, rows, factor, data = item
+        if kind == "swap":
+            i, j = rows
+            return f"Tukar baris {i+1} ↔ baris {j+1}"
+        if kind == "scale":
+            return f"Normalisasi baris {rows[0]+1} (÷ {fmt(factor)})"
+        if kind == "elim":
+            r, p = rows
+            return f"Baris {r+1} - ({fmt(factor)} × baris {p+1})"
+        if kind == "ffelim":
+            r, q = rows
+            p, a, prev = factor
+            return f"Baris {r+1} = ({p} × baris {r+1} - {a} × baris {q+1}) / {prev}"
+        if kind in ("clean", "done"):
+            return "\n=== HASIL RREF ==="
+        raise ValueError(f"Jenis langkah tidak dikenal: {kind}")
+
+    @classmethod
+    def _text(cls, item, M):
+        header = cls._apply_header(item)
+        return item if header is None else f"{header}\n{cetak_matriks(M)}"
+
+    @classmethod
+    def _render(cls, item, M):
+        """Terapkan satu langkah ke M (in-place) lalu kembalikan teksnya."""
+        cls._apply(item, M)
+        return cls._text(item, M)
+
+class StepCursor:
+    """
+    Merender langkah StepTrace secara bertahap: take() hanya mengembalikan
+    teks langkah yang ditambahkan sejak pemanggilan sebelumnya (untuk streaming).
+    """
+    def __init__(self, trace):
+        self.trace = trace
+        self.pos = 0
+        self._M = trace._initial.copy() if trace.recording else None
+
+    def take(self):
+        items = self.trace._items[self.pos:]
+        self.pos += len(items)
+        return [StepTrace._render(item, self._M) for item in items]
+
+# =======================================
+# RREF (Gauss-Jordan) dinamis dengan langkah
+# =======================================
+def _eliminate_column(M, pivot_row, pivot_col, eps, steps):
+    """
+    Nolkan kolom pivot pada semua baris lain dengan satu update outer-product.
+    Catatan per baris hanya dibuat jika langkah sedang direkam.
+    """
+    factors = M[:, pivot_col].copy()
+    factors[pivot_row] = 0.0
+    rows = np.flatnonzero(np.abs(factors) > eps)
+    if rows.size == 0:
+        return
+    M[rows] -= np.outer(factors[rows], M[pivot_row])
+    if steps.recording:
+        for r in rows:
+            steps.record("elim", (int(r), pivot_row), factors[r], M[r])
+
+# Ringkasan hasil RREF: kolom pivot (urut per baris), rank, dan variabel bebas
+RREFInfo = namedtuple("RREFInfo", ["pivots", "rank", "free_vars"])
+
+def rref_with_steps(A_in, B_in=None, eps=1e-12, with_steps=True, exact=False, progress=None):
+    """
+    Mengubah matriks A (atau [A|B]) menjadi bentuk eselon baris tereduksi (RREF).
+    Dinamis untuk ukuran berapapun, disertai langkah-langkah operasi baris elementer.
+    Dengan with_steps=False langkah OBE tidak dicatat sama sekali.
+    B boleh vektor atau matriks dengan k kolom ruas kanan.
+    exact=True memakai eliminasi Bareiss (bilangan bulat / pecahan eksak).
+    progress(k, n, steps), jika diberikan, dipanggil sebelum setiap kolom pivot
+    (k kolom dari n sudah selesai); exception dari progress membatalkan proses.
+    Mengembalikan (M, RREFInfo, steps).
+    """
+    if exact:
+        return _rref_exact(A_in, B_in, with_steps, progress)
+    A = np.array(A_in, dtype=float)
+    n_rhs = 0
+    if B_in is not None:
+        B = np.array(B_in, dtype=float)
+        B = B.reshape(B.shape[0], -1) if B.ndim == 2 else B.reshape(-1, 1)
+        n_rhs = B.shape[1]
+        M = np.hstack([A, B])
+    else:
+        M = A.copy()
+
+    n_rows, n_cols = M.shape
+    n_vars = n_cols - n_rhs
+    steps = StepTrace(M if with_steps else None)
+    pivots = []
+    pivot_row = 0
+
+    for pivot_col in range(n_vars):
+        if progress is not None:
+            progress(pivot_col, n_vars, steps)
+        # Cari baris pivot (nilai absolut terbesar)
+        max_row = np.argmax(np.abs(M[pivot_row:, pivot_col])) + pivot_row
+        if abs(M[max_row, pivot_col]) < eps:
+            continue  # tidak ada pivot di kolom ini
+
+        # Tukar baris jika perlu
+        if pivot_row != max_row:
+            M[[pivot_row, max_row]] = M[[max_row, pivot_row]]
+            steps.record("swap", (pivot_row, max_row))
+
+        # Normalisasi baris pivot
+        pivot_val = M[pivot_row, pivot_col]
+        M[pivot_row] /= pivot_val
+        steps.record("scale", (pivot_row,), pivot_val, M[pivot_row])
+
+        # Hilangkan elemen lain di kolom pivot
+        _eliminate_column(M, pivot_row, pivot_col, eps, steps)
+
+        pivots.append(pivot_col)
+        pivot_row += 1
+        if pivot_row == n_rows:
+            break
+
+    M[np.abs(M) < eps] = 0.0
+    steps.record("clean", (), eps)
+    if progress is not None:
+        progress(n_vars, n_vars, steps)
+    pivot_set = set(pivots)
+    free_vars = [j for j in range(n_vars) if j not in pivot_set]
+    return M, RREFInfo(pivots, len(pivots), free_vars), steps
+
+def _rref_exact(A_in, B_in=None, with_steps=True, progress=None):
+    """RREF eksak: Bareiss bebas pecahan, lalu baris pivot dibagi pivotnya."""
+    M = np.array(A_in, dtype=object)
+    n_vars = M.shape[1]
+    if B_in is not None:
+        B = np.array(B_in, dtype=object)
+        B = B.reshape(B.shape[0], -1) if B.ndim == 2 else B.reshape(-1, 1)
+        M = np.hstack([M, B])
+
+    M, scales = to_integer_rows(M)
+    steps = StepTrace(M.astype(object) if with_steps else None)
+    if any(s != 1 for s in scales):
+        steps.append(f"Baris dikalikan {scales} agar semua elemen bulat.")
+    M, pivots, _ = bareiss_rref(M, n_vars, steps, progress)
+    R = normalize_pivots(M, pivots, steps if steps.recording else None)
+    steps.record("done", ())
+    if progress is not None:
+        progress(n_vars, n_vars, steps)
+    pivot_set = set(pivots)
+    free_vars = [j for j in range(n_vars) if j not in pivot_set]
+    return R, RREFInfo(pivots, len(pivots), free_vars), steps
+
+def _null_basis(R, info, n_vars):
+    """Basis ruang null langsung dari RREF dan daftar kolom pivot."""
+    N = np.zeros((n_vars, len(info.free_vars)), dtype=R.dtype)
+    N[info.free_vars, np.arange(len(info.free_vars))] = 1
+    N[info.pivots, :] = -R[:info.rank][:, info.free_vars]
+    return list(N.T)
+
+# =======================================
+# OBE solver umum (A·x = B)
+# =======================================
+def _report_unique(steps, x):
+    steps.append("\n=== Solusi unik ===")
+    for i, val in enumerate(x, start=1):
+        steps.append(f"x{i} = {fmt(val)}")
+
+def _report_infinite(steps, free_vars, particular, basis):
+    steps.append("\n=== Solusi tak hingga ===")
+    steps.append(f"Variabel bebas: {[f'x{v+1}' for v in free_vars]}")
+    steps.append(f"x_partikular = [{format_row(particular, ', ')}]")
+    for i, b in enumerate(basis, 1):
+        steps.append(f"t{i} * [{format_row(b, ', ')}]")
+
+def solve_square(A, B):
+    """
+    Solusi unik A·X = B untuk A persegi tanpa langkah: koreksi rank-k dari
+    matriks yang baru diselesaikan (InverseUpdater) atau LU yang di-cache.
+    None jika A (hampir) singular.
+    """
+    X = inverse_updater.solve(A, B)
+    if X is not None:
+        return X
+    A = np.asarray(A, dtype=float)
+    _require_square(A, "Solve")
+    factors = lu_factor(A)
+    try:
+        X = None if factors.singular else lu_solve(factors, B)
+    except np.linalg.LinAlgError:
+        X = None
+    if X is None or near_singular(A, X, B):
+        return None
+    inverse_updater.remember(A, factors=factors)
+    return X
+
+def solve_obe(A, B, with_steps=True, exact=False, progress=None):
+    """
+    Menyelesaikan sistem linear A·x = B dengan eliminasi Gauss-Jordan.
+    Dinamis untuk ukuran apapun.
+    Dengan with_steps=False, matriks persegi non-singular diselesaikan
+    memakai faktorisasi LU yang di-cache (tanpa langkah OBE).
+    Jika B punya k > 1 kolom, lihat _solve_obe_multi.
+    A berupa SparseMatrix diselesaikan dengan eliminasi sparse (_solve_obe_sparse).
+    exact=True memakai RREF eksak (Bareiss); solusinya berupa Fraction.
+    """
+    if isinstance(A, SparseMatrix):
+        return _solve_obe_sparse(A, B)
+    if exact:
+        return _solve_obe_exact(A, B, with_steps, progress)
+    A = np.array(A, dtype=float)
+    B = np.array(B, dtype=float)
+    if B.ndim == 2 and B.shape[1] > 1:
+        return _solve_obe_multi(A, B, with_steps, progress)
+    B = B.reshape(-1, 1)
+
+    if not with_steps and A.ndim == 2 and A.shape[0] == A.shape[1] == B.shape[0]:
+        x = solve_square(A, B[:, 0])
+        if x is not None:
+            steps = StepTrace()
+            _report_unique(steps, x)
+            return x, steps, "unik"
+
+    M, info, steps = rref_with_steps(A, B, with_steps=with_steps, progress=progress)
+
+    n_vars = M.shape[1] - 1
+    eps = 1e-9
+
+    # Deteksi sistem tidak konsisten
+    bad = np.flatnonzero(np.all(np.abs(M[:, :n_vars]) < eps, axis=1) & (np.abs(M[:, -1]) > eps))
+    if bad.size:
+        steps.append(f"Baris {bad[0]+1} menunjukkan sistem tak konsisten.")
+        return None, steps, "tidak_konsisten"
+
+    pivots, free_vars = info.pivots, info.free_vars
+    particular = np.zeros(n_vars)
+    particular[pivots] = M[:info.rank, -1]
+
+    # Solusi unik
+    if not free_vars:
+        _report_unique(steps, particular)
+        return particular, steps, "unik"
+
+    # Solusi tak hingga
+    basis = _null_basis(M, info, n_vars)
+    _report_infinite(steps, free_vars, particular, basis)
+    return (particular, free_vars, basis), steps, "tak_hingga"
+
+def _solve_obe_exact(A, B, with_steps=True, progress=None):
+    """solve_obe dengan aritmetika eksak: konsistensi dicek tanpa toleransi eps."""
+    B = np.array(B, dtype=object)
+    multi = B.ndim == 2 and B.shape[1] > 1
+    R, info, steps = rref_with_steps(A, B, with_steps=with_steps, exact=True, progress=progress)
+    k = B.shape[1] if multi else 1
+    n_vars = R.shape[1] - k
+
+    # Baris di bawah rank bagian A-nya nol; ruas kanan tak nol → tak konsisten
+    tail = R[info.rank:, n_vars:]
+    bad = np.array([any(x != 0 for x in tail[:, j]) for j in range(k)], dtype=bool)
+    X = np.full((n_vars, k), Fraction(0), dtype=object)
+    X[info.pivots] = R[:info.rank, n_vars:]
+    basis = _null_basis(R, info, n_vars) if info.free_vars else []
+
+    if multi:
+        X[:, bad] = None
+        statuses = ["tidak_konsisten" if b else ("tak_hingga" if basis else "unik") for b in bad]
+        _report_columns(steps, X, statuses)
+        return (X, info.free_vars, basis), steps, statuses
+
+    if bad[0]:
+        row = info.rank + next(i for i, x in enumerate(tail[:, 0]) if x != 0)
+        steps.append(f"Baris {row+1} menunjukkan sistem tak konsisten.")
+        return None, steps, "tidak_konsisten"
+    x = X[:, 0]
+    if not basis:
+        _report_unique(steps, x)
+        return x, steps, "unik"
+    _report_infinite(steps, info.free_vars, x, basis)
+    return (x, info.free_vars, basis), steps, "tak_hingga"
+
+def _solve_obe_multi(A, B, with_steps=True, progress=None):
+    """
+    Menyelesaikan A·X = B untuk k ruas kanan sekaligus dengan satu eliminasi
+    pada [A|B]. Konsistensi dicek per kolom.
+    Mengembalikan ((X, free_vars, basis), steps, [status per kolom]);
+    kolom X yang tak konsisten berisi NaN, basis ruang null sama untuk semua kolom.
+    """
+    k = B.shape[1]
+
+    if not with_steps and A.ndim == 2 and A.shape[0] == A.shape[1] == B.shape[0]:
+        X = solve_square(A, B)
+        if X is not None:
+            statuses = ["unik"] * k
+            steps = StepTrace()
+            _report_columns(steps, X, statuses)
+            return (X, [], []), steps, statuses
+
+    M, info, steps = rref_with_steps(A, B, with_steps=with_steps, progress=progress)
+    n_vars = M.shape[1] - k
+    eps = 1e-9
+
+    # Baris nol di bagian A yang ruas kanannya tak nol → kolom tak konsisten
+    zero_rows = np.all(np.abs(M[:, :n_vars]) < eps, axis=1)
+    bad = np.any(np.abs(M[zero_rows, n_vars:]) > eps, axis=0)
+
+    X = np.zeros((n_vars, k))
+    X[info.pivots] = M[:info.rank, n_vars:]
+    X[:, bad] = np.nan
+    basis = _null_basis(M, info, n_vars) if info.free_vars else []
+    statuses = ["tidak_konsisten" if b else ("tak_hingga" if basis else "unik") for b in bad]
+
+    _report_columns(steps, X, statuses)
+    if basis and not all(bad):
+        steps.append("\n=== Ruang null (sama untuk semua kolom) ===")
+        steps.append(f"Variabel bebas: {[f'x{v+1}' for v in info.free_vars]}")
+        for i, b in enumerate(basis, 1):
+            steps.append(f"t{i} * [{format_row(b, ', ')}]")
+
+    return (X, info.free_vars, basis), steps, statuses
+
+def _report_columns(steps, X, statuses):
+    for j, status in enumerate(statuses):
+        steps.append(f"\n=== Kolom b{j+1}: {status} ===")
+        if status != "tidak_konsisten":
+            steps.append(f"x = [{format_row(X[:, j], ', ')}]")
+
+# =======================================
+# Jalur sparse (memori sebanding nnz)
+# =======================================
+def _sparse_free_vars(elim, n_vars):
+    pivot_cols = {c for _, c in elim["pivots"]}
+    return [j for j in range(n_vars) if j not in pivot_cols]
+
+def _sparse_null_basis(elim, free_vars, n_vars):
+    return [sparse_back_substitute(elim, n_vars, free_values={f: 1.0})[:, 0] for f in free_vars]
+
+def _solve_obe_sparse(A, B, eps=1e-9):
+    """
+    Versi solve_obe untuk SparseMatrix. Pivot dipilih untuk membatasi fill-in;
+    langkah berisi ringkasan (tanpa cetak matriks penuh).
+    """
+    B = np.asarray(B, dtype=float)
+    multi = B.ndim == 2 and B.shape[1] > 1
+    n_vars = A.shape[1]
+    elim = sparse_eliminate(A, B)
+    rhs, rest = elim["rhs"], elim["rest"]
+
+    steps = StepTrace()
+    steps.append(f"Eliminasi sparse {A.shape[0]}×{n_vars}: nnz = {A.nnz}, "
+                 f"pivot = {len(elim['pivots'])}, fill-in = {elim['fill']}")
+
+    bad_rows = [i for i in rest if np.any(np.abs(rhs[i]) > eps)]
+    if not multi and bad_rows:
+        steps.append(f"Baris {bad_rows[0]+1} menunjukkan sistem tak konsisten.")
+        return None, steps, "tidak_konsisten"
+
+    free_vars = _sparse_free_vars(elim, n_vars)
+    X = sparse_back_substitute(elim, n_vars, rhs)
+    basis = _sparse_null_basis(elim, free_vars, n_vars)
+
+    if multi:
+        bad = np.zeros(X.shape[1], dtype=bool)
+        if bad_rows:
+            bad = np.any(np.abs(rhs[bad_rows]) > eps, axis=0)
+        X[:, bad] = np.nan
+        statuses = ["tidak_konsisten" if b else ("tak_hingga" if basis else "unik") for b in bad]
+        _report_columns(steps, X, statuses)
+        return (X, free_vars, basis), steps, statuses
+
+    x = X[:, 0]
+    if not free_vars:
+        _report_unique(steps, x)
+        return x, steps, "unik"
+    _report_infinite(steps, free_vars, x, basis)
+    return (x, free_vars, basis), steps, "tak_hingga"
+
+# =======================================
+# Sistem homogen A·x = 0
+# =======================================
+def solve_homogeneous(A, with_steps=True, progress=None):
+    """
+    Menyelesaikan sistem homogen A·x = 0.
+    Menghasilkan variabel bebas & basis ruang null.
+    """
+    if isinstance(A, SparseMatrix):
+        elim = sparse_eliminate(A)
+        free_vars = _sparse_free_vars(elim, A.shape[1])
+        basis = _sparse_null_basis(elim, free_vars, A.shape[1])
+        steps = StepTrace()
+        steps.append(f"Eliminasi sparse {A.shape[0]}×{A.shape[1]}: nnz = {A.nnz}, "
+                     f"pivot = {len(elim['pivots'])}, fill-in = {elim['fill']}")
+    else:
+        A = np.array(A, dtype=float)
+        R, info, steps = rref_with_steps(A, with_steps=with_steps, progress=progress)
+        free_vars = info.free_vars
+        basis = _null_basis(R, info, R.shape[1])
+
+    steps.append("\n=== Ruang Null ===")
+    if basis:
+        for i, b in enumerate(basis, 1):
+            steps.append(f"Basis {i}: [{format_row(b, ', ')}]")
+    else:
+        steps.append("Hanya solusi trivial (semua nol).")
+
+    return free_vars, basis, steps
+
+# =======================================
+# Faktorisasi (LU / QR / SVD) dengan cache
+# =======================================
+factor_cache = FactorCache(max_bytes=256 * 2**20)
+
+# |U_ii| terkecil di bawah ini → matriks dianggap singular
+PIVOT_TOL = 1e-12
+
+# Lebar blok kolom untuk LU numpy (tanpa scipy)
+LU_BLOCK = 64
+
+# lu : L (di bawah diagonal, diagonal satuan) dan U dalam satu array
+# piv : ipiv LAPACK (scipy) atau permutasi baris P·A = L·U (_getrf numpy)
+# sign, logdet : det(A) = sign · exp(logdet) (tanpa overflow untuk n besar)
+# singular : |U_ii| terkecil ≤ PIVOT_TOL
+LUFactors = namedtuple("LUFactors", ["lu", "piv", "sign", "logdet", "singular"])
+
+def _getrf(A, block=LU_BLOCK):
+    """
+    LU dengan pivot baris parsial (seperti LAPACK getrf) memakai numpy:
+    per blok kolom, panel difaktorkan kolom demi kolom (Crout, gemv), lalu
+    sisa matriks diperbarui sekaligus dengan satu perkalian matriks (BLAS-3).
+    Mengembalikan (lu, perm, jumlah pertukaran baris).
+    """
+    LU = np.array(A, dtype=float)
+    n = LU.shape[0]
+    perm = np.arange(n)
+    swaps = 0
+    for k0 in range(0, n, block):
+        k1 = min(k0 + block, n)
+        for k in range(k0, k1):
+            if k > k0:
+                LU[k:, k] -= LU[k:, k0:k] @ LU[k0:k, k]
+            p = k + int(np.argmax(np.abs(LU[k:, k])))
+            if p != k:
+                row = LU[k].copy()
+                LU[k] = LU[p]
+                LU[p] = row
+                perm[k], perm[p] = perm[p], perm[k]
+                swaps += 1
+            if LU[k, k] != 0.0:
+                LU[k+1:, k] /= LU[k, k]
+            if k > k0 and k + 1 < k1:
+                LU[k, k+1:k1] -= LU[k, k0:k] @ LU[k0:k, k+1:k1]
+        if k1 < n:
+            L11 = np.tril(LU[k0:k1, k0:k1], -1) + np.eye(k1 - k0)
+            LU[k0:k1, k1:] = np.linalg.solve(L11, LU[k0:k1, k1:])
+            LU[k1:, k1:] -= LU[k1:, k0:k1] @ LU[k0:k1, k1:]
+    return LU, perm, swaps
+
+def _getrs(lu, perm, B, block=LU_BLOCK):
+    """
+    Substitusi maju (L) lalu mundur (U) per blok dari hasil _getrf.
+    B = None menghitung A⁻¹: L⁻¹ segitiga bawah, jadi kolom di kanan blok
+    yang sedang diproses masih nol dan dilewati pada substitusi maju.
+    """
+    n = lu.shape[0]
+    X = np.eye(n) if B is None else np.asarray(B, dtype=float)[perm]
+    vector = X.ndim == 1
+    if vector:
+        X = X[:, None]
+    for k0 in range(0, n, block):
+        k1 = min(k0 + block, n)
+        c = k1 if B is None else None
+        L11 = np.tril(lu[k0:k1, k0:k1], -1) + np.eye(k1 - k0)
+        X[k0:k1, :c] = np.linalg.solve(L11, X[k0:k1, :c])
+        X[k1:, :c] -= lu[k1:, k0:k1] @ X[k0:k1, :c]
+    for k1 in range(n, 0, -block):
+        k0 = max(k1 - block, 0)
+        X[k0:k1] = np.linalg.solve(np.triu(lu[k0:k1, k0:k1]), X[k0:k1])
+        X[:k0] -= lu[:k0, k0:k1] @ X[k0:k1]
+    if B is None:
+        Ainv = np.empty_like(X)
+        Ainv[:, perm] = X       # A⁻¹ = U⁻¹·L⁻¹·P
+        return Ainv
+    return X[:, 0] if vector else X
+
+def _lu_decompose(A):
+    """Faktorisasi LU: LAPACK lewat scipy.linalg jika tersedia, selain itu _getrf."""
+    n = A.shape[0]
+    if _lapack_lu is None:
+        lu, piv, swaps = _getrf(A)
+    else:
+        lu, piv = _lapack_lu(A, check_finite=False)
+        swaps = np.count_nonzero(piv != np.arange(n))
+    d = np.diag(lu)
+    sign = (-1.0) ** swaps * np.prod(np.sign(d))
+    with np.errstate(divide="ignore"):
+        logdet = float(np.sum(np.log(np.abs(d))))
+    return LUFactors(lu, piv, float(sign), logdet,
+                     bool(n and np.min(np.abs(d)) <= PIVOT_TOL))
+
+def _require_square(A, what):
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError(f"{what} hanya untuk matriks persegi.")
+
+def lu_factor(A):
+    """Faktorisasi LU (LUFactors) yang di-cache berdasarkan isi matriks."""
+    A = np.asarray(A, dtype=float)
+    _require_square(A, "Faktorisasi LU")
+    return factor_cache.factor(A, "lu", _lu_decompose)
+
+def lu_solve(factors, B):
+    """Menyelesaikan A·X = B memakai hasil lu_factor (B boleh vektor atau matriks)."""
+    B = np.asarray(B, dtype=float)
+    if _lapack_lu_solve is None:
+        return _getrs(factors.lu, factors.piv, B)
+    return _lapack_lu_solve((factors.lu, factors.piv), B, check_finite=False)
+
+def lu_inverse(factors):
+    """A⁻¹ dari hasil lu_factor (tanpa faktorisasi ulang)."""
+    if _lapack_lu_solve is None:
+        return _getrs(factors.lu, factors.piv, None)
+    return lu_solve(factors, np.eye(factors.lu.shape[0]))
+
+def _norm1(M):
+    M = np.abs(M)
+    return float(M.sum()) if M.ndim == 1 else float(M.sum(axis=0).max(initial=0.0))
+
+def near_singular(A, X, B=None):
+    """
+    True jika X = A⁻¹·B tidak berhingga atau ‖A‖₁·‖X‖₁/‖B‖₁ (batas bawah
+    cond₁(A); tepat cond₁ jika X = A⁻¹ dan B = None) melebihi 1/(n·eps).
+    Biayanya O(n²), tanpa faktorisasi tambahan.
+    """
+    if not np.all(np.isfinite(X)):
+        return True
+    b = 1.0 if B is None else _norm1(B)
+    if b == 0.0:
+        return False
+    n = max(A.shape[0], 1)
+    return _norm1(A) * _norm1(X) / b * n * np.finfo(float).eps >= 1.0
+
+def qr_factor(A):
+    """Faktorisasi QR yang di-cache."""
+    return factor_cache.factor(A, "qr", lambda M: tuple(np.linalg.qr(M)))
+
+def svd_factor(A, compute_uv=False):
+    """SVD yang di-cache; tanpa compute_uv hanya nilai singular."""
+    if compute_uv:
+        return factor_cache.factor(A, "svd_uv", lambda M: tuple(np.linalg.svd(M)))
+    return factor_cache.factor(A, "svd", lambda M: np.linalg.svd(M, compute_uv=False))
+
+# =======================================
+# Pembaruan inkremental (Sherman–Morrison–Woodbury)
+# =======================================
+# A  : salinan matriks yang diingat
+# inv: inversnya (None jika hanya faktor LU yang diketahui)
+# factors: hasil lu_factor (None jika hanya invers yang diketahui)
+# chain: berapa kali invers ini sudah dikoreksi dari hitung penuh
+_UpdateBase = namedtuple("_UpdateBase", ["A", "inv", "factors", "chain"])
+
+class InverseUpdater(LRUCache):
+    """
+    Mengingat matriks persegi yang baru diinvers / diselesaikan beserta
+    invers atau faktor LU-nya. Jika matriks berikutnya hanya berbeda di k
+    baris (atau k kolom), hasilnya dihitung dengan koreksi rank-k
+    Sherman–Morrison–Woodbury dalam O(k·n²) alih-alih O(n³):
+
+        (A + U·V)⁻¹ = A⁻¹ - A⁻¹U (I + V·A⁻¹U)⁻¹ V·A⁻¹
+
+    Koreksi ditolak (None → hitung penuh) jika I + V·A⁻¹U hampir singular,
+    hasilnya menunjukkan A baru hampir singular (near_singular), atau
+    residual uji terlalu besar.
+    """
+    MIN_N = 32                  # matriks kecil selalu dihitung penuh
+    MAX_RANK_FRACTION = 0.25    # k maksimum relatif terhadap n
+    MAX_CHAIN = 8               # koreksi beruntun sebelum wajib hitung penuh
+    MAX_CAPACITANCE_COND = 1e10     # batas cond(I + V·A⁻¹U)
+    RESIDUAL_TOL = 1e-8
+
+    def _usable(self, A):
+        return A.ndim == 2 and A.shape[0] == A.shape[1] >= self.MIN_N
+
+    def remember(self, A, inv=None, factors=None, chain=0):
+        A = np.asarray(A, dtype=float)
+        if not self._usable(A) or (inv is not None and not np.isfinite(inv).all()):
+            return
+        key = fingerprint(A)
+        if key in self._data and np.array_equal(self._data[key][0].A, A):
+            # Gabungkan dengan yang sudah diingat (mis. invers + faktor LU)
+            old = self._data[key][0]
+            inv = old.inv if inv is None else inv
+            factors = old.factors if factors is None else factors
+        inv = None if inv is None else np.array(inv)
+        self.put(key, _freeze(_UpdateBase(np.array(A), inv, factors, chain)))
+
+    def _nearest(self, A, need_inverse):
+        """(base, "row"/"col", indeks yang berubah) dengan k terkecil, atau None."""
+        limit = max(1, int(A.shape[0] * self.MAX_RANK_FRACTION))
+        best = None
+        for key, (base, _) in reversed(self._data.items()):
+            if (base.A.shape != A.shape or base.chain >= self.MAX_CHAIN
+                    or (need_inverse and base.inv is None)):
+                continue
+            diff = A != base.A
+            rows = np.flatnonzero(diff.any(axis=1))
+            cols = np.flatnonzero(diff.any(axis=0))
+            axis, idx = ("row", rows) if rows.size <= cols.size else ("col", cols)
+            if idx.size <= limit and (best is None or idx.size < best[3].size):
+                best = (key, base, axis, idx)
+                if idx.size == 0:
+                    break
+        if best is None:
+            self.misses += 1
+            return None
+        self.get(best[0])   # tandai baru dipakai
+        return best[1:]
+
+    @staticmethod
+    def _apply_inv(base, X):
+        """A_lama⁻¹ · X dari invers atau faktor LU yang diingat."""
+        return base.inv @ X if base.inv is not None else lu_solve(base.factors, X)
+
+    def _correction(self, base, A, axis, idx):
+        """
+        A = A_lama + U·V dengan U·V hanya di baris / kolom idx.
+        Mengembalikan (Z = A_lama⁻¹U, C = I + V·Z, fungsi X ↦ V·X) atau None
+        jika C hampir singular (koreksi tidak aman).
+        """
+        n, k = A.shape[0], idx.size
+        D = A[idx] - base.A[idx] if axis == "row" else A[:, idx] - base.A[:, idx]
+        if axis == "row":
+            V = lambda X: D @ X
+            if base.inv is not None:
+                Z = base.inv[:, idx]
+            else:
+                U = np.zeros((n, k))
+                U[idx, np.arange(k)] = 1.0
+                Z = lu_solve(base.factors, U)
+        else:
+            V = lambda X: X[idx]
+            Z = self._apply_inv(base, D)
+        C = np.eye(k) + V(Z)
+        if not np.isfinite(C).all() or np.linalg.cond(C) > self.MAX_CAPACITANCE_COND:
+            return None
+        return Z, C, V
+
+    def _residual_ok(self, A, X, B):
+        """Galat mundur ‖A·X - B‖ / (‖A‖·‖X‖ + ‖B‖), O(n²) per kolom."""
+        r = np.linalg.norm(A @ X - B)
+        scale = np.linalg.norm(A) * np.linalg.norm(X) + np.linalg.norm(B)
+        return np.isfinite(r) and r <= self.RESIDUAL_TOL * max(scale, 1e-300)
+
+    def inverse(self, A):
+        """Invers A lewat koreksi rank-k dari matriks yang diingat, atau None."""
+        A = np.asarray(A, dtype=float)
+        if not self._usable(A):
+            return None
+        found = self._nearest(A, need_inverse=True)
+        if found is None:
+            return None
+        base, axis, idx = found
+        if idx.size == 0:
+            return np.array(base.inv)
+        corr = self._correction(base, A, axis, idx)
+        if corr is None:
+            return None
+        Z, C, V = corr
+        Ainv = base.inv - Z @ np.linalg.solve(C, V(base.inv))
+        if near_singular(A, Ainv):
+            return None
+        # Uji dengan satu vektor: A·(A⁻¹w) ≈ w
+        w = np.random.default_rng(0).standard_normal(A.shape[0])
+        if not self._residual_ok(A, Ainv @ w, w):
+            return None
+        self.remember(A, inv=Ainv, chain=base.chain + 1)
+        return Ainv
+
+    def solve(self, A, B):
+        """Solusi A·X = B lewat koreksi rank-k dari matriks yang diingat, atau None."""
+        A = np.asarray(A, dtype=float)
+        if not self._usable(A):
+            return None
+        found = self._nearest(A, need_inverse=False)
+        if found is None:
+            return None
+        base, axis, idx = found
+        B = np.asarray(B, dtype=float)
+        Y = self._apply_inv(base, B)
+        if idx.size:
+            corr = self._correction(base, A, axis, idx)
+            if corr is None:
+                return None
+            Z, C, V = corr
+            Y = Y - Z @ np.linalg.solve(C, V(Y))
+        if near_singular(A, Y, B) or not self._residual_ok(A, Y, B):
+            return None
+        return Y
+
+inverse_updater = InverseUpdater(max_bytes=64 * 2**20)
+
+# =======================================
+# Operasi matriks umum
+# =======================================
+def det(A, exact=False):
+    """Determinannya dinamis. exact=True → Fraction eksak lewat Bareiss."""
+    if exact:
+        M, scales = to_integer_rows(A)
+        _require_square(M, "Determinan")
+        n = M.shape[0]
+        M, pivots, sign = bareiss_rref(M, n)
+        if len(pivots) < n:
+            return Fraction(0)
+        return Fraction(sign * int(M[n-1, n-1]) if n else 1, prod(scales))
+    factors = lu_factor(A)
+    with np.errstate(over="ignore"):
+        return float(factors.sign * np.exp(factors.logdet))
+
+def inverse(A):
+    """
+    Invers matriks dinamis. Jika A hanya berbeda beberapa baris / kolom dari
+    matriks yang baru diinvers, dipakai koreksi rank-k (InverseUpdater).
+    """
+    Ainv = inverse_updater.inverse(A)
+    if Ainv is not None:
+        return Ainv
+    A = np.asarray(A, dtype=float)
+    _require_square(A, "Invers")
+    factors = lu_factor(A)
+    try:
+        Ainv = None if factors.singular else lu_inverse(factors)
+    except np.linalg.LinAlgError:
+        Ainv = None
+    if Ainv is None or near_singular(A, Ainv):
+        raise ValueError("Matriks singular — tidak memiliki invers.")
+    inverse_updater.remember(A, inv=Ainv, factors=factors)
+    return Ainv
+
+def transpose(A):
+    """Transpose dinamis."""
+    return np.array(A, dtype=float).T
+
+def rank(A):
+    """Menghitung rank matriks secara dinamis."""
+    if isinstance(A, SparseMatrix):
+        return len(sparse_eliminate(A)["pivots"])
+    A = np.asarray(A, dtype=float)
+    if A.ndim < 2:
+        return int(np.any(A != 0))
+    S = svd_factor(A)
+    if S.size == 0:
+        return 0
+    tol = S.max() * max(A.shape) * np.finfo(float).eps
+    return int(np.count_nonzero(S > tol))
+
+# =======================================
+# Perkalian berantai (urutan kurung optimal)
+# =======================================
+def _chain_operand(M, i, n):
+    """Vektor di awal rantai = baris, di akhir = kolom; selain itu harus 2D."""
+    M = np.asarray(M, dtype=float)
+    if M.ndim == 1:
+        return M.reshape(1, -1) if i == 0 else M.reshape(-1, 1)
+    return M
+
+def matrix_chain_order(dims):
+    """
+    Pemrograman dinamis urutan perkalian M1·M2·…·Mn, dengan Mi berukuran
+    dims[i-1]×dims[i]. Mengembalikan (FLOP minimum, tabel split).
+    Biaya (p×q)·(q×r) dihitung 2·p·q·r FLOP.
+    """
+    n = len(dims) - 1
+    cost = [[0] * n for _ in range(n)]
+    split = [[0] * n for _ in range(n)]
+    for length in range(2, n + 1):
+        for i in range(n - length + 1):
+            j = i + length - 1
+            best = None
+            for k in range(i, j):
+                c = cost[i][k] + cost[k + 1][j] + 2 * dims[i] * dims[k + 1] * dims[j + 1]
+                if best is None or c < best:
+                    best, split[i][j] = c, k
+            cost[i][j] = best
+    return (cost[0][n - 1] if n else 0), split
+
+def _chain_naive_flops(dims):
+    """FLOP urutan kiri-ke-kanan ((M1·M2)·M3)·…"""
+    return sum(2 * dims[0] * dims[k] * dims[k + 1] for k in range(1, len(dims) - 1))
+
+def _chain_paren(split, i, j, names):
+    if i == j:
+        return names[i]
+    k = split[i][j]
+    return f"({_chain_paren(split, i, k, names)} × {_chain_paren(split, k + 1, j, names)})"
+
+def _chain_execute(mats, split, i, j):
+    if i == j:
+        return mats[i]
+    k = split[i][j]
+    return _chain_execute(mats, split, i, k) @ _chain_execute(mats, split, k + 1, j)
+
+def chain_multiply(matrices, names=None):
+    """
+    Kalikan daftar matriks dengan urutan kurung termurah.
+    Mengembalikan (hasil, info) dengan info = {"plan", "flops", "naive_flops"}.
+    """
+    n = len(matrices)
+    if n == 0:
+        raise ValueError("Rantai perkalian kosong.")
+    names = names or [f"M{i+1}" for i in range(n)]
+    mats = [_chain_operand(M, i, n) for i, M in enumerate(matrices)]
+    for i in range(n - 1):
+        if mats[i].shape[1] != mats[i + 1].shape[0]:
+            raise ValueError(f"Dimensi tidak cocok: {names[i]} {mats[i].shape} × "
+                             f"{names[i+1]} {mats[i+1].shape}.")
+    dims = [mats[0].shape[0]] + [M.shape[1] for M in mats]
+    flops, split = matrix_chain_order(dims)
+    result = _chain_execute(mats, split, 0, n - 1)
+    info = {"plan": _chain_paren(split, 0, n - 1, names), "flops": flops,
+            "naive_flops": _chain_naive_flops(dims)}
+    return result, info
+
+# =======================================
+# Solver iteratif (CG / GMRES / Jacobi / Gauss-Seidel)
+# =======================================
+# x: solusi terakhir, residuals: ‖b - A·x‖ / ‖b‖ per iterasi (indeks 0 = tebakan awal)
+IterativeResult = namedtuple("IterativeResult", ["x", "converged", "iterations", "residuals"])
+
+def _linear_operator(A, n, diag=None):
+    """
+    (matvec, diagonal) untuk ndarray, SparseMatrix, atau fungsi matvec(x).
+    Untuk fungsi, diagonal hanya tersedia jika diberikan lewat diag.
+    """
+    if isinstance(A, SparseMatrix):
+        matvec, d = A.matvec, A.diagonal()
+        shape = A.shape
+    elif callable(A):
+        matvec, d, shape = A, None, (n, n)
+    else:
+        M = np.asarray(A, dtype=float)
+        if M.ndim != 2:
+            raise ValueError("Solver iteratif butuh matriks 2D.")
+        matvec, d, shape = (lambda x: M @ x), M.diagonal().copy(), M.shape
+    if shape != (n, n):
+        raise ValueError(f"Solver iteratif butuh matriks persegi {n}×{n}, diberikan {shape[0]}×{shape[1]}.")
+    if diag is not None:
+        d = np.asarray(diag, dtype=float)
+    return matvec, d
+
+def _inverse_diagonal(d):
+    if d is None:
+        raise ValueError("Diagonal matriks tidak diketahui — berikan diag=... untuk matvec.")
+    if np.any(d == 0):
+        raise ValueError("Diagonal memuat nol — prekondisi / iterasi Jacobi tidak bisa dipakai.")
+    return 1.0 / d
+
+def _iterative_setup(A, b, x0, diag):
+    b = np.asarray(b, dtype=float)
+    if b.ndim == 2 and b.shape[1] == 1:
+        b = b[:, 0]
+    if b.ndim != 1:
+        raise ValueError("Solver iteratif butuh satu ruas kanan (vektor b).")
+    n = b.size
+    matvec, d = _linear_operator(A, n, diag)
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
+    b_norm = np.linalg.norm(b) or 1.0
+    return b, matvec, d, x, b_norm
+
+def _iterative_result(x, k, residuals, tol):
+    residuals = [float(v) for v in residuals]
+    return IterativeResult(x, residuals[-1] <= tol, k, residuals)
+
+def conjugate_gradient(A, b, x0=None, tol=1e-8, maxiter=None, precondition=False,
+                       diag=None, progress=None):
+    """
+    Conjugate gradient untuk A simetris positif definit.
+    precondition=True memakai prekondisi Jacobi (M = diag(A)).
+    A boleh ndarray, SparseMatrix, atau fungsi matvec(x); progress(k, maxiter, None)
+    dipanggil tiap iterasi (boleh melempar untuk membatalkan).
+    """
+    b, matvec, d, x, b_norm = _iterative_setup(A, b, x0, diag)
+    maxiter = maxiter or 10 * b.size
+    inv_d = _inverse_diagonal(d) if precondition else None
+    r = b - matvec(x)
+    z = r * inv_d if precondition else r
+    p = z.copy()
+    rz = r @ z
+    residuals = [np.linalg.norm(r) / b_norm]
+    k = 0
+    while residuals[-1] > tol and k < maxiter:
+        k += 1
+        Ap = matvec(p)
+        pAp = p @ Ap
+        if pAp <= 0:
+            raise ValueError("Matriks tidak positif definit — CG tidak bisa dipakai (coba GMRES).")
+        alpha = rz / pAp
+        x += alpha * p
+        r -= alpha * Ap
+        residuals.append(np.linalg.norm(r) / b_norm)
+        z = r * inv_d if precondition else r
+        rz, rz_old = r @ z, rz
+        p = z + (rz / rz_old) * p
+        if progress:
+            progress(k, maxiter, None)
+    return _iterative_result(x, k, residuals, tol)
+
+def gmres(A, b, x0=None, tol=1e-8, maxiter=None, restart=30, precondition=False,
+          diag=None, progress=None):
+    """
+    GMRES dengan restart untuk A umum (tidak harus simetris).
+    precondition=True memakai prekondisi Jacobi dari kanan, sehingga residual
+    yang dilaporkan tetap residual sistem asli. maxiter = total iterasi Arnoldi.
+    """
+    b, matvec, d, x, b_norm = _iterative_setup(A, b, x0, diag)
+    n = b.size
+    maxiter = maxiter or 10 * n
+    restart = max(1, min(restart, n))
+    inv_d = _inverse_diagonal(d) if precondition else np.ones(n)
+    r = b - matvec(x)
+    residuals = [np.linalg.norm(r) / b_norm]
+    k = 0
+    while residuals[-1] > tol and k < maxiter:
+        beta = np.linalg.norm(r)
+        m = min(restart, maxiter - k)
+        Q = np.zeros((m + 1, n))
+        H = np.zeros((m + 1, m))
+        cs, sn = np.zeros(m), np.zeros(m)
+        g = np.zeros(m + 1)
+        g[0] = beta
+        Q[0] = r / beta
+        j = 0
+        while j < m:
+            # Arnoldi (Gram-Schmidt termodifikasi) pada A·M⁻¹
+            w = matvec(inv_d * Q[j])
+            for i in range(j + 1):
+                H[i, j] = Q[i] @ w
+                w -= H[i, j] * Q[i]
+            H[j + 1, j] = np.linalg.norm(w)
+            if H[j + 1, j] > 1e-14 * beta:
+                Q[j + 1] = w / H[j + 1, j]
+            # Rotasi Givens sebelumnya, lalu rotasi baru untuk H[j+1, j]
+            for i in range(j):
+                H[i, j], H[i + 1, j] = (cs[i] * H[i, j] + sn[i] * H[i + 1, j],
+                                        -sn[i] * H[i, j] + cs[i] * H[i + 1, j])
+            h = np.hypot(H[j, j], H[j + 1, j])
+            cs[j], sn[j] = (H[j, j] / h, H[j + 1, j] / h) if h else (1.0, 0.0)
+            H[j, j], H[j + 1, j] = h, 0.0
+            g[j], g[j + 1] = cs[j] * g[j], -sn[j] * g[j]
+            j += 1
+            k += 1
+            residuals.append(abs(g[j]) / b_norm)
+            if progress:
+                progress(k, maxiter, None)
+            if residuals[-1] <= tol or not Q[j].any():
+                break
+        # Selesaikan H·y = g (segitiga atas) lalu perbarui x
+        y = np.zeros(j)
+        for i in range(j - 1, -1, -1):
+            if H[i, i] == 0:
+                raise ValueError("Matriks singular — GMRES berhenti (breakdown).")
+            y[i] = (g[i] - H[i, i+1:j] @ y[i+1:]) / H[i, i]
+        x += inv_d * (Q[:j].T @ y)
+        r = b - matvec(x)
+        # Residual sebenarnya di akhir siklus (estimasi Givens bisa sedikit meleset)
+        residuals[-1] = np.linalg.norm(r) / b_norm
+    return _iterative_result(x, k, residuals, tol)
+
+def jacobi(A, b, x0=None, tol=1e-8, maxiter=None, diag=None, progress=None):
+    """
+    Iterasi Jacobi: x ← x + D⁻¹(b - A·x). Konvergen untuk A dominan diagonal.
+    Cukup matvec + diagonal, jadi A boleh fungsi matvec(x) dengan diag=....
+    """
+    b, matvec, d, x, b_norm = _iterative_setup(A, b, x0, diag)
+    maxiter = maxiter or 10 * b.size
+    inv_d = _inverse_diagonal(d)
+    r = b - matvec(x)
+    residuals = [np.linalg.norm(r) / b_norm]
+    k = 0
+    while residuals[-1] > tol and k < maxiter and np.isfinite(residuals[-1]):
+        k += 1
+        x += inv_d * r
+        r = b - matvec(x)
+        residuals.append(np.linalg.norm(r) / b_norm)
+        if progress:
+            progress(k, maxiter, None)
+    return _iterative_result(x, k, residuals, tol)
+
+def gauss_seidel(A, b, x0=None, tol=1e-8, maxiter=None, progress=None):
+    """
+    Iterasi Gauss-Seidel (sapuan maju, nilai baru langsung dipakai).
+    Butuh elemen per baris, jadi A harus ndarray atau SparseMatrix (bukan matvec).
+    """
+    if callable(A) and not isinstance(A, SparseMatrix):
+        raise ValueError("Gauss-Seidel butuh matriks (ndarray / SparseMatrix), bukan matvec.")
+    b, matvec, d, x, b_norm = _iterative_setup(A, b, x0, None)
+    maxiter = maxiter or 10 * b.size
+    _inverse_diagonal(d)
+    if isinstance(A, SparseMatrix):
+        rows = [A.row(i) for i in range(b.size)]
+        row_dot = lambda i: rows[i][1] @ x[rows[i][0]]
+    else:
+        M = np.asarray(A, dtype=float)
+        row_dot = lambda i: M[i] @ x
+    residuals = [np.linalg.norm(b - matvec(x)) / b_norm]
+    k = 0
+    while residuals[-1] > tol and k < maxiter and np.isfinite(residuals[-1]):
+        k += 1
+        for i in range(b.size):
+            x[i] += (b[i] - row_dot(i)) / d[i]
+        residuals.append(np.linalg.norm(b - matvec(x)) / b_norm)
+        if progress:
+            progress(k, maxiter, None)
+    return _iterative_result(x, k, residuals, tol)
+
+ITERATIVE_METHODS = {
+    "cg": conjugate_gradient, "gmres": gmres,
+    "jacobi": jacobi, "gauss_seidel": gauss_seidel,
+}
+
+def solve_iterative(A, b, method="cg", **options):
+    """Pilih solver iteratif lewat nama (lihat ITERATIVE_METHODS)."""
+    if method not in ITERATIVE_METHODS:
+        raise ValueError(f"Metode iteratif tidak dikenal: {method}")
+    return ITERATIVE_METHODS[method](A, b, **options)
+
+# =======================================
+# Operasi vektor dinamis
+# =======================================
+def _vec(u):
+    """Vektor padat dari list / array / SparseMatrix 1×n atau n×1."""
+    if isinstance(u, SparseMatrix):
+        return u.to_dense().ravel()
+    return np.array(u, dtype=float)
+
+def vec_add(u, v):
+    return _vec(u) + _vec(v)
+
+def vec_sub(u, v):
+    return _vec(u) - _vec(v)
+
+def dot(u, v):
+    return float(np.dot(_vec(u), _vec(v)))
+
+def cross(u, v):
+    return np.cross(_vec(u), _vec(v))
+
+def norm(u):
+    if isinstance(u, SparseMatrix):
+        return float(np.linalg.norm(u.data))
+    return float(np.linalg.norm(np.array(u, dtype=float)))
+
+def projection(u, v):
+    u = _vec(u)
+    v = _vec(v)
+    if np.allclose(v, 0):
+        raise ValueError("Tidak dapat memproyeksikan ke vektor nol.")
+    return (np.dot(u, v) / np.dot(v, v)) * v
+
+def angle_between(u, v):
+    u = _vec(u)
+    v = _vec(v)
+    cos = np.dot(u, v) / (np.linalg.norm(u) * np.linalg.norm(v))
+    cos = max(min(cos, 1.0), -1.0)
+    return np.arccos(cos)
@@ -0,0 +1,128 @@
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import numpy as np
+
+# Urutan fase pada ringkasan
+PHASES = ["parse", "cache", "solve", "format", "render"]
+
+# =======================================
+# Pelacakan memori (opsional)
+# =======================================
+def set_memory_tracing(enabled):
+    """Nyalakan / matikan tracemalloc untuk seluruh proses."""
+    if enabled and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not enabled and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+# =======================================
+# Satu operasi
+# =======================================
+class PhaseTimer:
+    """
+    Mengukur waktu setiap fase satu operasi (parse, cache, solve, format, render).
+    trace_memory=True juga mencatat memori puncak per fase lewat tracemalloc
+    (lebih lambat, jadi opsional; lihat set_memory_tracing). Fase yang sama
+    boleh diukur berkali-kali; waktunya dijumlahkan.
+    """
+    def __init__(self, operation, trace_memory=False):
+        self.operation = operation
+        self.trace_memory = trace_memory
+        self.phases = {}
+
+    @contextmanager
+    def phase(self, name):
+        trace = self.trace_memory and tracemalloc.is_tracing()
+        if trace:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            entry = self.phases.setdefault(name, {"time": 0.0})
+            entry["time"] += time.perf_counter() - t0
+            if trace:
+                peak = tracemalloc.get_traced_memory()[1] - base
+                entry["peak_bytes"] = max(entry.get("peak_bytes", 0), peak)
+
+    def total(self):
+        return sum(p["time"] for p in self.phases.values())
+
+    def as_dict(self):
+        return {"operation": self.operation, "total": self.total(),
+                "phases": {k: dict(v) for k, v in self.phases.items()}}
+
+    def summary(self):
+        return summarize(self.as_dict())
+
+def summarize(metrics):
+    """Ringkasan satu baris dari as_dict(), mis. "parse 0.4 ms · solve 12.1 ms · ..."."""
+    phases = metrics["phases"]
+    names = [p for p in PHASES if p in phases] + [p for p in phases if p not in PHASES]
+    parts = []
+    for name in names:
+        p = phases[name]
+        text = f"{name} {p['time'] * 1000:.1f} ms"
+        if "peak_bytes" in p:
+            text += f" ({p['peak_bytes'] / 2**20:.1f} MiB)"
+        parts.append(text)
+    return " · ".join(parts) + f" — total {metrics['total'] * 1000:.1f} ms"
+
+# =======================================
+# Kumpulan metrik (agregat per operasi)
+# =======================================
+class MetricsLog:
+    """Menyimpan metrik semua operasi dan menghitung count / p50 / p95 per fase."""
+    def __init__(self):
+        self._records = []
+        self._lock = threading.Lock()
+
+    def add(self, metrics):
+        with self._lock:
+            self._records.append(metrics)
+
+    def __len__(self):
+        return len(self._records)
+
+    def aggregates(self):
+        """{operasi: {fase: {count, p50, p95[, peak_p95]}}}, waktu dalam detik."""
+        with self._lock:
+            records = list(self._records)
+        grouped = {}
+        for rec in records:
+            phases = dict(rec["phases"], total={"time": rec["total"]})
+            for name, p in phases.items():
+                g = grouped.setdefault(rec["operation"], {}).setdefault(name, {"time": [], "peak": []})
+                g["time"].append(p["time"])
+                if "peak_bytes" in p:
+                    g["peak"].append(p["peak_bytes"])
+        out = {}
+        for op, phases in grouped.items():
+            out[op] = {}
+            for name, g in phases.items():
+                t = np.array(g["time"])
+                row = {"count": int(t.size), "p50": float(np.percentile(t, 50)),
+                       "p95": float(np.percentile(t, 95))}
+                if g["peak"]:
+                    row["peak_p95"] = float(np.percentile(g["peak"], 95))
+                out[op][name] = row
+        return out
+
+    def export(self, filename):
+        """Tulis agregat (dan jumlah record) ke file JSON."""
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump({"records": len(self), "aggregates": self.aggregates()},
+                      f, indent=2, ensure_ascii=False)
+
+    def clear(self):
+        with self._lock:
+            self._records = []
+
+
+# Log bersama untuk satu sesi aplikasi
+metrics_log = MetricsLog()
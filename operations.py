@@ -0,0 +1,343 @@
+import re
+from bisect import bisect_right
+
+import numpy as np
+
+from matrix_utils import (
+    StepTrace, solve_obe, cetak_matriks, solve_homogeneous,
+    det, inverse, rref_with_steps,
+    norm, projection, angle_between, fmt, chain_multiply, solve_iterative
+)
+from expr_utils import evaluate_expression
+from format_utils import format_row, format_scalar
+from cache_utils import ResultCache
+
+class OperationCancelled(Exception):
+    """Dilempar dari callback progress untuk membatalkan operasi yang berjalan."""
+
+
+class OperationOutput:
+    """
+    Baris output operasi. Teks biasa disimpan apa adanya, StepTrace disimpan
+    utuh dan baru dirender saat baris itu diminta. Bisa dipakai seperti list
+    of str (len, iterasi, indeks / slice).
+    """
+    def __init__(self):
+        self._parts = []        # list of str atau StepTrace
+        self._starts = None     # indeks awal tiap bagian (dibangun saat dibaca)
+
+    def append(self, text):
+        if not self._parts or not isinstance(self._parts[-1], list):
+            self._parts.append([])
+        self._parts[-1].append(text)
+        self._starts = None
+
+    def append_matrix(self, header, M):
+        """Baris "header\nmatriks"; matriks baru diformat saat baris itu dibaca."""
+        self.append((header, M))
+
+    @staticmethod
+    def _line(item):
+        if isinstance(item, tuple):
+            header, M = item
+            return f"{header}\n{cetak_matriks(M)}"
+        return item
+
+    def extend(self, lines):
+        if isinstance(lines, StepTrace):
+            self._parts.append(lines)
+            self._starts = None
+        else:
+            for t in lines:
+                self.append(t)
+
+    @property
+    def nbytes(self):
+        """Perkiraan memori output (untuk batas byte ResultCache)."""
+        n = 0
+        for part in self._parts:
+            if isinstance(part, StepTrace):
+                n += part.nbytes
+                continue
+            for item in part:
+                if isinstance(item, tuple):
+                    n += len(item[0]) + np.asarray(item[1]).nbytes
+                else:
+                    n += len(item)
+        return n
+
+    def _offsets(self):
+        if self._starts is None:
+            self._starts, n = [], 0
+            for part in self._parts:
+                self._starts.append(n)
+                n += len(part)
+            self._len = n
+        return self._starts
+
+    def __len__(self):
+        self._offsets()
+        return self._len
+
+    def __iter__(self):
+        for part in self._parts:
+            if isinstance(part, StepTrace):
+                yield from part
+            else:
+                yield from map(self._line, part)
+
+    def _pieces(self, start, stop):
+        """(bagian, awal, akhir) lokal yang mencakup baris start..stop-1."""
+        starts = self._offsets()
+        k = max(bisect_right(starts, start) - 1, 0)
+        while k < len(self._parts) and starts[k] < stop:
+            base = starts[k]
+            lo, hi = max(start - base, 0), min(stop - base, len(self._parts[k]))
+            if lo < hi:
+                yield self._parts[k], lo, hi
+            k += 1
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            out = []
+            for part, lo, hi in self._pieces(start, stop):
+                if isinstance(part, StepTrace):
+                    out.extend(part[lo:hi])
+                else:
+                    out.extend(map(self._line, part[lo:hi]))
+            return out
+        n = len(self)
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError("indeks output di luar jangkauan")
+        return self[idx:idx + 1][0]
+
+    def snapshots(self, start, stop, copy=True):
+        """Seperti StepTrace.snapshots: (judul/teks, matriks atau None) per baris."""
+        out = []
+        for part, lo, hi in self._pieces(start, min(stop, len(self))):
+            if isinstance(part, StepTrace):
+                out.extend(part.snapshots(lo, hi, copy))
+            else:
+                out.extend(t if isinstance(t, tuple) else (t, None) for t in part[lo:hi])
+        return out
+
+
+# Daftar operasi (dipakai op_combo di WindowProses dan batch_runner)
+OPERATIONS = [
+    "Non-homogen (A·x = B)",
+    "Homogen (A·x = 0)",
+    "OBE",
+    "Determinan A",
+    "Determinan B",
+    "Inverse A",
+    "Inverse B",
+    "A + B",
+    "A - B",
+    "A × B",
+    "B × A",
+    "Transpose (Aᵗ)",
+    "Transpose (Bᵗ)",
+    "Pengenalan Jenis Matriks A",
+    "Pengenalan Jenis Matriks B",
+    "Penjumlahan Vektor",
+    "Pengurangan Vektor",
+    "Dot Product (A·B)",
+    "Cross Product (A×B)",
+    "Panjang (Norma) Vektor u",
+    "Panjang (Norma) Vektor v",
+    "Proyeksi u ke arah v",
+    "Sudut antara u dan v",
+    "Ekspresi Matriks",
+    "Perkalian Berantai",
+    "CG iteratif (A·x = B)",
+    "GMRES iteratif (A·x = B)",
+    "Jacobi iteratif (A·x = B)",
+    "Gauss-Seidel iteratif (A·x = B)",
+]
+
+# Operasi yang membaca kotak A sebagai teks (bukan matriks)
+TEXT_OPERATIONS = {"Ekspresi Matriks", "Perkalian Berantai"}
+
+# Solver iteratif: operasi → (metode, opsi). A SPD selalu berdiagonal positif,
+# jadi CG aman memakai prekondisi Jacobi.
+ITERATIVE_OPERATIONS = {
+    "CG iteratif (A·x = B)": ("cg", {"precondition": True}),
+    "GMRES iteratif (A·x = B)": ("gmres", {}),
+    "Jacobi iteratif (A·x = B)": ("jacobi", {}),
+    "Gauss-Seidel iteratif (A·x = B)": ("gauss_seidel", {}),
+}
+# Baris riwayat residual maksimum di output (iterasi diambil merata)
+RESIDUAL_LINES = 50
+
+# Cache hasil operasi bersama (tingkat disk diaktifkan di main.py).
+# TEXT_OPERATIONS tidak di-cache: hasilnya bergantung pada isi matriks bernama.
+result_cache = ResultCache(max_bytes=128 * 2**20)
+
+
+# ====================================================
+# PARSING INPUT
+# ====================================================
+def parse_matrix(txt):
+    lines = [l.strip() for l in txt.splitlines() if l.strip()]
+    mat = [[float(x) for x in ln.split()] for ln in lines]
+    return np.array(mat, dtype=float)
+
+def parse_vector(txt):
+    vals = [float(x) for x in txt.split()]
+    return np.array(vals, dtype=float)
+
+def parse_input(txt):
+    """Teks multi-baris dibaca sebagai matriks, satu baris sebagai vektor."""
+    txt = txt.strip()
+    return parse_matrix(txt) if "\n" in txt else parse_vector(txt)
+
+
+# ====================================================
+# ANALISIS JENIS MATRIKS
+# ====================================================
+def analyze_matrix(M, label="A"):
+    """Analisis jenis matriks"""
+    info = [f"Jenis Matriks {label}:"]
+    rows, cols = M.shape
+    info.append(f"Ukuran: {rows}×{cols}")
+    if rows == cols:
+        info.append("Persegi")
+        if np.allclose(M, np.eye(rows)): info.append("Identitas")
+        if np.allclose(M, M.T): info.append("Simetris")
+        if np.allclose(M, np.triu(M)): info.append("Segitiga Atas")
+        if np.allclose(M, np.tril(M)): info.append("Segitiga Bawah")
+        if np.count_nonzero(M - np.diag(np.diag(M))) == 0: info.append("Diagonal")
+        info.append("Singular (det=0)" if round(det(M)) == 0 else "Non-Singular (det≠0)")
+    else:
+        info.append("Bukan persegi")
+    return info
+
+
+# ====================================================
+# LAPORAN SOLVER ITERATIF
+# ====================================================
+def report_iterative(out, res):
+    """Status, riwayat residual (diringkas), dan solusi hasil solve_iterative."""
+    if res.converged:
+        out.append(f"Status: konvergen dalam {res.iterations} iterasi")
+    else:
+        out.append(f"Status: tidak konvergen setelah {res.iterations} iterasi")
+    out.append("Riwayat residual ‖b - A·x‖ / ‖b‖:")
+    n = len(res.residuals)
+    for k in np.unique(np.linspace(0, n - 1, min(n, RESIDUAL_LINES)).astype(int)):
+        out.append(f"  iterasi {k}: {res.residuals[k]:.3e}")
+    out.append("\n=== Solusi (iteratif) ===")
+    for i, val in enumerate(res.x, start=1):
+        out.append(f"x{i} = {fmt(val)}")
+
+
+# ====================================================
+# OPERASI UTAMA
+# ====================================================
+def run_operation(op, A, B=None, with_steps=True, progress=None, matrices=None):
+    """
+    Menjalankan satu operasi (nama sesuai OPERATIONS) pada A dan B.
+    Mengembalikan OperationOutput (baris output, langkah dirender malas).
+    Tidak bergantung pada Qt.
+    progress(k, n, steps) diteruskan ke eliminasi (lihat rref_with_steps).
+    Untuk TEXT_OPERATIONS, A berupa teks dan matrices = matriks bernama.
+    """
+    out = OperationOutput()
+    if op == "Non-homogen (A·x = B)":
+        res, steps, status = solve_obe(A, B, with_steps=with_steps, progress=progress)
+        if isinstance(status, str):
+            out.append(f"Status: {status}")
+        else:
+            out.append("Status per kolom: " + ", ".join(status))
+        out.extend(steps)
+
+    elif op == "Homogen (A·x = 0)":
+        free_vars, basis, _ = solve_homogeneous(A, with_steps=with_steps, progress=progress)
+        if not basis:
+            out.append("Hanya solusi trivial (x=0).")
+        else:
+            out.append(f"Free vars: {free_vars}")
+            for i, v in enumerate(basis):
+                out.append(f"Basis vector {i+1}: [{format_row(v, ', ')}]")
+
+    elif op == "A + B":
+        out.append_matrix("A + B =", A + B)
+    elif op == "A - B":
+        out.append_matrix("A - B =", A - B)
+    elif op == "A × B":
+        out.append_matrix("A × B =", A @ B)
+    elif op == "B × A":
+        out.append_matrix("B × A =", B @ A)
+    elif op == "Transpose (Aᵗ)":
+        out.append_matrix("Aᵗ =", A.T)
+    elif op == "Transpose (Bᵗ)":
+        out.append_matrix("Bᵗ =", B.T)
+    elif op == "Determinan A":
+        out.append(f"det(A) = {fmt(det(A))}")
+    elif op == "Determinan B":
+        out.append(f"det(B) = {fmt(det(B))}")
+    elif op == "Inverse A":
+        out.append_matrix("A⁻¹ =", inverse(A))
+    elif op == "Inverse B":
+        out.append_matrix("B⁻¹ =", inverse(B))
+    elif op == "OBE":
+        R, piv, steps = rref_with_steps(A, with_steps=with_steps, progress=progress)
+        out.append_matrix("Hasil OBE:", R)
+        out.extend(steps)
+    elif op == "Pengenalan Jenis Matriks A":
+        out.extend(analyze_matrix(A, "A"))
+    elif op == "Pengenalan Jenis Matriks B":
+        out.extend(analyze_matrix(B, "B"))
+    elif op == "Penjumlahan Vektor":
+        out.append(f"A + B = [{format_row(A + B, ', ')}]")
+    elif op == "Pengurangan Vektor":
+        out.append(f"A - B = [{format_row(A - B, ', ')}]")
+    elif op == "Dot Product (A·B)":
+        out.append(f"A·B = {fmt(np.dot(A, B))}")
+    elif op == "Cross Product (A×B)":
+        out.append(f"A×B = [{format_row(np.cross(A, B), ', ')}]")
+    elif op == "Panjang (Norma) Vektor u":
+        out.append(f"‖A‖ = {format_scalar(norm(A), 6)}")
+    elif op == "Panjang (Norma) Vektor v":
+        out.append(f"‖B‖ = {format_scalar(norm(B), 6)}")
+    elif op == "Proyeksi u ke arah v":
+        proj = projection(A, B)
+        out.append(f"Proyeksi A ke arah B = [{format_row(proj, ', ')}]")
+    elif op == "Sudut antara u dan v":
+        theta = angle_between(A, B)
+        out.append(f"Sudut antara A dan B = {fmt(np.degrees(theta))}°")
+    elif op == "Ekspresi Matriks":
+        graph, values = evaluate_expression(A, matrices or {})
+        plan = graph.plan()
+        out.append(f"Rencana ({len(plan) - len(values)} langkah, "
+                   f"{graph.rewrites} penulisan ulang):\n" + "\n".join(plan))
+        for name, value in values.items():
+            if np.ndim(value) == 0:
+                out.append(f"{name} = {fmt(value)}")
+            else:
+                out.append_matrix(f"{name} =", value)
+    elif op == "Perkalian Berantai":
+        # A: nama matriks berurutan, mis. "A B C" atau "A × B × C"
+        names = [t for t in re.split(r"[\s,@*×]+", A) if t]
+        missing = [n for n in names if n not in (matrices or {})]
+        if missing:
+            raise ValueError(f"Matriks tidak ditemukan: {', '.join(missing)}")
+        result, info = chain_multiply([matrices[n] for n in names], names)
+        saving = info["naive_flops"] / info["flops"] if info["flops"] else 1.0
+        out.append(f"Urutan optimal: {info['plan']}")
+        out.append(f"FLOP: {info['flops']:,} (urutan kiri-ke-kanan: {info['naive_flops']:,}, "
+                   f"{saving:.1f}× lebih hemat)")
+        out.append_matrix(f"{' × '.join(names)} =", result)
+    elif op in ITERATIVE_OPERATIONS:
+        if B is None:
+            raise ValueError("Vektor B (ruas kanan) diperlukan.")
+        method, options = ITERATIVE_OPERATIONS[op]
+        report_iterative(out, solve_iterative(A, B, method, progress=progress, **options))
+    else:
+        raise ValueError(f"Operasi tidak dikenal: {op}")
+    return out
@@ -1,16 +1,17 @@
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit, QLabel,
-    QFileDialog, QMessageBox, QComboBox, QGroupBox
+    QFileDialog, QMessageBox, QComboBox, QGroupBox, QProgressBar, QCheckBox
 )
-from PyQt6.QtCore import Qt
-import os, json, numpy as np
+from PyQt6.QtCore import Qt, QThreadPool
+import os, json
 
-from matrix_utils import (
-    solve_obe, cetak_matriks, solve_homogeneous,
-    det, inverse, rref_with_steps,
-    norm, projection, angle_between
+from operations import (
+    OPERATIONS, TEXT_OPERATIONS, analyze_matrix, parse_matrix, parse_vector, result_cache
 )
-from history import History
+from history import get_history
+from worker import OperationWorker
+from step_viewer import StepViewer
+from metrics_utils import PhaseTimer, metrics_log, set_memory_tracing
 
 
 class WindowProses(QWidget):
@@ -21,12 +22,17 @@ class WindowProses(QWidget):
     def __init__(self, stacked=None, parent=None):
         super().__init__(parent)
         self.stacked = stacked
-        self.history = History()
+        self.history = get_history()
         self.tests_file = os.path.join(os.path.dirname(__file__), "user_tests.json")
+        # Satu thread operasi: run berikutnya otomatis mengantre
+        self.pool = QThreadPool()
+        self.pool.setMaxThreadCount(1)
+        self.workers = []
         self._build_ui()
         self.last_result = None
         self.last_steps = None
         self.last_status = None
+        self.last_metrics = None
 
 
     # ====================================================
@@ -41,31 +47,7 @@ class WindowProses(QWidget):
         op_layout = QHBoxLayout()
         op_layout.addWidget(QLabel("Pilih Operasi:"))
         self.op_combo = QComboBox()
-        self.op_combo.addItems([
-            "Non-homogen (A·x = B)",
-            "Homogen (A·x = 0)",
-            "OBE",
-            "Determinan A",
-            "Determinan B",
-            "Inverse A",
-            "Inverse B",
-            "A + B",
-            "A - B",
-            "A × B",
-            "B × A",
-            "Transpose (Aᵗ)",
-            "Transpose (Bᵗ)",
-            "Pengenalan Jenis Matriks A",
-            "Pengenalan Jenis Matriks B",
-            "Penjumlahan Vektor",
-            "Pengurangan Vektor",
-            "Dot Product (A·B)",
-            "Cross Product (A×B)",
-            "Panjang (Norma) Vektor u",
-            "Panjang (Norma) Vektor v",
-            "Proyeksi u ke arah v",
-            "Sudut antara u dan v"
-        ])
+        self.op_combo.addItems(OPERATIONS)
         op_layout.addWidget(self.op_combo)
         layout.addLayout(op_layout)
 
@@ -81,7 +63,8 @@ class WindowProses(QWidget):
         in_layout.addWidget(self.comboA)
 
         self.textA = QTextEdit()
-        self.textA.setPlaceholderText("contoh matriks:\n1 2 3\n4 5 6\natau vektor:\n1 2 3")
+        self.textA.setPlaceholderText("contoh matriks:\n1 2 3\n4 5 6\natau vektor:\n1 2 3\n"
+                                      "atau ekspresi (Ekspresi Matriks):\nX = inv(A) @ B + Aᵗ @ B")
         in_layout.addWidget(self.textA)
 
         lblB = QLabel("Matriks / Vektor B (opsional):")
@@ -117,16 +100,49 @@ class WindowProses(QWidget):
             btn_layout.addWidget(b)
         layout.addLayout(btn_layout)
 
+        # Progress & pembatalan operasi yang berjalan di background
+        run_layout = QHBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setFormat("Pivot %v dari %m")
+        self.progress_bar.setValue(0)
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self.on_cancel)
+        self.queue_check = QCheckBox("Antrekan run berikutnya")
+        self.queue_check.setToolTip("Jika tidak dicentang, run baru menggantikan run yang sedang berjalan.")
+        self.steps_check = QCheckBox("Tampilkan langkah OBE")
+        self.steps_check.setChecked(True)
+        self.steps_check.setToolTip("Tanpa langkah, sistem persegi diselesaikan lewat LU; setelah "
+                                    "mengubah beberapa baris matriks, hasilnya cukup dikoreksi.")
+        run_layout.addWidget(self.progress_bar, stretch=1)
+        run_layout.addWidget(self.steps_check)
+        run_layout.addWidget(self.queue_check)
+        run_layout.addWidget(self.cancel_btn)
+        layout.addLayout(run_layout)
+
         # Output area
-        self.steps_area = QTextEdit()
-        self.steps_area.setReadOnly(True)
-        self.steps_area.setPlaceholderText("Langkah dan hasil operasi akan tampil di sini...")
-        font = self.steps_area.font()
+        # Langkah ditampilkan per halaman (lihat StepViewer)
+        self.steps_area = StepViewer()
+        font = self.steps_area.browser.font()
         font.setPointSize(12)
-        self.steps_area.setFont(font)
+        self.steps_area.browser.setFont(font)
         self.steps_area.setMinimumHeight(120)
         layout.addWidget(self.steps_area, stretch=2)
 
+        # Ringkasan waktu (dan memori) per fase operasi terakhir
+        metrics_layout = QHBoxLayout()
+        self.metrics_label = QLabel("")
+        self.metrics_label.setStyleSheet("color: gray; font-size: 10px;")
+        self.memory_check = QCheckBox("Ukur memori (tracemalloc)")
+        self.memory_check.setToolTip("Mencatat memori puncak per fase; operasi sedikit lebih lambat.")
+        self.memory_check.toggled.connect(set_memory_tracing)
+        self.export_metrics_btn = QPushButton("Export Metrics")
+        self.export_metrics_btn.clicked.connect(self.on_export_metrics)
+        metrics_layout.addWidget(self.metrics_label, stretch=1)
+        metrics_layout.addWidget(self.memory_check)
+        metrics_layout.addWidget(self.export_metrics_btn)
+        layout.addLayout(metrics_layout)
+
         # Tombol kembali ke menu
         back_layout = QHBoxLayout()
         self.back_btn = QPushButton("Kembali ke Menu Utama")
@@ -160,13 +176,10 @@ class WindowProses(QWidget):
     # PARSING INPUT
     # ====================================================
     def parse_matrix(self, txt):
-        lines = [l.strip() for l in txt.splitlines() if l.strip()]
-        mat = [[float(x) for x in ln.split()] for ln in lines]
-        return np.array(mat, dtype=float)
+        return parse_matrix(txt)
 
     def parse_vector(self, txt):
-        vals = [float(x) for x in txt.split()]
-        return np.array(vals, dtype=float)
+        return parse_vector(txt)
 
 
     # ====================================================
@@ -175,110 +188,122 @@ class WindowProses(QWidget):
     def on_run(self):
         try:
             op = self.op_combo.currentText()
-            out = []
-
-            # --- Ambil matriks A ---
-            if self.comboA.currentIndex() > 0:
-                A = self.stacked.matrices[self.comboA.currentText()]
-            else:
-                txtA = self.textA.toPlainText().strip()
-                A = self.parse_matrix(txtA) if "\n" in txtA else self.parse_vector(txtA)
-
-            # --- Ambil matriks B ---
-            B = None
-            if self.comboB.currentIndex() > 0:
-                B = self.stacked.matrices[self.comboB.currentText()]
-            elif self.textB.toPlainText().strip():
-                txtB = self.textB.toPlainText().strip()
-                B = self.parse_matrix(txtB) if "\n" in txtB else self.parse_vector(txtB)
-
-            # ==== operasi ====
-            if op == "Non-homogen (A·x = B)":
-                res, steps, status = solve_obe(A, B)
-                out.append(f"Status: {status}")
-                out.extend(steps)
-
-            elif op == "Homogen (A·x = 0)":
-                free_vars, basis = solve_homogeneous(A)
-                if not basis:
-                    out.append("Hanya solusi trivial (x=0).")
+            timer = PhaseTimer(op, trace_memory=self.memory_check.isChecked())
+            with timer.phase("parse"):
+                if op in TEXT_OPERATIONS:
+                    # Kotak A berisi ekspresi, mis. "X = inv(A) @ B + Aᵗ @ B"
+                    A, B = self.textA.toPlainText(), None
                 else:
-                    out.append(f"Free vars: {free_vars}")
-                    for i, v in enumerate(basis):
-                        out.append(f"Basis vector {i+1}: {v}")
-
-            elif op == "A + B":
-                out.append("A + B =\n" + cetak_matriks(A + B))
-            elif op == "A - B":
-                out.append("A - B =\n" + cetak_matriks(A - B))
-            elif op == "A × B":
-                out.append("A × B =\n" + cetak_matriks(A @ B))
-            elif op == "B × A":
-                out.append("B × A =\n" + cetak_matriks(B @ A))
-            elif op == "Transpose (Aᵗ)":
-                out.append("Aᵗ =\n" + cetak_matriks(A.T))
-            elif op == "Transpose (Bᵗ)":
-                out.append("Bᵗ =\n" + cetak_matriks(B.T))
-            elif op == "Determinan A":
-                out.append(f"det(A) = {det(A)}")
-            elif op == "Determinan B":
-                out.append(f"det(B) = {det(B)}")
-            elif op == "Inverse A":
-                out.append("A⁻¹ =\n" + cetak_matriks(inverse(A)))
-            elif op == "Inverse B":
-                out.append("B⁻¹ =\n" + cetak_matriks(inverse(B)))
-            elif op == "OBE":
-                R, piv, steps = rref_with_steps(A)
-                out.append("Hasil OBE:\n" + cetak_matriks(R))
-                out.extend(steps)
-            elif op == "Pengenalan Jenis Matriks A":
-                info = self.analyze_matrix(A, "A")
-                out.extend(info)
-            elif op == "Pengenalan Jenis Matriks B":
-                info = self.analyze_matrix(B, "B")
-                out.extend(info)
-            elif op == "Penjumlahan Vektor":
-                out.append(f"A + B = {A + B}")
-            elif op == "Pengurangan Vektor":
-                out.append(f"A - B = {A - B}")
-            elif op == "Dot Product (A·B)":
-                out.append(f"A·B = {np.dot(A, B)}")
-            elif op == "Cross Product (A×B)":
-                out.append(f"A×B = {np.cross(A, B)}")
-            elif op == "Panjang (Norma) Vektor A":
-                out.append(f"‖A‖ = {norm(A):.6f}")
-            elif op == "Panjang (Norma) Vektor B":
-                out.append(f"‖B‖ = {norm(B):.6f}")
-            elif op == "Proyeksi u ke arah v":
-                proj = projection(A, B)
-                out.append(f"Proyeksi A ke arah B = {proj}")
-            elif op == "Sudut antara u dan v":
-                theta = angle_between(A, B)
-                out.append(f"Sudut antara A dan B = {np.degrees(theta):.4f}°")
-
-            self.steps_area.setPlainText("\n".join(out))
-            self.last_steps = out
+                    A, B = self._resolve_inputs()
+
+            # ==== operasi (di thread pool) ====
+            self.start_worker(op, A, B, timer)
 
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
 
+    def _resolve_inputs(self):
+        """Ambil A dan B dari daftar matriks tersimpan atau kotak teks."""
+        # --- Ambil matriks A ---
+        if self.comboA.currentIndex() > 0:
+            A = self.stacked.matrices[self.comboA.currentText()]
+        else:
+            txtA = self.textA.toPlainText().strip()
+            A = self.parse_matrix(txtA) if "\n" in txtA else self.parse_vector(txtA)
+
+        # --- Ambil matriks B ---
+        B = None
+        if self.comboB.currentIndex() > 0:
+            B = self.stacked.matrices[self.comboB.currentText()]
+        elif self.textB.toPlainText().strip():
+            txtB = self.textB.toPlainText().strip()
+            B = self.parse_matrix(txtB) if "\n" in txtB else self.parse_vector(txtB)
+        return A, B
+
+    def start_worker(self, op, A, B, timer=None):
+        """Jalankan operasi di background; tanpa mode antre, run lama dibatalkan."""
+        if not self.queue_check.isChecked():
+            for w in self.workers:
+                w.cancel()
+        worker = OperationWorker(op, A, B, timer, getattr(self.stacked, "matrices", {}),
+                                 cache=result_cache, with_steps=self.steps_check.isChecked())
+        sig = worker.signals
+        sig.started.connect(self._on_worker_started)
+        sig.progress.connect(self._on_worker_progress)
+        sig.partial.connect(self._on_worker_partial)
+        sig.finished.connect(self._on_worker_finished)
+        sig.error.connect(self._on_worker_error)
+        sig.cancelled.connect(self._on_worker_cancelled)
+        self.workers.append(worker)
+        self.cancel_btn.setEnabled(True)
+        self.pool.start(worker)
+
+    def on_cancel(self):
+        for w in self.workers:
+            w.cancel()
+
+    def _sender_worker(self):
+        """Worker pengirim sinyal; None jika sudah dibatalkan (hasilnya diabaikan)."""
+        worker = self.sender().worker
+        return None if worker.is_cancelled() else worker
+
+    def _forget_worker(self, worker):
+        if worker in self.workers:
+            self.workers.remove(worker)
+        if not self.workers:
+            self.cancel_btn.setEnabled(False)
+
+    def _on_worker_started(self):
+        if self._sender_worker() is None:
+            return
+        self.steps_area.clear()
+        self.progress_bar.setRange(0, 0)
+
+    def _on_worker_progress(self, k, n):
+        if self._sender_worker() is None:
+            return
+        self.progress_bar.setRange(0, n)
+        self.progress_bar.setValue(k)
+
+    def _on_worker_partial(self, trace):
+        if self._sender_worker() is None:
+            return
+        self.steps_area.refresh_live(trace)
+
+    def _on_worker_finished(self, out):
+        worker = self.sender().worker
+        self._forget_worker(worker)
+        if worker.is_cancelled():
+            return
+        self.steps_area.set_source(out, worker.timer)
+        self.last_steps = out
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(1)
+        if worker.timer is not None:
+            self.last_metrics = worker.timer.as_dict()
+            metrics_log.add(self.last_metrics)
+            summary = worker.timer.summary()
+            self.metrics_label.setText(summary + (" (dari cache)" if worker.cache_hit else ""))
+
+    def _on_worker_error(self, msg):
+        worker = self.sender().worker
+        self._forget_worker(worker)
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(0)
+        if not worker.is_cancelled():
+            QMessageBox.critical(self, "Error", msg)
+
+    def _on_worker_cancelled(self):
+        self._forget_worker(self.sender().worker)
+        if not self.workers:
+            self.progress_bar.setRange(0, 1)
+            self.progress_bar.setValue(0)
+            self.steps_area.add_note("(Operasi dibatalkan)")
+
 
     def analyze_matrix(self, M, label="A"):
         """Analisis jenis matriks"""
-        info = [f"Jenis Matriks {label}:"]
-        rows, cols = M.shape
-        info.append(f"Ukuran: {rows}×{cols}")
-        if rows == cols:
-            info.append("Persegi")
-            if np.allclose(M, np.eye(rows)): info.append("Identitas")
-            if np.allclose(M, M.T): info.append("Simetris")
-            if np.allclose(M, np.triu(M)): info.append("Segitiga Atas")
-            if np.allclose(M, np.tril(M)): info.append("Segitiga Bawah")
-            if np.count_nonzero(M - np.diag(np.diag(M))) == 0: info.append("Diagonal")
-            info.append("Singular (det=0)" if round(det(M)) == 0 else "Non-Singular (det≠0)")
-        else:
-            info.append("Bukan persegi")
-        return info
+        return analyze_matrix(M, label)
 
 
     # ====================================================
@@ -333,5 +358,19 @@ class WindowProses(QWidget):
         if not self.last_steps:
             QMessageBox.information(self, "No result", "Belum ada hasil yang bisa disimpan ke history.")
             return
-        self.history.add({"operation": self.op_combo.currentText(), "result": self.last_steps[:8]})
+        entry = {"operation": self.op_combo.currentText(), "result": self.last_steps[:8]}
+        if self.last_metrics is not None:
+            entry["metrics"] = self.last_metrics
+        self.history.add(entry)
         QMessageBox.information(self, "Saved", "Hasil disimpan ke history.")
+
+    def on_export_metrics(self):
+        """Export agregat metrik (count, p50, p95 per operasi dan fase) ke JSON."""
+        if not len(metrics_log):
+            QMessageBox.information(self, "No metrics", "Belum ada operasi yang diukur.")
+            return
+        fn, _ = QFileDialog.getSaveFileName(self, "Export Metrics", filter="JSON Files (*.json)")
+        if not fn:
+            return
+        metrics_log.export(fn)
+        QMessageBox.information(self, "Exported", f"Metrik disimpan di {fn}")
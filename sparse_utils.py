@@ -0,0 +1,201 @@
+import heapq
+import numpy as np
+
+from cache_utils import content_hash
+
+# =======================================
+# Penyimpanan sparse (CSR berbasis array)
+# =======================================
+class SparseMatrix:
+    """
+    Matriks sparse format CSR: data, indices (kolom), indptr (awal tiap baris).
+    Memori sebanding dengan jumlah elemen tak nol (nnz), bukan n².
+    """
+    ndim = 2
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.shape = (int(shape[0]), int(shape[1]))
+
+    @classmethod
+    def from_coo(cls, rows, cols, vals, shape):
+        """Bangun dari triplet (baris, kolom, nilai); duplikat dijumlahkan."""
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        vals = np.asarray(vals, dtype=float)
+        n_rows, n_cols = shape
+        if rows.size and (rows.min() < 0 or rows.max() >= n_rows or
+                          cols.min() < 0 or cols.max() >= n_cols):
+            raise ValueError("Indeks elemen sparse di luar ukuran matriks.")
+        key = rows * n_cols + cols
+        uniq, inv = np.unique(key, return_inverse=True)
+        summed = np.bincount(inv, weights=vals, minlength=uniq.size)
+        keep = summed != 0
+        uniq, summed = uniq[keep], summed[keep]
+        r, c = np.divmod(uniq, n_cols)
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(np.bincount(r, minlength=n_rows), out=indptr[1:])
+        return cls(summed, c, indptr, shape)
+
+    @classmethod
+    def from_dense(cls, A, eps=0.0):
+        A = np.asarray(A, dtype=float)
+        if A.ndim == 1:
+            A = A.reshape(1, -1)
+        r, c = np.nonzero(np.abs(A) > eps)
+        return cls.from_coo(r, c, A[r, c], A.shape)
+
+    @property
+    def nnz(self):
+        return int(self.data.size)
+
+    @property
+    def T(self):
+        r, c, v = self.to_coo()
+        return SparseMatrix.from_coo(c, r, v, (self.shape[1], self.shape[0]))
+
+    def row_ids(self):
+        """Indeks baris untuk setiap elemen tersimpan."""
+        return np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+
+    def to_coo(self):
+        return self.row_ids(), self.indices.copy(), self.data.copy()
+
+    def diagonal(self):
+        d = np.zeros(min(self.shape))
+        r = self.row_ids()
+        on_diag = r == self.indices
+        d[r[on_diag]] = self.data[on_diag]
+        return d
+
+    def to_dense(self):
+        M = np.zeros(self.shape)
+        M[self.row_ids(), self.indices] = self.data
+        return M
+
+    def row(self, i):
+        a, b = self.indptr[i], self.indptr[i + 1]
+        return self.indices[a:b], self.data[a:b]
+
+    def content_hash(self):
+        """Hash isi (data, indices, indptr); sama dengan hash di index workspace."""
+        return content_hash(np.concatenate([self.data, self.indices.astype(float),
+                                            self.indptr.astype(float)]))
+
+    def matvec(self, x):
+        """Hitung A·x tanpa membentuk matriks padat (x boleh (m,) atau (m, k))."""
+        x = np.asarray(x, dtype=float)
+        prod = self.data.reshape((-1,) + (1,) * (x.ndim - 1)) * x[self.indices]
+        out = np.zeros((self.shape[0],) + x.shape[1:])
+        np.add.at(out, self.row_ids(), prod)
+        return out
+
+    def __matmul__(self, x):
+        return self.matvec(x)
+
+    def __repr__(self):
+        return f"SparseMatrix(shape={self.shape}, nnz={self.nnz})"
+
+# =======================================
+# Eliminasi sparse dengan pemilihan pivot Markowitz
+# =======================================
+def sparse_eliminate(S, rhs=None, eps=1e-12, threshold=0.1):
+    """
+    Eliminasi Gauss pada matriks sparse sambil membatasi fill-in.
+    Pivot dipilih dari kolom aktif dengan elemen paling sedikit, lalu baris
+    terpendek di kolom itu yang |nilai| >= threshold · max|kolom|.
+
+    Mengembalikan dict:
+      rows   : isi baris setelah eliminasi (list of dict kolom → nilai)
+      pivots : daftar (baris, kolom) sesuai urutan pivot
+      rhs    : ruas kanan yang sudah ikut dieliminasi (atau None)
+      rest   : baris yang tidak menjadi pivot
+      fill   : jumlah elemen baru (fill-in) yang muncul
+    """
+    n_rows, n_cols = S.shape
+    rows = [dict(zip(*map(np.ndarray.tolist, S.row(i)))) for i in range(n_rows)]
+    col_rows = [set() for _ in range(n_cols)]
+    for i, row in enumerate(rows):
+        for j in row:
+            col_rows[j].add(i)
+    if rhs is not None:
+        rhs = np.array(rhs, dtype=float).reshape(n_rows, -1)
+
+    heap = [(len(col_rows[j]), j) for j in range(n_cols) if col_rows[j]]
+    heapq.heapify(heap)
+    done_cols = set()
+    active = set(range(n_rows))
+    pivots = []
+    fill = 0
+
+    def touch(j):
+        if j not in done_cols and col_rows[j]:
+            heapq.heappush(heap, (len(col_rows[j]), j))
+
+    while heap:
+        count, c = heapq.heappop(heap)
+        if c in done_cols or count != len(col_rows[c]):
+            continue  # entri heap kedaluwarsa
+        done_cols.add(c)
+        cand = col_rows[c]
+        biggest = max(abs(rows[i][c]) for i in cand)
+        if biggest < eps:
+            continue  # kolom praktis nol → variabel bebas
+        r = min((i for i in cand if abs(rows[i][c]) >= threshold * biggest),
+                key=lambda i: len(rows[i]))
+        prow = rows[r]
+        piv = prow[c]
+
+        # Baris pivot keluar dari himpunan aktif
+        active.discard(r)
+        for j in prow:
+            col_rows[j].discard(r)
+
+        for q in list(col_rows[c]):
+            target = rows[q]
+            f = target.pop(c) / piv
+            col_rows[c].discard(q)
+            for j, v in prow.items():
+                if j == c:
+                    continue
+                if j in target:
+                    new = target[j] - f * v
+                    if abs(new) <= eps:
+                        del target[j]
+                        col_rows[j].discard(q)
+                    else:
+                        target[j] = new
+                else:
+                    target[j] = -f * v
+                    col_rows[j].add(q)
+                    fill += 1
+            if rhs is not None:
+                rhs[q] -= f * rhs[r]
+        for j in prow:
+            touch(j)
+        pivots.append((r, c))
+
+    return {"rows": rows, "pivots": pivots, "rhs": rhs,
+            "rest": sorted(active), "fill": fill}
+
+def sparse_back_substitute(elim, n_cols, rhs=None, free_values=None):
+    """
+    Substitusi mundur dari hasil sparse_eliminate.
+    rhs: (n_rows, k) ruas kanan tereliminasi; free_values: dict kolom → nilai
+    (vektor panjang k) untuk variabel bebas. Mengembalikan X (n_cols, k).
+    """
+    k = 1 if rhs is None else rhs.shape[1]
+    X = np.zeros((n_cols, k))
+    for j, val in (free_values or {}).items():
+        X[j] = val
+    rows = elim["rows"]
+    for r, c in reversed(elim["pivots"]):
+        row = rows[r]
+        acc = np.zeros(k) if rhs is None else rhs[r].copy()
+        for j, v in row.items():
+            if j != c:
+                acc -= v * X[j]
+        X[c] = acc / row[c]
+    return X
@@ -0,0 +1,186 @@
+import html
+from contextlib import nullcontext
+
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
+    QLineEdit, QSpinBox, QTextBrowser
+)
+from PyQt6.QtCore import QUrl
+
+from matrix_utils import cetak_matriks
+from format_utils import format_matrix, is_elided
+
+
+class StepViewer(QWidget):
+    """
+    Penampil langkah per halaman.
+    Sumber bisa OperationOutput, StepTrace, atau list of str; hanya langkah
+    di halaman aktif yang diputar ulang dan dirender. Matriks besar tampil
+    sebagai pratinjau dan baru diformat penuh saat "tampilkan penuh" diklik.
+    """
+    PAGE_SIZE = 25
+    PREVIEW_THRESHOLD = 64     # elemen; matriks lebih besar tampil diringkas
+    PREVIEW_EDGE = 4
+    PREVIEW_LINES = 12
+    SEARCH_CHUNK = 500
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source = []
+        self._notes = []
+        self._page = 0
+        self._expanded = set()
+        self._highlight = None
+        self._rendered = 0
+        self._build_ui()
+
+    def _build_ui(self):
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        nav = QHBoxLayout()
+        self.prev_btn = QPushButton("◀")
+        self.prev_btn.clicked.connect(lambda: self.show_page(self._page - 1))
+        self.next_btn = QPushButton("▶")
+        self.next_btn.clicked.connect(lambda: self.show_page(self._page + 1))
+        self.page_label = QLabel()
+        self.jump_spin = QSpinBox()
+        self.jump_spin.setMinimum(1)
+        self.jump_spin.setPrefix("Langkah ")
+        self.jump_spin.editingFinished.connect(lambda: self.jump_to(self.jump_spin.value()))
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Cari langkah...")
+        self.search_edit.returnPressed.connect(self.search_next)
+        self.search_btn = QPushButton("Cari")
+        self.search_btn.clicked.connect(self.search_next)
+        for w in (self.prev_btn, self.next_btn, self.page_label, self.jump_spin,
+                  self.search_edit, self.search_btn):
+            nav.addWidget(w)
+        layout.addLayout(nav)
+
+        self.browser = QTextBrowser()
+        self.browser.setOpenLinks(False)
+        self.browser.anchorClicked.connect(self._on_anchor)
+        self.browser.setPlaceholderText("Langkah dan hasil operasi akan tampil di sini...")
+        layout.addWidget(self.browser)
+
+        self.setLayout(layout)
+        self._update_nav()
+
+    # ---------- sumber ----------
+    def clear(self):
+        self.set_source([])
+
+    def set_source(self, source, timer=None):
+        """Ganti sumber langkah dan tampilkan halaman pertama."""
+        self._source = source if source is not None else []
+        self._notes = []
+        self._expanded.clear()
+        self._highlight = None
+        self.show_page(0, timer)
+
+    def refresh_live(self, source):
+        """Sumber yang masih bertambah (trace saat operasi berjalan)."""
+        if source is not self._source:
+            self.set_source(source)
+            return
+        if self._rendered < self.PAGE_SIZE:
+            self.show_page(self._page)
+        else:
+            self._update_nav()
+
+    def add_note(self, text):
+        """Catatan di bawah halaman (mis. operasi dibatalkan)."""
+        self._notes.append(text)
+        self.show_page(self._page)
+
+    def _count(self):
+        return len(self._source)
+
+    def _entries(self, start, stop, copy=True):
+        if hasattr(self._source, "snapshots"):
+            return self._source.snapshots(start, stop, copy)
+        return [(t, None) for t in self._source[start:stop]]
+
+    # ---------- navigasi ----------
+    def _n_pages(self):
+        return max(1, -(-self._count() // self.PAGE_SIZE))
+
+    def _update_nav(self):
+        n = self._count()
+        start = self._page * self.PAGE_SIZE
+        stop = min(start + self.PAGE_SIZE, n)
+        self.page_label.setText(f"{start + 1 if n else 0}–{stop} dari {n}")
+        self.prev_btn.setEnabled(self._page > 0)
+        self.next_btn.setEnabled(self._page < self._n_pages() - 1)
+        self.jump_spin.setMaximum(max(n, 1))
+
+    def show_page(self, page, timer=None):
+        """timer (PhaseTimer, opsional) mengukur fase "format" dan "render"."""
+        phase = timer.phase if timer is not None else (lambda name: nullcontext())
+        self._page = max(0, min(page, self._n_pages() - 1))
+        start = self._page * self.PAGE_SIZE
+        with phase("format"):
+            entries = self._entries(start, start + self.PAGE_SIZE)
+            parts = [self._render_entry(start + k, text, M) for k, (text, M) in enumerate(entries)]
+            parts.extend(f"<pre>{html.escape(t)}</pre>" for t in self._notes)
+        with phase("render"):
+            self.browser.setHtml("".join(parts))
+        self._rendered = len(entries)
+        self._update_nav()
+        if self._highlight is not None:
+            self.browser.scrollToAnchor(f"step{self._highlight}")
+
+    def jump_to(self, step):
+        """Tampilkan halaman yang memuat langkah ke-step (mulai 1)."""
+        if not self._count():
+            return
+        i = max(0, min(step - 1, self._count() - 1))
+        self._highlight = i
+        self.show_page(i // self.PAGE_SIZE)
+
+    def search_next(self):
+        """Cari teks (judul langkah / baris output) mulai setelah sorotan terakhir."""
+        needle = self.search_edit.text().strip().lower()
+        n = self._count()
+        if not needle or not n:
+            return
+        first = (self._highlight + 1) if self._highlight is not None else self._page * self.PAGE_SIZE
+        for base in list(range(first, n, self.SEARCH_CHUNK)) + list(range(0, first, self.SEARCH_CHUNK)):
+            stop = min(base + self.SEARCH_CHUNK, n if base >= first else first)
+            for k, (text, _) in enumerate(self._entries(base, stop, copy=False)):
+                if needle in text.lower():
+                    self.jump_to(base + k + 1)
+                    return
+        self.page_label.setText(f"“{self.search_edit.text()}” tidak ditemukan")
+
+    # ---------- render ----------
+    def _render_entry(self, i, text, M):
+        expanded = i in self._expanded
+        if M is not None:
+            header = text.lstrip("\n")
+            elided = is_elided(M, self.PREVIEW_THRESHOLD, self.PREVIEW_EDGE)
+            if expanded:
+                body = cetak_matriks(M)
+            else:
+                body = format_matrix(M, threshold=self.PREVIEW_THRESHOLD, edgeitems=self.PREVIEW_EDGE)
+            body = f"{header}\n{body}"
+        else:
+            lines = text.split("\n")
+            elided = len(lines) > self.PREVIEW_LINES
+            body = text if expanded or not elided else "\n".join(lines[:self.PREVIEW_LINES]) + "\n…"
+        style = ' style="background:#fff6c8"' if i == self._highlight else ""
+        out = f'<a name="step{i}"></a><div{style}><b>[{i + 1}]</b><pre>{html.escape(body)}</pre>'
+        if elided:
+            label = "ringkas" if expanded else "tampilkan penuh"
+            out += f'<a href="toggle:{i}">{label}</a>'
+        return out + "</div>"
+
+    def _on_anchor(self, url: QUrl):
+        kind, _, idx = url.toString().partition(":")
+        if kind != "toggle":
+            return
+        i = int(idx)
+        self._expanded.symmetric_difference_update({i})
+        self._highlight = i
+        self.show_page(self._page)
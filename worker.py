@@ -0,0 +1,91 @@
+import threading
+import time
+from contextlib import nullcontext
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, pyqtSlot
+
+from operations import run_operation, OperationCancelled, TEXT_OPERATIONS
+
+
+class WorkerSignals(QObject):
+    """Sinyal dari OperationWorker ke thread GUI."""
+    started = pyqtSignal()
+    progress = pyqtSignal(int, int)     # pivot ke-k dari n
+    partial = pyqtSignal(object)        # StepTrace yang sedang bertambah (dirender oleh GUI)
+    finished = pyqtSignal(object)       # OperationOutput lengkap
+    error = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, worker):
+        super().__init__()
+        self.worker = worker
+
+
+class OperationWorker(QRunnable):
+    """
+    Menjalankan run_operation di QThreadPool.
+    Progress dan jejak langkah parsial dikirim lewat sinyal; worker tidak merender
+    teks langkah (itu tugas StepViewer, per halaman). cancel() menghentikan
+    operasi pada pivot berikutnya.
+    Jika cache (ResultCache) diberikan, hasil untuk input yang sama diambil
+    dari cache tanpa menghitung ulang (cache_hit = True).
+    """
+    # Jeda minimum antar kiriman langkah parsial supaya GUI tidak kebanjiran
+    PARTIAL_INTERVAL = 0.1
+
+    def __init__(self, op, A, B=None, timer=None, matrices=None, cache=None, with_steps=True):
+        super().__init__()
+        self.op, self.A, self.B = op, A, B
+        self.with_steps = with_steps
+        self.matrices = matrices    # matriks bernama (untuk operasi ekspresi)
+        self.timer = timer      # PhaseTimer (opsional): fase "solve" diukur di sini
+        self.cache = cache if op not in TEXT_OPERATIONS else None
+        self.cache_hit = False
+        self.signals = WorkerSignals(self)
+        self._cancel = threading.Event()
+        self._last_partial = 0.0
+
+    def cancel(self):
+        self._cancel.set()
+
+    def is_cancelled(self):
+        return self._cancel.is_set()
+
+    def _progress(self, k, n, steps):
+        if self._cancel.is_set():
+            raise OperationCancelled()
+        self.signals.progress.emit(k, n)
+        now = time.monotonic()
+        if steps is not None and (k == n or now - self._last_partial >= self.PARTIAL_INTERVAL):
+            self._last_partial = now
+            self.signals.partial.emit(steps)
+
+    @pyqtSlot()
+    def run(self):
+        if self._cancel.is_set():
+            self.signals.cancelled.emit()
+            return
+        self.signals.started.emit()
+        try:
+            out = key = None
+            if self.cache is not None:
+                with self.timer.phase("cache") if self.timer else nullcontext():
+                    key = self.cache.make_key(self.op, self.A, self.B, with_steps=self.with_steps)
+                    out = self.cache.get(key)
+                self.cache_hit = out is not None
+            if out is None:
+                with self.timer.phase("solve") if self.timer else nullcontext():
+                    out = run_operation(self.op, self.A, self.B, with_steps=self.with_steps,
+                                        progress=self._progress, matrices=self.matrices)
+                if key is not None and not self._cancel.is_set():
+                    self.cache.put(key, out)
+        except OperationCancelled:
+            self.signals.cancelled.emit()
+            return
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        if self._cancel.is_set():
+            self.signals.cancelled.emit()
+        else:
+            self.signals.finished.emit(out)
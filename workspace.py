@@ -0,0 +1,181 @@
+import hashlib
+import json
+import os
+import shutil
+from collections.abc import MutableMapping
+
+import numpy as np
+
+from cache_utils import content_hash
+from sparse_utils import SparseMatrix
+
+
+def _file_stem(name):
+    """
+    Nama file aman untuk matriks. Selalu diberi hash pendek dari nama persisnya
+    agar "A" dan "a" tidak bertabrakan di filesystem yang tidak peka huruf besar/kecil.
+    """
+    digest = hashlib.blake2b(name.encode("utf-8"), digest_size=4).hexdigest()
+    return f"{name if name.isidentifier() else 'm'}_{digest}"
+
+def _npy_source(arr):
+    """
+    Path file .npy jika arr adalah memory-map utuh atas file itu (hasil
+    np.load(..., mmap_mode=...)), selain itu None. File seperti ini cukup
+    disalin apa adanya, tanpa membaca isinya lewat Python.
+    """
+    filename = getattr(arr, "filename", None)
+    if not isinstance(arr, np.memmap) or not filename or not filename.endswith(".npy"):
+        return None
+    try:
+        with open(filename, "rb") as f:
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+            header_end = f.tell()
+    except (OSError, ValueError):
+        return None
+    contiguous = arr.flags.f_contiguous if fortran else arr.flags.c_contiguous
+    if (shape != arr.shape or dtype != arr.dtype or not contiguous
+            or arr.offset != header_end):
+        return None
+    return filename
+
+def _remove_file(path):
+    """
+    Hapus file jika ada. Di Windows file yang masih di-memory-map (mis. array
+    lama yang masih dipegang view) tidak bisa dihapus; file itu dibiarkan dan
+    dibersihkan saat workspace dibuka berikutnya.
+    """
+    try:
+        os.remove(path)
+    except (FileNotFoundError, PermissionError):
+        pass
+
+
+class Workspace(MutableMapping):
+    """
+    Penyimpanan matriks bernama di disk.
+    index.json mencatat nama, shape, dtype, hash, dan file tiap matriks;
+    isi matriks (.npy) baru dibuka ketika diakses, memakai memory-map.
+    Biaya membuka workspace hanya sebesar index, bukan total ukuran matriks.
+    Bisa dipakai seperti dict (stacked.matrices).
+
+    Tiap versi matriks ditulis ke file baru (nama + hash isi), bukan menimpa
+    file lama, karena file .npy lama mungkin masih di-memory-map: di Windows
+    os.replace / os.remove atas file yang sedang di-map akan gagal.
+    """
+    INDEX = "index.json"
+
+    def __init__(self, root="workspace", mmap_mode="r"):
+        self.root = root
+        self.mmap_mode = mmap_mode
+        os.makedirs(root, exist_ok=True)
+        self._index = {}
+        index_path = os.path.join(root, self.INDEX)
+        if os.path.exists(index_path):
+            with open(index_path, "r") as f:
+                self._index = json.load(f)
+        self._loaded = {}
+        self._sweep()
+        self._listeners = []
+
+    # ---------- notifikasi ----------
+    def subscribe(self, callback):
+        """callback(name, old_hash, new_hash) dipanggil saat matriks ditulis / dihapus."""
+        self._listeners.append(callback)
+
+    def _notify(self, name, old_hash, new_hash):
+        for cb in list(self._listeners):
+            cb(name, old_hash, new_hash)
+
+    # ---------- index ----------
+    def _save_index(self):
+        path = os.path.join(self.root, self.INDEX)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self._index, f, indent=2)
+        os.replace(tmp, path)
+
+    def _sweep(self):
+        """Hapus file matriks yang tidak lagi tercatat di index (versi lama, sisa .tmp)."""
+        used = {entry["file"] for entry in self._index.values()}
+        for fn in os.listdir(self.root):
+            if fn.endswith((".npy", ".npz")) and fn not in used:
+                _remove_file(os.path.join(self.root, fn))
+
+    def info(self, name):
+        """Metadata matriks (shape, dtype, hash, file) tanpa memuat datanya."""
+        return dict(self._index[name])
+
+    def content_hash(self, name):
+        return self._index[name]["hash"]
+
+    # ---------- akses dict ----------
+    def __getitem__(self, name):
+        if name in self._loaded:
+            return self._loaded[name]
+        entry = self._index[name]
+        path = os.path.join(self.root, entry["file"])
+        if entry.get("kind") == "sparse":
+            with np.load(path) as z:
+                value = SparseMatrix(z["data"], z["indices"], z["indptr"], tuple(entry["shape"]))
+        else:
+            value = np.load(path, mmap_mode=self.mmap_mode)
+        self._loaded[name] = value
+        return value
+
+    def __setitem__(self, name, mat):
+        old = self._index.get(name, {})
+        old_hash = old.get("hash")
+        # Lepas memmap lama milik workspace sebelum file-nya diganti / dihapus
+        self._loaded.pop(name, None)
+        if isinstance(mat, SparseMatrix):
+            new_hash = mat.content_hash()
+            fn = f"{_file_stem(name)}_{new_hash[:8]}.sparse.npz"
+            entry = {"file": fn, "kind": "sparse", "shape": list(mat.shape),
+                     "dtype": str(mat.data.dtype), "hash": new_hash}
+        else:
+            arr = np.asarray(mat)
+            new_hash = content_hash(arr)
+            fn = f"{_file_stem(name)}_{new_hash[:8]}.npy"
+            entry = {"file": fn, "kind": "dense", "shape": list(arr.shape),
+                     "dtype": str(arr.dtype), "hash": new_hash}
+        path = os.path.join(self.root, fn)
+        if old_hash == new_hash and old.get("file") == fn and os.path.exists(path):
+            return      # isi sama: file yang ada (mungkin sedang di-map) dipakai apa adanya
+        if isinstance(mat, SparseMatrix):
+            tmp = path + ".tmp.npz"
+            np.savez(tmp, data=mat.data, indices=mat.indices, indptr=mat.indptr)
+        else:
+            tmp = path + ".tmp.npy"
+            src = _npy_source(mat)
+            if src is not None:
+                # Import .npy ber-memmap: salin file-nya, isi tidak dibaca ke memori
+                shutil.copyfile(src, tmp)
+            else:
+                np.save(tmp, arr)
+        os.replace(tmp, path)
+        self._index[name] = entry
+        self._save_index()
+        if old.get("file") and old["file"] != fn:
+            _remove_file(os.path.join(self.root, old["file"]))
+        self._notify(name, old_hash, new_hash)
+
+    def __delitem__(self, name):
+        entry = self._index.pop(name)
+        self._loaded.pop(name, None)
+        self._save_index()
+        _remove_file(os.path.join(self.root, entry["file"]))
+        self._notify(name, entry["hash"], None)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __iter__(self):
+        return iter(list(self._index))
+
+    def __len__(self):
+        return len(self._index)